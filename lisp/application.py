@@ -25,6 +25,7 @@ from lisp import layout, __version__ as lisp_version
 from lisp.command.stack import CommandsStack
 from lisp.core.configuration import Configuration, DummyConfiguration
 from lisp.core.session import Session
+from lisp.core.session_loader import SessionLoader
 from lisp.core.signal import Signal
 from lisp.core.singleton import Singleton
 from lisp.core.util import filter_live_properties
@@ -60,6 +61,7 @@ class Application(metaclass=Singleton):
         self.__cue_factory = CueFactory(self)
         self.__cue_model = CueModel()
         self.__session = None
+        self.__session_loader = None
         self.__commands_stack = CommandsStack()
         self.__main_window = MainWindow(self)
 
@@ -136,6 +138,7 @@ class Application(metaclass=Singleton):
                 self.__new_session_dialog()
 
     def finalize(self):
+        self.__cancel_loading()
         self.__delete_session()
 
         self.__cue_model = None
@@ -151,6 +154,7 @@ class Application(metaclass=Singleton):
                 if dialog.sessionPath:
                     self.__load_from_file(dialog.sessionPath)
                 else:
+                    self.__cancel_loading()
                     self.__new_session(dialog.selected())
             else:
                 if self.__session is None:
@@ -178,6 +182,16 @@ class Application(metaclass=Singleton):
 
     def __save_to_file(self, session_file):
         """Save the current session into a file."""
+        if self.__session_loader is not None:
+            # Only part of the cues are loaded, the file would be truncated
+            logger.warning(
+                translate(
+                    "ApplicationError",
+                    "Cannot save the session while it is loading",
+                )
+            )
+            return
+
         self.session.session_file = session_file
 
         # Get session settings
@@ -232,43 +246,42 @@ class Application(metaclass=Singleton):
             self.window.updateWindowTitle()
 
     def __load_from_file(self, session_file):
-        """Load a saved session from file"""
-        try:
-            with open(session_file, mode="r", encoding="utf-8") as file:
-                session_dict = json.load(file)
+        """Load a saved session from file, see `SessionLoader`"""
+        self.__cancel_loading()
 
-            # New session
-            self.__new_session(
-                layout.get_layout(session_dict["session"]["layout_type"])
-            )
-            self.session.update_properties(session_dict["session"])
-            self.session.session_file = abspath(session_file)
-
-            # Load cues
-            for cues_dict in session_dict.get("cues", {}):
-                cue_type = cues_dict.pop("_type_", "Undefined")
-                cue_id = cues_dict.pop("id")
-                try:
-                    cue = self.cue_factory.create_cue(cue_type, cue_id=cue_id)
-                    cue.update_properties(cues_dict)
-                    self.cue_model.add(cue)
-                except Exception:
-                    name = cues_dict.get("name", "No name")
-                    logger.exception(
-                        translate(
-                            "ApplicationError",
-                            'Unable to create the cue "{}"',
-                        ).format(name)
-                    )
+        self.__session_loader = SessionLoader(
+            self, session_file, self.__loaded_session_properties
+        )
+        self.__session_loader.progress.connect(
+            self.__main_window.updateLoadingProgress
+        )
+        self.__session_loader.finished.connect(self.__loading_finished)
+        self.__session_loader.failed.connect(self.__loading_failed)
+        self.__session_loader.start()
 
-            self.commands_stack.set_saved()
+    def __loaded_session_properties(self, session_properties):
+        """Create the new session, before any cue is loaded"""
+        self.__new_session(layout.get_layout(session_properties["layout_type"]))
+        self.session.update_properties(session_properties)
+        self.session.session_file = abspath(self.__session_loader.session_file)
 
-            self.session_loaded.emit(self.session)
-        except Exception:
-            logger.exception(
-                translate(
-                    "ApplicationError",
-                    'Error while reading the session file "{}"',
-                ).format(session_file)
-            )
-            self.__new_session_dialog()
+        # Cues are added to the model without using commands
+        self.commands_stack.set_saved()
+
+    def __loading_finished(self, times):
+        self.__session_loader = None
+        self.__main_window.hideLoadingProgress()
+
+        self.session_loaded.emit(self.session)
+
+    def __loading_failed(self):
+        self.__session_loader = None
+        self.__main_window.hideLoadingProgress()
+
+        self.__new_session_dialog()
+
+    def __cancel_loading(self):
+        if self.__session_loader is not None:
+            self.__session_loader.cancel()
+            self.__session_loader = None
+            self.__main_window.hideLoadingProgress()
@@ -55,6 +55,17 @@ class Backend(metaclass=ABCMeta):
         """Return a Waveform object capable of loading the waveform of the given media."""
         return self.uri_waveform(media.input_uri(), media.duration)
 
+    def synchronize_start(self, medias) -> list:
+        """Pre-roll the given media, so that their next `play` start together.
+
+        The media must be played shortly after, the synchronization of a
+        media is cancelled when stopped. By default no media is synchronized.
+
+        :param medias: the media to be synchronized
+        :return: the synchronized media
+        """
+        return []
+
     @abstractmethod
     def uri_waveform(self, uri: SessionURI, duration=None) -> Waveform:
         """Return a Waveform object capable of loading the waveform of the given uri."""
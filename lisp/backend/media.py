@@ -98,6 +98,41 @@ class Media(HasProperties):
     def input_uri(self) -> Union[SessionURI, type(None)]:
         """Return the media SessionURI, or None."""
 
+    def prepare(self):
+        """Allocate the resources needed for the playback, if not ready.
+
+        Media can defer the allocation of their resources (e.g. a pipeline)
+        until needed, calling this function avoids the delay on playback.
+        By default it does nothing.
+        """
+
+    def release(self) -> bool:
+        """Release the resources allocated by `prepare`, if possible.
+
+        The media properties are kept. By default it does nothing.
+
+        :return: False if the resources cannot be released (e.g. playing)
+        """
+        return False
+
+    def arm(self) -> bool:
+        """Pre-roll the media at its start position, ready to be played.
+
+        Playing an armed media only needs to resume the playback, avoiding
+        most of the startup latency. An armed media is in PAUSED state, but
+        without being started (no signal is emitted). By default it does
+        nothing.
+
+        :return: True if the media is armed
+        """
+        return False
+
+    def disarm(self):
+        """Release the pre-rolled data of an armed media, if any.
+
+        By default it does nothing.
+        """
+
     @abstractmethod
     def pause(self):
         """The media go in PAUSED state (pause the playback)."""
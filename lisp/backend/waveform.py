@@ -16,34 +16,98 @@
 # along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
 
 import logging
-import pickle
 from abc import ABCMeta, abstractmethod
-from os import path, makedirs
+from heapq import heappop, heappush
+from itertools import count
+from math import ceil
+from os import path, makedirs, remove
+from threading import BoundedSemaphore, Lock, Timer
 
 from lisp import DEFAULT_CACHE_DIR
+from lisp.backend import waveform_cache
+from lisp.backend.waveform_cache import WaveformCacheError
+from lisp.backend.waveform_pyramid import WaveformPyramid
+from lisp.core.executor import PriorityExecutor, TaskPriority
 from lisp.core.session_uri import SessionURI
 from lisp.core.signal import Signal
 from lisp.core.util import file_hash
 
 logger = logging.getLogger(__name__)
 
+# Pool loading the waveforms, the workers read the cache files and start
+# the decoding, which is then performed in background (e.g. by a pipeline)
+WaveformExecutor = PriorityExecutor(max_workers=2, name="WaveformExecutor")
+
+
+class DecodingSlots:
+    """Limit the number of waveforms decoded at the same time.
+
+    When no slot is free, the waveforms wait, by priority, without holding
+    an executor worker, when a slot is released it's passed to the first
+    waiting waveform, which is started by a `WaveformExecutor` worker.
+    """
+
+    def __init__(self, slots):
+        self._slots = BoundedSemaphore(slots)
+        self._lock = Lock()
+        # Heap of (priority, sequence, start) waiting for a slot
+        self._waiting = []
+        self._counter = count()
+
+    def acquire(self, start, priority):
+        """Take a slot, if none is free `start` is called once one is.
+
+        :return: True if the slot has been taken
+        """
+        with self._lock:
+            if self._slots.acquire(blocking=False):
+                return True
+
+            heappush(self._waiting, (priority, next(self._counter), start))
+            return False
+
+    def release(self):
+        with self._lock:
+            if not self._waiting:
+                self._slots.release()
+                return
+
+            priority, _, start = heappop(self._waiting)
+
+        WaveformExecutor.submit(start, priority=priority)
+
+
+# At most 2 files are decoded at the same time
+WaveformDecodingSlots = DecodingSlots(2)
+
 
 class Waveform(metaclass=ABCMeta):
-    CACHE_VERSION = "1"
+    CACHE_VERSION = "2"
+    # Versions of the (pickle-based) cache files to migrate, if they have
+    # the current resolution, or to remove
+    LEGACY_CACHE_VERSIONS = ("1",)
     CACHE_DIR_NAME = "waveforms"
-    MAX_DECIMALS = 5
+    # Max time (seconds) to decode a waveform, then the decoding is cancelled
+    LOAD_TIMEOUT = 120
 
     def __init__(
         self,
         uri: SessionURI,
         duration,
-        max_samples=2560,
+        sample_length=10,
+        max_samples=2**19,
         enable_cache=True,
         cache_dir=None,
     ):
+        """
+        :param sample_length: duration (ms) of each peak/rms sample
+        :param max_samples: max number of samples, for longer media the
+                            `sample_length` is increased
+        """
         if not cache_dir:
             cache_dir = DEFAULT_CACHE_DIR
 
+        self.sample_length = sample_length
         self.max_samples = max_samples
         self.duration = duration
 
@@ -58,6 +122,19 @@ class Waveform(metaclass=ABCMeta):
         self.ready = Signal()
         self.failed = Signal()
 
+        self.__lock = Lock()
+        self.__loading = False
+        # Priority of the pending load task, if any
+        self.__queued = None
+        self.__pyramid = None
+        # True while holding a decoding slot (see `WaveformDecodingSlots`)
+        self.__decoding = False
+        # Cancel the decoding after `LOAD_TIMEOUT`
+        self.__watchdog = None
+
+        self.ready.connect(self.__finished)
+        self.failed.connect(self.__finished)
+
     def cache_path(self, refresh=True):
         """Return the path of the file used to cache the waveform.
 
@@ -67,39 +144,137 @@ class Waveform(metaclass=ABCMeta):
         if not self._uri.is_local:
             return ""
 
-        file_path = self._uri.absolute_path
         if not self._hash or refresh:
-            self._hash = file_hash(
-                file_path,
-                digest_size=16,
-                person=self.CACHE_VERSION.encode(),
-            )
+            self._hash = self.__file_hash(self.CACHE_VERSION)
+
+        return self.__cache_file(self._hash)
+
+    def __file_hash(self, version):
+        return file_hash(
+            self._uri.absolute_path, digest_size=16, person=version.encode()
+        )
 
+    def __cache_file(self, file_hash):
         return path.join(
-            path.dirname(file_path),
+            path.dirname(self._uri.absolute_path),
             self._cache_dir,
-            self._hash + ".waveform",
+            file_hash + ".waveform",
         )
 
-    def load_waveform(self):
-        """Load the waveform.
+    def samples_count(self):
+        """Return the number of peak/rms samples to compute."""
+        return max(
+            1, min(ceil(self.duration / self.sample_length), self.max_samples)
+        )
+
+    def load_waveform(self, priority=TaskPriority.Low):
+        """Load the waveform, in background (see `WaveformExecutor`).
 
         If the waveform is ready returns True, False otherwise, in that case
         the "ready" signal will be emitted when the processing is complete.
+        Calling this function again, with a higher priority (e.g. when the
+        waveform is shown), moves the loading ahead of the others.
         """
-        if self.is_ready() or self._from_cache():
-            # The waveform has already been loaded, or is in cache
-            return True
-        else:
-            # Delegate the actual work to concrete subclasses
-            return self._load_waveform()
+        with self.__lock:
+            if self.is_ready():
+                return True
+            if self.__loading or (
+                self.__queued is not None and self.__queued <= priority
+            ):
+                return False
+
+            self.__queued = priority
+
+        WaveformExecutor.submit(self.__load, priority=priority)
+        return False
+
+    def samples(self, width, start=0, stop=None):
+        """Return the (peak, rms) values to draw the waveform in `width` px.
+
+        The values are taken from a multi-resolution pyramid, built once, so
+        that any window (`start`/`stop` in milliseconds) can be drawn, at
+        any zoom, without processing the media again.
+        See `WaveformPyramid.query`.
+        """
+        return self.__get_pyramid().query(width, start, stop)
 
     def is_ready(self):
-        return bool(self.peak_samples and self.rms_samples)
+        return len(self.peak_samples) > 0 and len(self.rms_samples) > 0
 
     def clear(self):
         self.rms_samples = []
         self.peak_samples = []
+        self.__pyramid = None
+
+    def __load(self):
+        with self.__lock:
+            if self.__loading or self.is_ready():
+                return
+
+            priority = self.__queued
+            if priority is None:
+                priority = TaskPriority.Low
+
+            self.__loading = True
+            self.__queued = None
+
+        self.__pyramid = None
+
+        try:
+            from_cache = self._from_cache()
+        except Exception:
+            self.__finished()
+            raise
+
+        if from_cache:
+            self.ready.emit()
+        elif WaveformDecodingSlots.acquire(self.__decode, priority):
+            self.__decode()
+
+    def __decode(self):
+        """Start the decoding, a slot must be already taken.
+
+        The worker is not blocked, the slot is released when the waveform
+        is ready, or failed (see `__finished`).
+        """
+        with self.__lock:
+            self.__decoding = True
+            self.__watchdog = Timer(self.LOAD_TIMEOUT, self.__timeout)
+            self.__watchdog.daemon = True
+            self.__watchdog.start()
+
+        try:
+            if self._load_waveform():
+                self.__finished()
+        except Exception:
+            self.__finished()
+            raise
+
+    def __timeout(self):
+        with self.__lock:
+            if not self.__decoding:
+                return
+
+        logger.warning(
+            f"Waveform not ready after {self.LOAD_TIMEOUT}s, cancelled: "
+            f"{self._uri.unquoted_uri}"
+        )
+
+        self.clear()
+        self.failed.emit()
+
+    def __finished(self):
+        with self.__lock:
+            self.__loading = False
+            decoding = self.__decoding
+            watchdog = self.__watchdog
+            self.__decoding = False
+            self.__watchdog = None
+
+        if watchdog is not None:
+            watchdog.cancel()
+        if decoding:
+            WaveformDecodingSlots.release()
 
     @abstractmethod
     def _load_waveform(self):
@@ -111,25 +286,87 @@ class Waveform(metaclass=ABCMeta):
         """
 
     def _from_cache(self):
-        """Retrieve data from a cache file, if caching is enabled."""
+        """Retrieve data from a cache file, if caching is enabled.
+
+        The file is memory-mapped, the samples are read only when used.
+        Legacy (pickle) files are converted the first time.
+        """
         try:
-            cache_path = self.cache_path()
-            if self._enable_cache and path.exists(cache_path):
-                with open(cache_path, "rb") as cache_file:
-                    cache_data = pickle.load(cache_file)
-                    if len(cache_data) >= 2:
-                        self.peak_samples = cache_data[0]
-                        self.rms_samples = cache_data[1]
-
-                        logger.debug(
-                            f"Loaded waveform from the cache: {cache_path}"
-                        )
-                        return True
+            cache_path = self.cache_path() if self._enable_cache else ""
+            if not cache_path:
+                return False
+
+            try:
+                pyramid = waveform_cache.load(cache_path)
+            except FileNotFoundError:
+                pyramid = self.__migrate(
+                    cache_path,
+                    [
+                        self.__cache_file(self.__file_hash(version))
+                        for version in self.LEGACY_CACHE_VERSIONS
+                    ],
+                )
+            except WaveformCacheError:
+                # Written in a previous format, at the same path
+                pyramid = self.__migrate(cache_path, [cache_path])
+
+            if pyramid is not None:
+                self.__pyramid = pyramid
+                self.peak_samples, self.rms_samples = pyramid.level(0)
+
+                logger.debug(f"Loaded waveform from the cache: {cache_path}")
+                return True
         except Exception:
-            pass
+            logger.debug("Cannot load waveform from the cache", exc_info=True)
 
         return False
 
+    def __migrate(self, cache_path, legacy_paths):
+        """Convert the first legacy file found, return the loaded pyramid.
+
+        Only files with the expected resolution (see `samples_count`) are
+        converted, the others (e.g. version 1, with fewer samples) are
+        removed, so that the waveform is processed again.
+        """
+        for legacy_path in legacy_paths:
+            if not path.exists(legacy_path):
+                continue
+
+            try:
+                peak_samples, rms_samples = waveform_cache.load_legacy(
+                    legacy_path
+                )
+            except WaveformCacheError:
+                continue
+
+            if len(peak_samples) != self.samples_count():
+                if legacy_path != cache_path:
+                    remove(legacy_path)
+
+                logger.debug(
+                    f"Discarded low-resolution waveform: {legacy_path}"
+                )
+                continue
+
+            waveform_cache.dump(
+                cache_path,
+                WaveformPyramid(peak_samples, rms_samples, self.duration),
+            )
+            if legacy_path != cache_path:
+                remove(legacy_path)
+
+            logger.debug(f"Converted waveform cache: {legacy_path}")
+            return waveform_cache.load(cache_path)
+
+    def __get_pyramid(self):
+        pyramid = self.__pyramid
+        if pyramid is None:
+            pyramid = self.__pyramid = WaveformPyramid(
+                self.peak_samples, self.rms_samples, self.duration
+            )
+
+        return pyramid
+
     def _to_cache(self):
         """Dump the waveform data to a file, if caching is enabled."""
         if self._enable_cache:
@@ -139,13 +376,6 @@ class Waveform(metaclass=ABCMeta):
                 if not path.exists(cache_dir):
                     makedirs(cache_dir, exist_ok=True)
 
-                with open(cache_path, "wb") as cache_file:
-                    pickle.dump(
-                        (
-                            self.peak_samples,
-                            self.rms_samples,
-                        ),
-                        cache_file,
-                    )
+                waveform_cache.dump(cache_path, self.__get_pyramid())
 
                 logger.debug(f"Dumped waveform to the cache: {cache_path}")
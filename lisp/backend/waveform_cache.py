@@ -0,0 +1,180 @@
+# This file is part of Linux Show Player
+#
+# Copyright 2026 Francesco Ceruti <ceppofrancy@gmail.com>
+#
+# Linux Show Player is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Linux Show Player is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Binary, memory-mapped, cache files for waveforms.
+
+A file contains all the levels of a `WaveformPyramid`, little-endian:
+
+* header: magic, format version, number of levels, sample rate (of the
+  first level, in samples per second), duration (milliseconds)
+* the number of samples of each level (uint32)
+* for each level, the peak values followed by the RMS ones (float16)
+
+Files are read via `numpy.memmap`, the levels are views of the mapped
+buffer, only the parts actually used (e.g. drawn) are read from the disk.
+"""
+
+import os
+import pickle
+import tempfile
+
+import numpy as np
+
+from lisp.backend.waveform_pyramid import WaveformPyramid
+
+MAGIC = b"LSPWAVE\0"
+VERSION = 1
+
+_HEADER = np.dtype(
+    [
+        ("magic", "S8"),
+        ("version", "<u2"),
+        ("levels", "<u2"),
+        ("sample_rate", "<f8"),
+        ("duration", "<u8"),
+    ]
+)
+_COUNT = np.dtype("<u4")
+_SAMPLE = np.dtype("<f2")
+
+
+class WaveformCacheError(Exception):
+    """The file is not a (supported) waveform cache file."""
+
+
+def dump(path, pyramid):
+    """Write the levels of the given pyramid to `path`.
+
+    The file is replaced atomically, so that the files already mapped (by
+    `load`) are not affected.
+
+    :type pyramid: WaveformPyramid
+    """
+    levels = [pyramid.level(index) for index in range(pyramid.levels())]
+    counts = np.array([len(peak) for peak, _ in levels], dtype=_COUNT)
+
+    header = np.zeros(1, dtype=_HEADER)
+    header["magic"] = MAGIC
+    header["version"] = VERSION
+    header["levels"] = len(levels)
+    header["sample_rate"] = (
+        counts[0] * 1000 / pyramid.duration if pyramid.duration else 0
+    )
+    header["duration"] = pyramid.duration
+
+    directory = os.path.dirname(path)
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(header.tobytes())
+            file.write(counts.tobytes())
+            for peak, rms in levels:
+                file.write(np.asarray(peak, dtype=_SAMPLE).tobytes())
+                file.write(np.asarray(rms, dtype=_SAMPLE).tobytes())
+
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def load(path):
+    """Map the given file, return a `WaveformPyramid` backed by it.
+
+    :raise FileNotFoundError: if the file does not exist
+    :raise WaveformCacheError: if the file is not in the expected format
+    :rtype: WaveformPyramid
+    """
+    try:
+        buffer = np.memmap(path, dtype=np.uint8, mode="r")
+    except ValueError:
+        # Empty file
+        raise WaveformCacheError(f"Empty file: {path}")
+
+    if buffer.size < _HEADER.itemsize:
+        raise WaveformCacheError(f"Truncated file: {path}")
+
+    header = buffer[: _HEADER.itemsize].view(_HEADER)[0]
+    # Compare the raw bytes, numpy strips the trailing NULs of strings
+    if bytes(buffer[: len(MAGIC)]) != MAGIC:
+        raise WaveformCacheError(f"Not a waveform cache file: {path}")
+    if header["version"] != VERSION:
+        raise WaveformCacheError(
+            f"Unsupported version ({header['version']}): {path}"
+        )
+
+    offset = _HEADER.itemsize
+    end = offset + int(header["levels"]) * _COUNT.itemsize
+    counts = buffer[offset:end].view(_COUNT)
+    if len(counts) != header["levels"] or (
+        buffer.size != end + 2 * _SAMPLE.itemsize * int(counts.sum())
+    ):
+        raise WaveformCacheError(f"Truncated file: {path}")
+
+    levels = []
+    offset = end
+    for count in counts:
+        size = int(count) * _SAMPLE.itemsize
+        peak = buffer[offset : offset + size].view(_SAMPLE)
+        rms = buffer[offset + size : offset + size * 2].view(_SAMPLE)
+        levels.append((peak, rms))
+        offset += size * 2
+
+    return WaveformPyramid.from_levels(levels, int(header["duration"]))
+
+
+class _LegacyUnpickler(pickle.Unpickler):
+    # Old files contain lists of floats, or (version 2) numpy arrays
+    ALLOWED = {
+        ("numpy", "ndarray"),
+        ("numpy", "dtype"),
+        ("numpy.core.multiarray", "_reconstruct"),
+        ("numpy._core.multiarray", "_reconstruct"),
+    }
+
+    def find_class(self, module, name):
+        if (module, name) in self.ALLOWED:
+            return super().find_class(module, name)
+
+        raise pickle.UnpicklingError(f"Forbidden global: {module}.{name}")
+
+
+def load_legacy(path):
+    """Read the (peak, rms) samples from a legacy, pickle-based, file.
+
+    Only the data types used by those files can be unpickled.
+
+    :raise WaveformCacheError: if the file is not a legacy cache file
+    """
+    try:
+        with open(path, "rb") as file:
+            data = _LegacyUnpickler(file).load()
+
+        peak, rms = data[0], data[1]
+        if len(peak) != len(rms):
+            raise ValueError("Mismatching peak and rms samples")
+    except (
+        pickle.UnpicklingError,
+        AttributeError,
+        EOFError,
+        IndexError,
+        TypeError,
+        ValueError,
+    ):
+        raise WaveformCacheError(f"Not a legacy waveform file: {path}")
+
+    return peak, rms
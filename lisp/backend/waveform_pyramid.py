@@ -0,0 +1,130 @@
+# This file is part of Linux Show Player
+#
+# Copyright 2026 Francesco Ceruti <ceppofrancy@gmail.com>
+#
+# Linux Show Player is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Linux Show Player is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
+
+from math import log2
+
+import numpy as np
+
+
+class WaveformPyramid:
+    """Peak and RMS values of a waveform, at power-of-two resolutions.
+
+    The first level holds the given samples, every next level has half the
+    resolution of the previous one (each sample covers two of them), down
+    to `MinSamples`. Peaks are reduced by max, RMS values via their squares,
+    so that every level is exact, and not an average of averages.
+    """
+
+    MinSamples = 64
+
+    def __init__(self, peak_samples, rms_samples, duration):
+        """
+        :param peak_samples: the peak values, evenly spaced over `duration`
+        :param rms_samples: the RMS values, as many as the peak ones
+        :param duration: the waveform duration in milliseconds
+        """
+        peak = np.asarray(peak_samples, dtype=np.float32)
+        rms = np.asarray(rms_samples, dtype=np.float32)
+
+        self.duration = duration
+        # [(peak, rms), ...], from the highest resolution
+        self._levels = [(peak, rms)]
+
+        while len(peak) > self.MinSamples:
+            pairs = np.arange(0, len(peak), 2)
+            # The last "pair" could have a single value
+            counts = np.minimum(len(peak) - pairs, 2)
+
+            peak = np.maximum.reduceat(peak, pairs)
+            rms = np.sqrt(
+                np.add.reduceat(np.square(rms), pairs) / counts,
+                dtype=np.float32,
+            )
+            self._levels.append((peak, rms))
+
+    @classmethod
+    def from_levels(cls, levels, duration):
+        """Create a pyramid from already computed levels (e.g. a cache).
+
+        :param levels: (peak, rms) arrays for each level, as returned by
+                       `level`, the arrays are used as they are (not copied)
+        :param duration: the waveform duration in milliseconds
+        """
+        pyramid = cls.__new__(cls)
+        pyramid.duration = duration
+        pyramid._levels = list(levels)
+
+        return pyramid
+
+    def levels(self):
+        """Return the number of levels."""
+        return len(self._levels)
+
+    def level(self, index):
+        """Return the (peak, rms) values of the given level."""
+        return self._levels[index]
+
+    def query(self, width, start=0, stop=None):
+        """Return the values to draw the [start, stop] window in `width` px.
+
+        The level with the lowest resolution, still having at least one
+        value per pixel, is reduced to exactly `width` values. When zooming
+        beyond the highest resolution, values are repeated.
+        Only the values of the window are read.
+
+        :param width: the number of values (e.g. pixels) to return
+        :param start: the window start in milliseconds
+        :param stop: the window end in milliseconds, None for the duration
+        :return: (peak, rms) arrays with `width` values, or empty ones
+        """
+        if stop is None or stop > self.duration:
+            stop = self.duration
+        start = max(start, 0)
+
+        peak, rms = self._levels[0]
+        if width <= 0 or stop <= start or not len(peak):
+            empty = np.empty(0, dtype=np.float32)
+            return empty, empty
+
+        base_length = self.duration / len(peak)
+        per_px = (stop - start) / base_length / width
+        index = 0
+        if per_px >= 2:
+            index = min(int(log2(per_px)), len(self._levels) - 1)
+
+        peak, rms = self._levels[index]
+        length = base_length * 2**index
+
+        edges = np.linspace(start / length, stop / length, width + 1)
+        starts = np.minimum(edges[:-1].astype(np.intp), len(peak) - 1)
+        end = min(max(int(np.ceil(edges[-1])), starts[-1] + 1), len(peak))
+        counts = np.maximum(np.diff(np.append(starts, end)), 1)
+
+        # Read only the window
+        first = starts[0]
+        peak = np.asarray(peak[first:end], dtype=np.float32)
+        square = np.square(np.asarray(rms[first:end], dtype=np.float32))
+        starts = starts - first
+
+        peaks = np.maximum.reduceat(peak, starts)
+        # Include the values partially covered by the end of each pixel
+        partial = edges[1:-1] > starts[1:] + first
+        peaks[:-1][partial] = np.maximum(
+            peaks[:-1][partial], peak[starts[1:][partial]]
+        )
+
+        return peaks, np.sqrt(np.add.reduceat(square, starts) / counts)
@@ -0,0 +1,107 @@
+# This file is part of Linux Show Player
+#
+# Copyright 2026 Francesco Ceruti <ceppofrancy@gmail.com>
+#
+# Linux Show Player is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Linux Show Player is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy as np
+
+
+class WaveformReducer:
+    """Reduce 16bit interleaved PCM to a fixed number of peak/RMS samples.
+
+    The frames are distributed evenly across the samples, every frame (all
+    its channels) goes to exactly one sample, regardless of how the data is
+    split in buffers. For each sample, the peak and the sum of squares are
+    accumulated in preallocated arrays, the values are normalized only once,
+    by `result`.
+    """
+
+    MAX_S16_PCM_VALUE = 32768
+
+    def __init__(self, samples, frames, channels):
+        """
+        :param samples: the number of peak/RMS samples to compute
+        :param frames: the (expected) total number of frames, the frames
+                       exceeding it are added to the last sample
+        :param channels: the number of interleaved channels
+        """
+        self.samples = max(1, samples)
+        self.frames = max(1, frames)
+        self.channels = max(1, channels)
+
+        self._peak = np.zeros(self.samples, dtype=np.int32)
+        self._squares = np.zeros(self.samples, dtype=np.int64)
+        # Values (frames * channels) accumulated in each sample
+        self._values = np.zeros(self.samples, dtype=np.int64)
+        # Number of frames processed
+        self._position = 0
+        # Reused to widen the data, int16 cannot hold abs(-32768)
+        self._scratch = np.empty(0, dtype=np.int32)
+
+    def add(self, data):
+        """Accumulate the given frames.
+
+        :param data: int16 interleaved values, complete frames only
+        :type data: numpy.ndarray
+        """
+        values = len(data) - len(data) % self.channels
+        if values <= 0:
+            return
+
+        frames = values // self.channels
+        first = self._sample(self._position)
+        last = self._sample(self._position + frames - 1)
+
+        # Offset (in values) of the first frame of each sample
+        splits = np.arange(first, last + 1, dtype=np.int64)
+        splits *= self.frames
+        splits += self.samples - 1
+        splits //= self.samples
+        splits -= self._position
+        splits[0] = 0
+        splits *= self.channels
+
+        if len(self._scratch) < values:
+            self._scratch = np.empty(values, dtype=np.int32)
+        scratch = self._scratch[:values]
+
+        np.abs(data[:values], out=scratch, dtype=np.int32)
+        peaks = np.maximum.reduceat(scratch, splits)
+        np.multiply(scratch, scratch, out=scratch)
+        squares = np.add.reduceat(scratch, splits, dtype=np.int64)
+
+        window = slice(first, last + 1)
+        np.maximum(self._peak[window], peaks, out=self._peak[window])
+        self._squares[window] += squares
+        self._values[window] += np.diff(splits, append=values)
+
+        self._position += frames
+
+    def result(self):
+        """Return the normalized (peak, rms) samples, as float32 arrays."""
+        peak = np.divide(self._peak, self.MAX_S16_PCM_VALUE, dtype=np.float32)
+
+        rms = np.divide(
+            self._squares,
+            np.maximum(self._values, 1),
+            dtype=np.float64,
+        )
+        np.sqrt(rms, out=rms)
+        rms /= self.MAX_S16_PCM_VALUE
+
+        return peak, rms.astype(np.float32)
+
+    def _sample(self, frame):
+        return min(frame * self.samples // self.frames, self.samples - 1)
@@ -31,11 +31,11 @@ class UpdateCueCommand(Command):
         self.__old = str(cue.properties())
 
     def do(self):
-        self.__cue.update_properties(self.__new)
+        self.__cue.update_properties(self.__new, coalesce=True)
         self.__new = str(self.__new)
 
     def undo(self):
-        self.__cue.update_properties(literal_eval(self.__old))
+        self.__cue.update_properties(literal_eval(self.__old), coalesce=True)
 
     def redo(self):
         self.__new = literal_eval(self.__new)
@@ -57,13 +57,13 @@ class UpdateCuesCommand(Command):
 
     def do(self):
         for cue in self.__cues:
-            cue.update_properties(self.__new)
+            cue.update_properties(self.__new, coalesce=True)
 
         self.__new = str(self.__new)
 
     def undo(self):
         for cue, old in zip(self.__cues, literal_eval(self.__old)):
-            cue.update_properties(old)
+            cue.update_properties(old, coalesce=True)
 
     def redo(self):
         self.__new = literal_eval(self.__new)
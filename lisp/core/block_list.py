@@ -0,0 +1,226 @@
+# This file is part of Linux Show Player
+#
+# Copyright 2026 Francesco Ceruti <ceppofrancy@gmail.com>
+#
+# Linux Show Player is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Linux Show Player is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
+
+from bisect import bisect_right
+from itertools import accumulate, chain
+
+
+class BlockList:
+    """A list of unique (hashable) items, which knows the position of its items.
+
+    Items are stored in blocks, of at most `2 * load` items, every item is
+    mapped to its block, so:
+    * getting an item requires a bisection over the blocks offsets
+    * getting the position of an item requires two lookups, the position
+      inside the block is cached, until the block is changed
+    * inserting or removing an item only shifts the items of one block,
+      and the blocks offsets
+
+    Differently from a sorted list, the items have no key, so there's nothing
+    to renumber when inserting between two items.
+    """
+
+    DefaultLoad = 256
+
+    def __init__(self, iterable=(), load=DefaultLoad):
+        self._load = load
+        self._len = 0
+        self._blocks = []
+        # Index of the first item of each block, plus the list length
+        self._offsets = [0]
+        # {item: block}
+        self._block_of = {}
+        # {id(block): block position in `_blocks`}
+        self._block_index = {}
+        # {id(block): {item: position inside the block}}, built on demand
+        self._local_index = {}
+
+        self.extend(iterable)
+
+    def index(self, item):
+        """Return the position of the given item.
+
+        :raise ValueError: if the item is not in the list
+        """
+        try:
+            block = self._block_of[item]
+        except KeyError:
+            raise ValueError(f"{item!r} is not in list") from None
+
+        block_id = id(block)
+        local_index = self._local_index.get(block_id)
+        if local_index is None:
+            local_index = {entry: n for n, entry in enumerate(block)}
+            self._local_index[block_id] = local_index
+
+        return self._offsets[self._block_index[block_id]] + local_index[item]
+
+    def insert(self, index, item):
+        """Insert the item before the given index, as `list.insert`.
+
+        :raise ValueError: if the item is already in the list
+        """
+        if item in self._block_of:
+            raise ValueError(f"{item!r} is already in list")
+
+        if index < 0:
+            index = max(index + self._len, 0)
+
+        if not self._blocks:
+            position = 0
+            self._blocks.append([item])
+            self._block_index[id(self._blocks[0])] = 0
+        elif index >= self._len:
+            position = len(self._blocks) - 1
+            self._blocks[position].append(item)
+        else:
+            position, local = self.__locate(index)
+            self._blocks[position].insert(local, item)
+
+        block = self._blocks[position]
+        self._block_of[item] = block
+        self._local_index.pop(id(block), None)
+        self._len += 1
+
+        if len(block) > self._load * 2:
+            self.__split(position)
+        else:
+            self.__update_offsets()
+
+    def append(self, item):
+        self.insert(self._len, item)
+
+    def extend(self, iterable):
+        """Append all the items, updating the blocks only once."""
+        items = list(iterable)
+        unique = set(items)
+        if len(unique) != len(items) or not unique.isdisjoint(self._block_of):
+            raise ValueError("items must be unique")
+        if not items:
+            return
+
+        if self._blocks and len(self._blocks[-1]) < self._load:
+            block = self._blocks[-1]
+            space = self._load - len(block)
+            block.extend(items[:space])
+            for item in items[:space]:
+                self._block_of[item] = block
+            items = items[space:]
+
+        for start in range(0, len(items), self._load):
+            block = items[start : start + self._load]
+            self._blocks.append(block)
+            for item in block:
+                self._block_of[item] = block
+
+        self._len = len(self._block_of)
+        self.__update_blocks()
+
+    def pop(self, index=-1):
+        position, local = self.__locate(index)
+        block = self._blocks[position]
+        item = block.pop(local)
+
+        del self._block_of[item]
+        self._local_index.pop(id(block), None)
+        self._len -= 1
+
+        if not block:
+            del self._blocks[position]
+            self.__update_blocks()
+        elif len(block) < self._load // 2 and len(self._blocks) > 1:
+            self.__merge(position)
+        else:
+            self.__update_offsets()
+
+        return item
+
+    def remove(self, item):
+        self.pop(self.index(item))
+
+    def clear(self):
+        self._len = 0
+        self._blocks.clear()
+        self._offsets = [0]
+        self._block_of.clear()
+        self._block_index.clear()
+        self._local_index.clear()
+
+    def __locate(self, index):
+        """Return the (block position, index inside the block) of the index."""
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("list index out of range")
+
+        position = bisect_right(self._offsets, index) - 1
+        return position, index - self._offsets[position]
+
+    def __split(self, position):
+        block = self._blocks[position]
+        half = block[self._load :]
+        del block[self._load :]
+
+        self._blocks.insert(position + 1, half)
+        for item in half:
+            self._block_of[item] = half
+
+        self.__update_blocks()
+
+    def __merge(self, position):
+        if position + 1 == len(self._blocks):
+            position -= 1
+
+        block = self._blocks[position]
+        following = self._blocks.pop(position + 1)
+        block.extend(following)
+        for item in following:
+            self._block_of[item] = block
+
+        if len(block) > self._load * 2:
+            self.__split(position)
+        else:
+            self.__update_blocks()
+
+    def __update_blocks(self):
+        self._local_index.clear()
+        self._block_index = {
+            id(block): position for position, block in enumerate(self._blocks)
+        }
+        self.__update_offsets()
+
+    def __update_offsets(self):
+        self._offsets = list(accumulate(map(len, self._blocks), initial=0))
+
+    def __getitem__(self, index):
+        position, local = self.__locate(index)
+        return self._blocks[position][local]
+
+    def __delitem__(self, index):
+        self.pop(index)
+
+    def __contains__(self, item):
+        return item in self._block_of
+
+    def __iter__(self):
+        return chain.from_iterable(self._blocks)
+
+    def __len__(self):
+        return self._len
+
+    def __bool__(self):
+        return self._len > 0
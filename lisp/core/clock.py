@@ -15,40 +15,169 @@
 # You should have received a copy of the GNU General Public License
 # along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
 
-from threading import Lock
+import logging
+import time
+from math import floor
+from threading import Condition, Thread
 
-from PyQt5.QtCore import QTimer
+logger = logging.getLogger(__name__)
 
 
-class Clock(QTimer):
-    """Clock based on Qt.QTimer class.
+class _TickGroup:
+    """Callbacks ticking at the same interval."""
+
+    __slots__ = ("interval", "deadline", "callbacks", "snapshot", "skipped")
+
+    def __init__(self, interval, deadline):
+        self.interval = interval
+        self.deadline = deadline
+        # {callback: registrations count}
+        self.callbacks = {}
+        # Immutable copy of the callbacks, used while dispatching
+        self.snapshot = ()
+        self.skipped = 0
+
+
+class ClockScheduler:
+    """Single timebase dispatching ticks to subscribers at different rates.
+
+    * Ticks are dispatched from a dedicated thread, not from the Qt one,
+      subscribers updating widgets must use a queued connection
+    * Deadlines are computed from a common (monotonic) epoch, so ticks of
+      different rates are phase-aligned, and late wakeups don't accumulate
+    * When a tick is missed (e.g. a callback took too long) it's skipped,
+      the next tick is dispatched at the following deadline
+    """
+
+    def __init__(self, name="ClockScheduler"):
+        self._name = name
+        self._epoch = time.monotonic()
+        self._cond = Condition()
+        # {interval (milliseconds): _TickGroup}
+        self._groups = {}
+        self._thread = None
+
+    def subscribe(self, interval, callback):
+        """Call `callback` (without arguments) every `interval` milliseconds.
+
+        Subscribing the same callback more than once, at the same interval,
+        doesn't result in multiple calls, but it needs to be unsubscribed the
+        same number of times.
+        """
+        with self._cond:
+            group = self._groups.get(interval)
+            if group is None:
+                group = _TickGroup(
+                    interval / 1000, self._next_deadline(interval / 1000)
+                )
+                self._groups[interval] = group
+
+            group.callbacks[callback] = group.callbacks.get(callback, 0) + 1
+            group.snapshot = tuple(group.callbacks)
+
+            if self._thread is None:
+                self._thread = Thread(
+                    target=self._run, name=self._name, daemon=True
+                )
+                self._thread.start()
+
+            self._cond.notify()
+
+    def unsubscribe(self, interval, callback):
+        """Remove a subscription made via `subscribe`.
+
+        :raise ValueError: if the callback is not subscribed
+        """
+        with self._cond:
+            group = self._groups.get(interval)
+            if group is None or callback not in group.callbacks:
+                raise ValueError(f"{callback} is not subscribed")
+
+            group.callbacks[callback] -= 1
+            if group.callbacks[callback] == 0:
+                del group.callbacks[callback]
+                group.snapshot = tuple(group.callbacks)
+
+            if not group.callbacks:
+                del self._groups[interval]
+
+    def time(self):
+        """Seconds elapsed since the clock epoch."""
+        return time.monotonic() - self._epoch
+
+    def skipped(self, interval):
+        """Number of ticks skipped at the given interval (milliseconds)."""
+        with self._cond:
+            group = self._groups.get(interval)
+            return group.skipped if group is not None else 0
+
+    def _next_deadline(self, interval):
+        return (floor(self.time() / interval) + 1) * interval
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._groups:
+                    self._cond.wait()
+
+                timeout = (
+                    min(g.deadline for g in self._groups.values()) - self.time()
+                )
+                if timeout > 0:
+                    # Woken-up earlier if the subscriptions change
+                    self._cond.wait(timeout)
+                    continue
+
+                now = self.time()
+                due = []
+                for group in self._groups.values():
+                    if group.deadline <= now:
+                        due.append(group.snapshot)
+
+                        # Skip missed ticks, instead of bunching them up
+                        missed = floor((now - group.deadline) / group.interval)
+                        group.skipped += missed
+                        group.deadline += (missed + 1) * group.interval
+
+            for snapshot in due:
+                for callback in snapshot:
+                    try:
+                        callback()
+                    except Exception:
+                        logger.warning("Clock callback error", exc_info=True)
+
+
+class Clock:
+    """Clock ticking at a fixed interval, adapter over a `ClockScheduler`.
 
     The clock is running only when there's one, or more, callbacks.
+
+    .. note::
+        Callbacks are not called in the Qt thread.
     """
 
-    def __init__(self, timeout):
-        super().__init__()
-        self.setInterval(timeout)
+    def __init__(self, timeout, master=None):
+        """
+        :param timeout: the tick interval in milliseconds
+        :param master: the ClockScheduler to use, default to `MasterClock`
+        """
+        self.__interval = timeout
+        self.__master = MasterClock if master is None else master
 
-        self.__lock = Lock()
-        self.__clients = 0
+    def interval(self):
+        return self.__interval
 
     def add_callback(self, callback):
-        with self.__lock:
-            self.timeout.connect(callback)
-
-            self.__clients += 1
-            if self.__clients == 1:
-                self.start()
+        self.__master.subscribe(self.__interval, callback)
 
     def remove_callback(self, callback):
-        with self.__lock:
-            self.timeout.disconnect(callback)
+        """
+        :raise ValueError: if the callback was not added
+        """
+        self.__master.unsubscribe(self.__interval, callback)
 
-            self.__clients -= 1
-            if self.__clients == 0:
-                self.stop()
 
+MasterClock = ClockScheduler()
 
 Clock_10 = Clock(10)
 Clock_33 = Clock(33)
@@ -19,16 +19,55 @@ import logging
 from functools import wraps, partial
 from threading import Thread, Lock, RLock
 
+from lisp.core.executor import TaskPriority
 
-def async_function(target):
+
+def async_function(
+    target=None, *, executor=None, priority=TaskPriority.Normal, serial=False
+):
     """Decorator. Make a function asynchronous.
 
-    The decorated function is executed in a different thread.
+    The decorated function is executed in a different thread, by default
+    a new thread is created for each call.
+
+    .. Usage::
+
+        class MyCue(Cue):
+            @async_function(executor=CueExecutor, serial=True)
+            def do_some_task(self):
+                pass
+
+    :param target: the function to decorate
+    :param executor: if given, the function is executed by this
+                     `lisp.core.executor.PriorityExecutor`
+    :param priority: the priority used with the executor
+    :param serial: if True, executor calls with the same first argument
+                   (e.g. `self`) are executed in order
     """
 
-    @wraps(target)
-    def wrapped(*args, **kwargs):
-        Thread(target=target, args=args, kwargs=kwargs, daemon=True).start()
+    # If called with (keywords) arguments
+    if target is None:
+        return partial(
+            async_function, executor=executor, priority=priority, serial=serial
+        )
+
+    if executor is None:
+
+        @wraps(target)
+        def wrapped(*args, **kwargs):
+            Thread(target=target, args=args, kwargs=kwargs, daemon=True).start()
+
+    else:
+
+        @wraps(target)
+        def wrapped(*args, **kwargs):
+            executor.submit(
+                target,
+                args,
+                kwargs,
+                priority=priority,
+                key=args[0] if serial and args else None,
+            )
 
     return wrapped
 
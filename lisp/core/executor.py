@@ -0,0 +1,271 @@
+# This file is part of Linux Show Player
+#
+# Copyright 2026 Francesco Ceruti <ceppofrancy@gmail.com>
+#
+# Linux Show Player is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Linux Show Player is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
+
+import logging
+import time
+from collections import deque
+from contextlib import contextmanager
+from enum import IntEnum
+from heapq import heappop, heappush
+from itertools import count
+from threading import Condition, Thread, local
+from typing import NamedTuple
+
+logger = logging.getLogger(__name__)
+
+_current = local()
+
+
+class TaskPriority(IntEnum):
+    """Tasks with a lower value are dispatched first."""
+
+    High = 0
+    Normal = 1
+    Low = 2
+
+
+class ExecutorStats(NamedTuple):
+    queued: int
+    """Number of tasks waiting to be dispatched (including serialized ones)"""
+    running: int
+    """Number of tasks being executed, and not blocked"""
+    blocked: int
+    """Number of tasks being executed, but blocked (see `blocking`)"""
+    dispatched: int
+    """Number of tasks dispatched so far"""
+    latency_last: float
+    """Last dispatch latency, from submission to execution (seconds)"""
+    latency_mean: float
+    """Mean dispatch latency (seconds)"""
+    latency_max: float
+    """Max dispatch latency (seconds)"""
+
+
+class _Task:
+    __slots__ = (
+        "fn",
+        "args",
+        "kwargs",
+        "priority",
+        "key",
+        "submitted",
+        "blocked",
+    )
+
+    def __init__(self, fn, args, kwargs, priority, key):
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.priority = priority
+        self.key = key
+        self.submitted = time.monotonic()
+        # Depth of nested `blocking` sections
+        self.blocked = 0
+
+
+class PriorityExecutor:
+    """Bounded pool of threads, executing prioritized tasks.
+
+    * Workers are created only when needed, up to `max_workers`
+    * Tasks submitted with the same (not None) `key` are executed in order,
+      a task is dispatched only when the previous one with the same key
+      is completed, or is blocked (see `blocking`)
+    * A worker blocked (see `blocking`) doesn't count toward `max_workers`,
+      so long waits cannot starve the pool
+    """
+
+    def __init__(self, max_workers=8, name="PriorityExecutor"):
+        self._max_workers = max_workers
+        self._name = name
+
+        self._cond = Condition()
+        self._counter = count()
+        # Heap of (priority, sequence, task) ready to be dispatched
+        self._ready = []
+        # Tasks (by key) waiting for the previous one to complete, if a key
+        # is present, a task with the same key is ready, running or blocked
+        self._serial = {}
+
+        self._workers = 0
+        self._idle = 0
+        self._blocked = 0
+
+        self._dispatched = 0
+        self._latency_last = 0
+        self._latency_total = 0
+        self._latency_max = 0
+
+    @property
+    def max_workers(self):
+        return self._max_workers
+
+    @max_workers.setter
+    def max_workers(self, value):
+        with self._cond:
+            self._max_workers = max(1, value)
+            self._spawn_workers()
+
+    def submit(
+        self, fn, args=(), kwargs=None, priority=TaskPriority.Normal, key=None
+    ):
+        """Schedule the given function to be executed.
+
+        :param fn: the function to execute
+        :param args: positional arguments for `fn`
+        :param kwargs: keyword arguments for `fn`
+        :param priority: the task priority
+        :type priority: TaskPriority
+        :param key: tasks with the same key are executed in order (hashable)
+        """
+        task = _Task(fn, args, {} if kwargs is None else kwargs, priority, key)
+
+        with self._cond:
+            if key is not None:
+                waiting = self._serial.get(key)
+                if waiting is not None:
+                    waiting.append(task)
+                    return
+
+                self._serial[key] = deque()
+
+            self._push(task)
+
+    def stats(self):
+        """Return a snapshot of the queue depth and of the dispatch latency.
+
+        :rtype: ExecutorStats
+        """
+        with self._cond:
+            queued = len(self._ready) + sum(map(len, self._serial.values()))
+            mean = (
+                self._latency_total / self._dispatched
+                if self._dispatched
+                else 0
+            )
+
+            return ExecutorStats(
+                queued=queued,
+                running=self._workers - self._idle - self._blocked,
+                blocked=self._blocked,
+                dispatched=self._dispatched,
+                latency_last=self._latency_last,
+                latency_mean=mean,
+                latency_max=self._latency_max,
+            )
+
+    def _push(self, task):
+        heappush(self._ready, (task.priority, next(self._counter), task))
+        self._spawn_workers()
+        self._cond.notify()
+
+    def _spawn_workers(self):
+        while (
+            len(self._ready) > self._idle
+            and self._workers - self._blocked < self._max_workers
+        ):
+            self._workers += 1
+            Thread(
+                target=self._work,
+                name=f"{self._name}-{self._workers}",
+                daemon=True,
+            ).start()
+
+    def _release(self, key):
+        """Dispatch the next task with the given key, if any."""
+        waiting = self._serial[key]
+        if waiting:
+            self._push(waiting.popleft())
+        else:
+            del self._serial[key]
+
+    def _work(self):
+        _current.executor = self
+
+        while True:
+            with self._cond:
+                # Too many workers, caused by blocked tasks, terminate
+                if self._workers - self._blocked > self._max_workers:
+                    self._workers -= 1
+                    return
+
+                while not self._ready:
+                    self._idle += 1
+                    self._cond.wait()
+                    self._idle -= 1
+
+                task = heappop(self._ready)[2]
+
+                latency = time.monotonic() - task.submitted
+                self._dispatched += 1
+                self._latency_last = latency
+                self._latency_total += latency
+                self._latency_max = max(self._latency_max, latency)
+
+            _current.task = task
+            try:
+                task.fn(*task.args, **task.kwargs)
+            except Exception:
+                logger.exception(f"Exception in {self._name} task")
+            finally:
+                _current.task = None
+
+                if task.key is not None:
+                    with self._cond:
+                        self._release(task.key)
+
+    def _block(self, task):
+        with self._cond:
+            task.blocked += 1
+            if task.blocked == 1:
+                self._blocked += 1
+                if task.key is not None:
+                    self._release(task.key)
+                    # Released only once, avoid doing it again at the end
+                    task.key = None
+
+                self._spawn_workers()
+
+    def _unblock(self, task):
+        with self._cond:
+            task.blocked -= 1
+            if task.blocked == 0:
+                self._blocked -= 1
+
+
+@contextmanager
+def blocking():
+    """Mark a section of code as blocking (e.g. waiting for a long time).
+
+    When executed by a `PriorityExecutor` task, the executor is allowed to
+    start another worker, and following tasks with the same key can be
+    dispatched, otherwise it does nothing.
+    """
+    executor = getattr(_current, "executor", None)
+    task = getattr(_current, "task", None)
+    if executor is None or task is None:
+        yield
+        return
+
+    executor._block(task)
+    try:
+        yield
+    finally:
+        executor._unblock(task)
+
+
+# Shared executor for cues actions
+CueExecutor = PriorityExecutor(max_workers=16, name="CueExecutor")
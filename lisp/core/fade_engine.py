@@ -0,0 +1,214 @@
+# This file is part of Linux Show Player
+#
+# Copyright 2026 Francesco Ceruti <ceppofrancy@gmail.com>
+#
+# Linux Show Player is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Linux Show Player is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
+
+import time
+from threading import Event, Lock, RLock
+
+import numpy as np
+
+from lisp.core.clock import ClockScheduler
+from lisp.core.fade_functions import fade_curve
+from lisp.core.util import rgetattr, rsetattr
+
+
+class FadeHandle:
+    """A fade registered into a `FadeEngine`."""
+
+    __slots__ = (
+        "target",
+        "attribute",
+        "curve",
+        "start",
+        "duration",
+        "base_value",
+        "value_diff",
+        "elapsed",
+        "error",
+        "finished",
+    )
+
+    def __init__(
+        self, target, attribute, curve, duration, base_value, value_diff
+    ):
+        self.target = target
+        self.attribute = attribute
+        self.curve = curve
+        self.start = time.monotonic()
+        self.duration = duration
+        self.base_value = base_value
+        self.value_diff = value_diff
+
+        # Elapsed time in seconds, updated by the engine
+        self.elapsed = 0
+        # Exception raised while applying a value, if any
+        self.error = None
+        # Set when the fade is completed (or cancelled)
+        self.finished = Event()
+
+    def wait(self, timeout=None):
+        """Wait for the fade to be completed (or cancelled)."""
+        return self.finished.wait(timeout)
+
+
+class _FadeGroup:
+    """Fades with the same curve, evaluated together."""
+
+    __slots__ = ("handles", "start", "duration", "base_value", "value_diff")
+
+    def __init__(self, handles):
+        self.handles = handles
+        self.start = np.fromiter((h.start for h in handles), float)
+        self.duration = np.fromiter((h.duration for h in handles), float)
+        self.base_value = np.fromiter((h.base_value for h in handles), float)
+        self.value_diff = np.fromiter((h.value_diff for h in handles), float)
+
+
+class FadeEngine:
+    """Advance all the active fades from a single thread.
+
+    At every tick, the values of all fades are computed from the real
+    elapsed (monotonic) time, curves are evaluated in vectorized batches
+    (interpolating their cached lookup-tables), then the values are applied
+    in a single pass.
+
+    .. note::
+        The values are applied from the engine thread.
+    """
+
+    def __init__(self, interval=10, name="FadeEngine"):
+        """
+        :param interval: tick interval in milliseconds
+        """
+        self._interval = interval
+        self._clock = ClockScheduler(name=name)
+
+        self._lock = Lock()
+        # Held while values are applied
+        self._apply_lock = RLock()
+        # {curve: [FadeHandle, ...]}
+        self._fades = {}
+        # Arrays used for the evaluation, rebuilt when fades change
+        self._groups = ()
+
+    def add(self, target, attribute, duration, to_value, fade_type):
+        """Register a new fade, starting now.
+
+        :param target: The target object
+        :param attribute: The target attribute (name) to be faded
+        :param duration: How much the fade should be long (in seconds)
+        :param to_value: The value to reach
+        :param fade_type: The fade type, anything accepted by
+                          `lisp.core.fade_functions.fade_curve`
+        :rtype: FadeHandle
+        """
+        base_value = rgetattr(target, attribute)
+        handle = FadeHandle(
+            target,
+            attribute,
+            fade_curve(fade_type),
+            duration,
+            base_value,
+            to_value - base_value,
+        )
+
+        with self._lock:
+            if not self._fades:
+                self._clock.subscribe(self._interval, self._tick)
+
+            self._fades.setdefault(handle.curve, []).append(handle)
+            self._update_groups()
+
+        return handle
+
+    def cancel(self, handle):
+        """Remove the fade, the value reached so far is kept.
+
+        When this function returns, the target is not going to be changed.
+        """
+        with self._apply_lock:
+            if self._remove((handle,)):
+                handle.finished.set()
+
+    def active(self):
+        """Number of active fades."""
+        with self._lock:
+            return sum(map(len, self._fades.values()))
+
+    def _remove(self, handles):
+        removed = False
+
+        with self._lock:
+            for handle in handles:
+                fades = self._fades.get(handle.curve, ())
+                if handle in fades:
+                    fades.remove(handle)
+                    removed = True
+                    if not fades:
+                        del self._fades[handle.curve]
+
+            if removed:
+                self._update_groups()
+                if not self._fades:
+                    self._clock.unsubscribe(self._interval, self._tick)
+
+        return removed
+
+    def _update_groups(self):
+        self._groups = tuple(
+            (curve, _FadeGroup(tuple(handles)))
+            for curve, handles in self._fades.items()
+        )
+
+    def _tick(self):
+        with self._apply_lock:
+            self._apply(time.monotonic())
+
+    def _apply(self, now):
+        completed = []
+
+        for curve, group in self._groups:
+            elapsed = now - group.start
+            t = np.clip(elapsed / group.duration, 0, 1)
+            values = np.round(
+                curve.evaluate(t, group.value_diff, group.base_value), 6
+            )
+
+            for handle, value, h_elapsed, h_t in zip(
+                group.handles, values.tolist(), elapsed, t
+            ):
+                if handle.finished.is_set():
+                    continue
+
+                try:
+                    rsetattr(handle.target, handle.attribute, value)
+                except Exception as e:
+                    handle.error = e
+                    completed.append(handle)
+                    continue
+
+                handle.elapsed = min(h_elapsed, handle.duration)
+                if h_t >= 1:
+                    completed.append(handle)
+
+        if completed:
+            self._remove(completed)
+            for handle in completed:
+                handle.finished.set()
+
+
+# Shared engine
+MainFadeEngine = FadeEngine()
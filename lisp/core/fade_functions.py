@@ -25,6 +25,10 @@ b = y0
 """
 
 from enum import Enum
+from functools import lru_cache
+
+import numpy as np
+from numpy import maximum, minimum
 
 from lisp.core.util import FunctionProxy
 
@@ -47,13 +51,16 @@ def fadeout_quad(t, a, b):
 def fade_inout_quad(t, a, b):
     """Quadratic (t^2) fade in-out: acceleration until halfway,
     then deceleration.
+
+    Written without branches, so that it can be evaluated on numpy arrays.
     """
-    t *= 2
-    if t < 1.0:
-        return 0.5 * a * (t**2) + b
-    else:
-        t -= 1
-        return 0.5 * a * (1 - (t * (t - 2))) + b
+    t = t * 2
+    # First half: acceleration, clipped to 1 after halfway
+    t_in = minimum(t, 1)
+    # Second half: deceleration, clipped to 0 before halfway
+    t_out = maximum(t - 1, 0)
+
+    return 0.5 * a * (t_in**2 + t_out * (2 - t_out)) + b
 
 
 def ntime(time, begin, duration):
@@ -71,3 +78,124 @@ class FadeOutType(Enum):
     Linear = FunctionProxy(fade_linear)
     Quadratic = FunctionProxy(fadeout_quad)
     Quadratic2 = FunctionProxy(fade_inout_quad)
+
+
+def fade_scurve(t, a, b):
+    """S-curve (smoothstep) fade: slow at both ends."""
+    return a * (t * t * (3 - 2 * t)) + b
+
+
+def fade_log(t, a, b):
+    """Logarithmic fade: fast at the beginning, slow at the end."""
+    return a * (np.log1p(t * 9) / np.log(10)) + b
+
+
+def fade_equal_power(t, a, b):
+    """Equal-power (sine) fade, for crossfades with constant loudness."""
+    return a * np.sin(t * (np.pi / 2)) + b
+
+
+class FadeCurve:
+    """A normalized fade curve, evaluated via cached lookup-tables.
+
+    Tables hold the values of `function(t, 1, 0)` for `t` in [0, 1], so
+    applying a fade is a single scale-and-offset (a * table + b).
+    Tables are computed once, for each resolution, and are read-only.
+    """
+
+    DefaultResolution = 1024
+
+    def __init__(self, function, name=""):
+        """
+        :param function: curve function, see the module documentation for
+                         the arguments, numpy arrays should be supported
+        """
+        self.function = function
+        self.name = name
+        self._tables = {}
+
+    def table(self, resolution=DefaultResolution):
+        """Normalized curve values, sampled at `resolution` points.
+
+        :rtype: numpy.ndarray
+        """
+        table = self._tables.get(resolution)
+        if table is None:
+            t = _grid(resolution)
+            try:
+                table = np.asarray(self.function(t, 1, 0), dtype=float)
+            except (TypeError, ValueError):
+                # The function doesn't support arrays
+                table = np.fromiter(
+                    (self.function(x, 1, 0) for x in t.tolist()), float
+                )
+
+            table.flags.writeable = False
+            self._tables[resolution] = table
+
+        return table
+
+    def points(self, resolution, a, b):
+        """The curve values scaled to a specific fade (a * table + b).
+
+        :rtype: numpy.ndarray
+        """
+        return self.table(resolution) * a + b
+
+    def evaluate(self, t, a=1, b=0, resolution=DefaultResolution):
+        """Evaluate the curve, interpolating the table, at normalized time(s).
+
+        :param t: normalized time(s), a number or an array
+        """
+        table = self.table(resolution)
+        return np.interp(t, _grid(resolution), table) * a + b
+
+
+@lru_cache(maxsize=None)
+def _grid(resolution):
+    grid = np.linspace(0, 1, resolution)
+    grid.flags.writeable = False
+    return grid
+
+
+_TypesCurves = {}
+Curves = {}
+"""User-defined curves, registered by name"""
+
+
+def register_curve(name, function):
+    """Register a new named curve.
+
+    :param name: the curve name, replaces any curve with the same name
+    :param function: curve function, see `FadeCurve`
+    :rtype: FadeCurve
+    """
+    curve = Curves[name] = FadeCurve(function, name=name)
+    return curve
+
+
+def fade_curve(fade_type):
+    """Return the (cached) FadeCurve for the given fade type.
+
+    :param fade_type: a FadeInType/FadeOutType member, the name of a
+                      registered curve, or a FadeCurve (returned as is)
+    :rtype: FadeCurve
+    :raise KeyError: if the name is not registered
+    """
+    if isinstance(fade_type, FadeCurve):
+        return fade_type
+    if isinstance(fade_type, str):
+        return Curves[fade_type]
+
+    # Members of different enums can share the same function
+    function = fade_type.value.function
+    curve = _TypesCurves.get(function)
+    if curve is None:
+        curve = _TypesCurves[function] = FadeCurve(function, fade_type.name)
+
+    return curve
+
+
+register_curve("SCurve", fade_scurve)
+register_curve("Logarithmic", fade_log)
+register_curve("EqualPower", fade_equal_power)
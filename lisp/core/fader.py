@@ -20,8 +20,10 @@ from threading import Event
 from typing import Union
 
 from lisp.core.decorators import locked_method
-from lisp.core.fade_functions import ntime, FadeInType, FadeOutType
-from lisp.core.util import rsetattr, rgetattr, typename
+from lisp.core.executor import blocking
+from lisp.core.fade_engine import MainFadeEngine
+from lisp.core.fade_functions import FadeCurve, FadeInType, FadeOutType
+from lisp.core.util import rgetattr, typename
 
 
 class BaseFader(ABC):
@@ -73,26 +75,27 @@ class BaseFader(ABC):
         self,
         duration: float,
         to_value: float,
-        fade_type: Union[FadeInType, FadeOutType],
+        fade_type: Union[FadeInType, FadeOutType, FadeCurve],
     ) -> bool:
         """
         :param duration: How much the fade should be long (in seconds)
         :param to_value: The value to reach
-        :param fade_type: The fade type
+        :param fade_type: The fade type, or a (registered) FadeCurve
 
         :return: False if the fade as been interrupted, True otherwise
         """
         if duration <= 0:
             return True
 
-        if not isinstance(fade_type, (FadeInType, FadeOutType)):
+        if not isinstance(fade_type, (FadeInType, FadeOutType, FadeCurve)):
             raise AttributeError(
                 "fade_type must be one of FadeInType or FadeOutType members,"
-                f"not {typename(fade_type)}"
+                f" or a FadeCurve, not {typename(fade_type)}"
             )
 
         try:
-            self._fade(duration, to_value, fade_type)
+            with blocking():
+                self._fade(duration, to_value, fade_type)
         finally:
             interrupted = self._running.is_set()
             self._running.set()
@@ -153,13 +156,27 @@ class DummyFader(BaseFader):
 class Fader(BaseFader):
     """Perform fades on "generic" objects attributes.
 
-    * Fades have a resolution of `1-hundredth-of-second`
+    * Fades are advanced by a shared `FadeEngine`, with a resolution of
+      `1-hundredth-of-second`, the calling thread just waits for the end
     """
 
-    def __init__(self, target, attribute):
+    def __init__(self, target, attribute, engine=None):
+        """
+        :param engine: The FadeEngine to use, default to `MainFadeEngine`
+        """
         super().__init__(target, attribute)
-        # current fade time in hundredths-of-seconds
-        self._time = 0
+        self._engine = MainFadeEngine if engine is None else engine
+        self._handle = None
+
+    def stop(self):
+        if not self._running.is_set():
+            self._running.set()
+
+            handle = self._handle
+            if handle is not None:
+                self._engine.cancel(handle)
+
+            self._is_ready.wait()
 
     def _fade(
         self,
@@ -167,36 +184,27 @@ class Fader(BaseFader):
         to_value: float,
         fade_type: Union[FadeInType, FadeOutType],
     ) -> bool:
-        self._time = 0
-
-        begin = 0
-        functor = fade_type.value
-        duration = int(duration * 100)
-        base_value = rgetattr(self._target, self._attribute)
-        value_diff = to_value - base_value
-
-        if value_diff == 0:
+        if rgetattr(self._target, self._attribute) == to_value:
             return True
 
-        while self._time <= duration and not self._running.is_set():
-            rsetattr(
-                self._target,
-                self._attribute,
-                round(
-                    functor(
-                        ntime(self._time, begin, duration),
-                        value_diff,
-                        base_value,
-                    ),
-                    6,
-                ),
-            )
+        handle = self._handle = self._engine.add(
+            self._target, self._attribute, duration, to_value, fade_type
+        )
+
+        # The fader could have been stopped before the fade was registered
+        if self._running.is_set():
+            self._engine.cancel(handle)
 
-            self._time += 1
-            self._running.wait(0.01)
+        handle.wait()
+        if handle.error is not None:
+            raise handle.error
 
     def _after_fade(self, interrupted):
-        self._time = 0
+        self._handle = None
 
     def current_time(self) -> int:
-        return round(self._time * 10)
+        handle = self._handle
+        if handle is None:
+            return 0
+
+        return round(handle.elapsed * 1000)
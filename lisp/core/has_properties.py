@@ -16,6 +16,7 @@
 # along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
 
 from abc import ABCMeta
+from contextlib import contextmanager, nullcontext
 
 from lisp.core.properties import Property, InstanceProperty
 from lisp.core.signal import Signal
@@ -32,6 +33,10 @@ class HasPropertiesMeta(ABCMeta):
     On it's own this metaclass it's not very useful, look at the HasProperty
     class for a comprehensive implementation.
 
+    Along with the (mutable) `_properties_` set, a frozen copy is kept in
+    `_properties_index_`, it's replaced only when a property is added or
+    removed, so it can be used for fast membership checks without copying.
+
     Note:
         This metaclass is derived form :class:`abc.ABCMeta`, so abstract
         classes can be created without using an intermediate metaclass
@@ -52,12 +57,16 @@ class HasPropertiesMeta(ABCMeta):
             if isinstance(base, HasPropertiesMeta):
                 cls._properties_.update(base._properties_)
 
+        cls._properties_index_ = frozenset(cls._properties_)
+
         return cls
 
     def __setattr__(cls, name, value):
         super().__setattr__(name, value)
 
         if isinstance(value, Property):
+            # Not called automatically when the class is already created
+            value.__set_name__(cls, name)
             cls._add_property(name)
 
     def __delattr__(cls, name):
@@ -68,11 +77,13 @@ class HasPropertiesMeta(ABCMeta):
 
     def _add_property(cls, name):
         cls._properties_.add(name)
+        cls._properties_index_ = frozenset(cls._properties_)
         for subclass in cls.__subclasses__():
             subclass._add_property(name)
 
     def _del_property(cls, name):
         cls._properties_.discard(name)
+        cls._properties_index_ = frozenset(cls._properties_)
         for subclass in cls.__subclasses__():
             subclass._del_property(name)
 
@@ -98,9 +109,17 @@ class HasProperties(metaclass=HasPropertiesMeta):
         # Contains signals that are emitted after the associated property is
         # changed, the signals are created only when requested the first time.
 
+        self.__batch_depth = 0
+        self.__batch_changes = {}
+        # Changes collected while inside a `batch_update` block
+
         self.property_changed = Signal()
         # Emitted after property change (self, name, value)
 
+        self.properties_changed = Signal()
+        # Emitted after one or more properties change (self, {name: value}),
+        # when changes are batched, it's emitted only once per batch
+
     def properties_names(self, filter=None):
         """
         To work as intended `filter` must be a function that takes a set as a
@@ -124,7 +143,17 @@ class HasProperties(metaclass=HasPropertiesMeta):
 
         :rtype: set
         """
-        return self.__class__._properties_.copy()
+        return set(self._properties_index())
+
+    def _properties_index(self):
+        """Return a frozenset of properties names, intended for internal usage.
+
+        Differently from `_properties_names`, no copy is made, use it
+        for membership checks.
+
+        :rtype: frozenset
+        """
+        return self.__class__._properties_index_
 
     def properties_defaults(self, filter=None):
         """Instance properties defaults.
@@ -161,11 +190,12 @@ class HasProperties(metaclass=HasPropertiesMeta):
         if callable(filter):
             return {
                 name: getattr(cls, name).default
-                for name in filter(cls._properties_.copy())
+                for name in filter(set(cls._properties_index_))
             }
         else:
             return {
-                name: getattr(cls, name).default for name in cls._properties_
+                name: getattr(cls, name).default
+                for name in cls._properties_index_
             }
 
     def properties(self, defaults=True, filter=None):
@@ -191,19 +221,54 @@ class HasProperties(metaclass=HasPropertiesMeta):
 
         return properties
 
-    def update_properties(self, properties):
+    def update_properties(self, properties, coalesce=False):
         """Update the current properties using the given dict.
 
         :param properties: The element properties
         :type properties: dict
+        :param coalesce: if True, changes notifications are batched,
+                         see `batch_update`, nested properties included
+        :type coalesce: bool
         """
-        for name, value in properties.items():
-            if name in self.properties_names():
-                current = getattr(self, name)
-                if isinstance(current, HasProperties):
-                    current.update_properties(value)
-                else:
-                    setattr(self, name, value)
+        names = self._properties_index()
+        with self.batch_update() if coalesce else nullcontext():
+            for name, value in properties.items():
+                if name in names:
+                    current = getattr(self, name)
+                    if isinstance(current, HasProperties):
+                        current.update_properties(value, coalesce=coalesce)
+                    else:
+                        setattr(self, name, value)
+
+    @contextmanager
+    def batch_update(self):
+        """Defer changes notifications until the end of the block.
+
+        Inside the block, properties can be changed as usual, but no signal
+        is emitted. When the (outermost) block ends, `property_changed` and
+        the `changed` signals are emitted once for each changed property,
+        with its last value, then `properties_changed` is emitted once
+        with all the changes.
+
+        Usage:
+
+            with cue.batch_update():
+                cue.name = "Intro"
+                cue.duration = 42000
+        """
+        self.__batch_depth += 1
+        try:
+            yield self
+        finally:
+            self.__batch_depth -= 1
+            if self.__batch_depth == 0 and self.__batch_changes:
+                changes = self.__batch_changes
+                self.__batch_changes = {}
+
+                for name, value in changes.items():
+                    self.__emit_property_changed(name, value)
+
+                self.properties_changed.emit(self, changes)
 
     def changed(self, name):
         """
@@ -213,7 +278,7 @@ class HasProperties(metaclass=HasPropertiesMeta):
 
         The signals returned by this method are created lazily and cached.
         """
-        if name not in self.properties_names():
+        if name not in self._properties_index():
             raise ValueError(f'no property "{name}" found')
 
         signal = self.__changed_signals.get(name)
@@ -225,10 +290,19 @@ class HasProperties(metaclass=HasPropertiesMeta):
 
     def __setattr__(self, name, value):
         super().__setattr__(name, value)
-        if name in self.properties_names():
+        if name in self._properties_index():
             self._emit_changed(name, value)
 
     def _emit_changed(self, name, value):
+        if self.__batch_depth:
+            self.__batch_changes[name] = value
+        else:
+            self.__emit_property_changed(name, value)
+            # Avoid creating the dict when not needed (e.g. media elements)
+            if self.properties_changed.is_connected():
+                self.properties_changed.emit(self, {name: value})
+
+    def __emit_property_changed(self, name, value):
         self.property_changed.emit(self, name, value)
         try:
             self.__changed_signals[name].emit(value)
@@ -236,7 +310,7 @@ class HasProperties(metaclass=HasPropertiesMeta):
             pass
 
     def _property(self, name):
-        if name in self.__class__._properties_:
+        if name in self.__class__._properties_index_:
             return getattr(self.__class__, name)
 
         # TODO: PropertyError ??
@@ -248,14 +322,24 @@ class HasProperties(metaclass=HasPropertiesMeta):
 class HasInstanceProperties(HasProperties):
     # Fallback __init__
     _i_properties_ = set()
+    _i_properties_index_ = (None, frozenset())
 
     def __init__(self):
         super().__init__()
         self._i_properties_ = set()
         # Registry to keep track of instance-properties
+        self._i_properties_index_ = (None, frozenset())
+        # Cached (class-index, full-index) pair, the full-index includes
+        # instance-properties, and it's rebuilt when either changes
 
-    def _properties_names(self):
-        return super()._properties_names().union(self._i_properties_)
+    def _properties_index(self):
+        class_index, index = self._i_properties_index_
+        if class_index is not self.__class__._properties_index_:
+            class_index = self.__class__._properties_index_
+            index = class_index.union(self._i_properties_)
+            self._i_properties_index_ = (class_index, index)
+
+        return index
 
     def __getattribute__(self, name):
         attribute = super().__getattribute__(name)
@@ -268,6 +352,7 @@ class HasInstanceProperties(HasProperties):
         if isinstance(value, InstanceProperty):
             super().__setattr__(name, value)
             self._i_properties_.add(name)
+            self._i_properties_index_ = (None, frozenset())
         elif name in self._i_properties_:
             property = super().__getattribute__(name)
             property.__pset__(value)
@@ -277,7 +362,9 @@ class HasInstanceProperties(HasProperties):
 
     def __delattr__(self, name):
         super().__delattr__(name)
-        self._i_properties_.discard(name)
+        if name in self._i_properties_:
+            self._i_properties_.discard(name)
+            self._i_properties_index_ = (None, frozenset())
 
     def _property(self, name):
         if name in self._i_properties_:
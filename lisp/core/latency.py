@@ -0,0 +1,64 @@
+# This file is part of Linux Show Player
+#
+# Copyright 2026 Francesco Ceruti <ceppofrancy@gmail.com>
+#
+# Linux Show Player is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Linux Show Player is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
+
+from threading import Lock
+from typing import NamedTuple
+
+
+class LatencyStats(NamedTuple):
+    """Latency statistics, in seconds."""
+
+    count: int
+    mean: float
+    max: float
+    last: float
+
+
+class LatencyCounter:
+    """Count the latency of the dispatched events."""
+
+    def __init__(self):
+        self._lock = Lock()
+        self._count = 0
+        self._total = 0
+        self._max = 0
+        self._last = 0
+
+    def record(self, latency):
+        with self._lock:
+            self._count += 1
+            self._total += latency
+            self._last = latency
+            if latency > self._max:
+                self._max = latency
+
+    def stats(self):
+        """:rtype: LatencyStats"""
+        with self._lock:
+            return LatencyStats(
+                self._count,
+                self._total / self._count if self._count else 0,
+                self._max,
+                self._last,
+            )
+
+    def reset(self):
+        with self._lock:
+            self._count = 0
+            self._total = 0
+            self._max = 0
+            self._last = 0
@@ -16,7 +16,23 @@
 # along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
 
 from copy import deepcopy
-from weakref import WeakKeyDictionary
+from enum import Enum
+
+_IMMUTABLE_TYPES = (type(None), bool, int, float, complex, str, bytes, Enum)
+
+
+def is_immutable(value):
+    """Return True if the given value is (for sure) immutable.
+
+    Tuples and frozensets are checked recursively, unknown types are
+    considered mutable.
+    """
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return True
+    if isinstance(value, (tuple, frozenset)):
+        return all(is_immutable(item) for item in value)
+
+    return False
 
 
 class Property:
@@ -35,27 +51,48 @@ class Property:
         MUST be JSON-serializable.
 
     Note:
-        Internally a WeakKeyDictionary is used, to avoid keeping objects
-        references alive
+        Values are stored in the instance `__dict__`, under the property name.
+        Until a value is set, immutable defaults are returned as they are,
+        while mutable ones are (deep)copied and stored on the first access.
     """
 
     def __init__(self, default=None, **meta):
-        self._values = WeakKeyDictionary()
+        self.name = None
 
         self.default = default
         self.meta = meta
 
+    @property
+    def default(self):
+        return self._default
+
+    @default.setter
+    def default(self, value):
+        self._default = value
+        self._copy_default = not is_immutable(value)
+
+    def __set_name__(self, owner, name):
+        # If the descriptor is bound to more names keep the first one,
+        # the values are shared anyway
+        if self.name is None:
+            self.name = name
+
     def __get__(self, instance, owner=None):
         if instance is None:
             return self
-        if instance not in self._values:
-            self._values[instance] = deepcopy(self.default)
 
-        return self._values[instance]
+        try:
+            return instance.__dict__[self.name]
+        except KeyError:
+            if not self._copy_default:
+                return self._default
+
+            value = instance.__dict__[self.name] = deepcopy(self._default)
+            return value
 
     def __set__(self, instance, value):
         if instance is not None:
-            self._values[instance] = value
+            instance.__dict__[self.name] = value
 
 
 class WriteOnceProperty(Property):
@@ -70,6 +107,42 @@ class WriteOnceProperty(Property):
             super().__set__(instance, value)
 
 
+class ProvidedProperty(Property):
+    """Property which value can be provided, on demand, by another object.
+
+    While a provider is set (see `set_provider`) reading the property returns
+    `provider(instance)`, allowing values to be computed only when needed,
+    e.g. the position of an object in a container.
+    """
+
+    def __set_name__(self, owner, name):
+        super().__set_name__(owner, name)
+        self._provider_key = f"{self.name}:provider"
+
+    def set_provider(self, instance, provider):
+        """Set, or remove (if None), the value provider of the instance.
+
+        When the provider is removed its last value is stored.
+        """
+        key = self._provider_key
+        if provider is None:
+            current = instance.__dict__.pop(key, None)
+            if current is not None:
+                instance.__dict__[self.name] = current(instance)
+        else:
+            instance.__dict__[key] = provider
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        provider = instance.__dict__.get(self._provider_key)
+        if provider is not None:
+            return provider(instance)
+
+        return super().__get__(instance, owner)
+
+
 class ProxyProperty(Property):
     """Property that use custom getter/setter, similar to builtin `property`"""
 
@@ -15,25 +15,35 @@
 # You should have received a copy of the GNU General Public License
 # along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
 
-import time
-from threading import Event
+from threading import Event, Lock
 
+from lisp.core.executor import blocking
 from lisp.core.signal import Signal
+from lisp.core.timers import MainTimerScheduler
 
 
 class RWait:
-    """Provide a resumeable-wait mechanism."""
+    """Provide a resumeable-wait mechanism.
+
+    Waits are timers of a `TimerScheduler`, no thread is needed to wait,
+    unless the blocking `wait` function is used.
+    """
+
+    def __init__(self, scheduler=None):
+        """
+        :param scheduler: The TimerScheduler to use, default to
+                          `MainTimerScheduler`
+        """
+        self._scheduler = MainTimerScheduler if scheduler is None else scheduler
+        self._lock = Lock()
 
-    def __init__(self):
         self._elapsed = 0
-        self._start_time = 0
+        self._timer = None
+        self._callback = None
+        # Set when the current wait ends, for whatever reason
+        self._done = None
         self._ended = False
 
-        self._waiting = Event()
-        self._waiting.set()
-        self._is_waiting = Event()
-        self._is_waiting.set()
-
         self.start = Signal()
         self.ended = Signal()
         self.paused = Signal()
@@ -50,71 +60,112 @@ class RWait:
         :return: True if the wait has not been interrupted by `pause` or `stop`
         :rtype: bool
         """
-        if self._is_waiting.is_set():
-            # Clear the events
-            self._waiting.clear()
-            self._is_waiting.clear()
-            # Set the start-time
-            self._start_time = time.monotonic() - self._elapsed
-
-            self.start.emit()
+        done = self._begin(timeout)
+        if done is None:
+            return False
 
-            if lock is not None:
-                lock.release()
+        if lock is not None:
+            lock.release()
 
-            # Wait for the "remaining" time
-            self._ended = not self._waiting.wait(timeout - self._elapsed)
+        with blocking():
+            done.wait()
 
-            # If the wait is ended by timeout
-            if self._ended:
-                self._elapsed = 0
-                self.ended.emit()
+        if lock is not None:
+            lock.acquire()
 
-            # Notify that we are not waiting anymore
-            self._is_waiting.set()
+        return self._ended
 
-            if lock is not None:
-                lock.acquire()
+    def begin(self, timeout, callback=None):
+        """Start (or resume) the wait, without blocking.
 
-            return self._ended
+        If the wait is paused, the remaining time is `timeout - elapsed_time`.
 
-        return False
+        :param timeout: time to wait
+        :param callback: called (without arguments) if the wait ends by
+                         timeout, from the scheduler thread, should not block
+        :return: False if already waiting
+        :rtype: bool
+        """
+        return self._begin(timeout, callback) is not None
+
+    def _begin(self, timeout, callback=None):
+        with self._lock:
+            if self._timer is not None:
+                return None
+
+            self._ended = False
+            self._callback = callback
+            self._done = done = Event()
+            self._timer = self._scheduler.call_later(
+                timeout - self._elapsed, self.__expired
+            )
+            # Take into account the time elapsed before a pause
+            self._timer.start -= self._elapsed
+
+        self.start.emit()
+        return done
+
+    def __expired(self):
+        with self._lock:
+            if self._timer is None:
+                return
+
+            self._timer = None
+            self._elapsed = 0
+            self._ended = True
+            done = self._done
+            callback = self._callback
+            self._callback = None
+
+        self.ended.emit()
+        done.set()
+
+        if callback is not None:
+            callback()
 
     def stop(self):
         """Stop the wait."""
-        if self.current_time() > 0:
-            self._waiting.set()
-            self._is_waiting.wait()
+        with self._lock:
+            if self._timer is not None:
+                if not self._scheduler.cancel(self._timer):
+                    # The wait is ending by timeout
+                    return
+
+                self._timer = None
+                self._done.set()
+            elif self._elapsed <= 0:
+                return
 
-            # Check self._ended to ensure that the wait is not ended by timeout
-            # before `self._waiting.set()` is called in this method.
-            if not self._ended:
-                self._elapsed = 0
-                self.stopped.emit()
+            self._elapsed = 0
+            self._callback = None
+
+        self.stopped.emit()
 
     def pause(self):
         """Pause the wait."""
-        if not self._is_waiting.is_set():
-            # Calculate elapsed time ASAP
-            elapsed = time.monotonic() - self._start_time
-            self._waiting.set()
-            self._is_waiting.wait()
-
-            # Check self._ended to ensure that the wait is not ended by timeout
-            # before `self._waiting.set()` is called in this method.
-            if not self._ended:
-                self._elapsed = elapsed
-                self.paused.emit()
+        with self._lock:
+            timer = self._timer
+            if timer is None or not self._scheduler.cancel(timer):
+                # Not waiting, or the wait is ending by timeout
+                return
+
+            self._elapsed = timer.elapsed(self._scheduler.time())
+            self._timer = None
+            self._callback = None
+            self._done.set()
+
+        self.paused.emit()
 
     def current_time(self):
         """Return the currently elapsed time."""
-        if self._is_waiting.is_set():
-            return self._elapsed
+        timer = self._timer
+        if timer is not None:
+            return timer.elapsed(self._scheduler.time())
 
-        return time.monotonic() - self._start_time
+        return self._elapsed
 
     def is_waiting(self):
-        return not self._is_waiting.is_set()
+        return self._timer is not None
 
     def is_paused(self):
-        return self._is_waiting.is_set() and self.current_time() > 0
+        return self._timer is None and self._elapsed > 0
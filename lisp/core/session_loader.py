@@ -0,0 +1,353 @@
+# This file is part of Linux Show Player
+#
+# Copyright 2026 Francesco Ceruti <ceppofrancy@gmail.com>
+#
+# Linux Show Player is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Linux Show Player is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
+
+import json
+import logging
+import os
+import time
+from collections import deque
+from threading import Lock
+from typing import NamedTuple
+
+from PyQt5.QtCore import QTimer
+
+from lisp.backend.media import Media
+from lisp.core.decorators import async_function
+from lisp.core.executor import PriorityExecutor
+from lisp.core.signal import Signal
+from lisp.ui.ui_utils import translate
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = json.decoder.WHITESPACE
+
+# Shared pool used to build the media of the loaded cues, building a pipeline
+# is mostly spent waiting, so more workers than CPUs are used
+LoaderExecutor = PriorityExecutor(
+    max_workers=min(32, (os.cpu_count() or 1) + 4), name="SessionLoader"
+)
+
+
+def iter_session(text):
+    """Parse a session (JSON) incrementally.
+
+    Generate (key, value) pairs for the top-level entries, the cues are
+    generated one at the time, as ("cue", cue_dict), in the file order.
+
+    The "session" entry always comes before the cues, when it follows them
+    in the file (e.g. saved with sorted keys) the cues are decoded at once,
+    and generated after it.
+
+    :raise json.JSONDecodeError: if the session is not valid
+    """
+    decoder = json.JSONDecoder()
+
+    def skip(idx):
+        return _WHITESPACE.match(text, idx).end()
+
+    def expect(idx, char):
+        idx = skip(idx)
+        if text[idx : idx + 1] != char:
+            raise json.JSONDecodeError(f"Expecting '{char}'", text, idx)
+
+        return skip(idx + 1)
+
+    def separator(idx, closing):
+        """Skip a separator, return (index, True) if more items follows."""
+        idx = skip(idx)
+        char = text[idx : idx + 1]
+        if char == ",":
+            return skip(idx + 1), True
+        if char == closing:
+            return skip(idx + 1), False
+
+        raise json.JSONDecodeError(f"Expecting ',' or '{closing}'", text, idx)
+
+    idx = expect(0, "{")
+    more = text[idx : idx + 1] != "}"
+    session = False
+    cues = []
+
+    while more:
+        key, idx = decoder.raw_decode(text, idx)
+        idx = expect(idx, ":")
+
+        if key == "cues" and not session:
+            # Cannot be used before the session, avoid decoding them one
+            # at the time
+            idx = skip(idx)
+            if text[idx : idx + 1] != "[":
+                raise json.JSONDecodeError("Expecting '['", text, idx)
+
+            cues, idx = decoder.raw_decode(text, idx)
+        elif key == "cues":
+            idx = expect(idx, "[")
+            if text[idx : idx + 1] == "]":
+                idx += 1
+            else:
+                items = True
+                while items:
+                    cue, idx = decoder.raw_decode(text, idx)
+                    yield "cue", cue
+                    idx, items = separator(idx, "]")
+        else:
+            value, idx = decoder.raw_decode(text, idx)
+            session = session or key == "session"
+            yield key, value
+
+        idx, more = separator(idx, "}")
+
+    for cue in cues:
+        yield "cue", cue
+
+
+class SessionLoadTimes(NamedTuple):
+    parse: float
+    """Time spent parsing the session file (seconds)"""
+    instantiate: float
+    """Time spent creating the cues, in the Qt thread (seconds)"""
+    pipeline: float
+    """Time spent building the media, summed across workers (seconds)"""
+    total: float
+    """Time from the start to the end of the loading (seconds)"""
+
+
+class SessionLoader:
+    """Load a session file progressively, without freezing the Qt event-loop.
+
+    * The file is parsed incrementally, in a separate thread
+    * Cues are created in the Qt thread, in small chunks, returning to the
+      event-loop between them
+    * Media are built (e.g. pipelines) by a pool of workers
+      (see `LoaderExecutor`), the media probe their duration, if needed
+    * Cues are added to the model, in order, as soon as they are ready, so
+      they can be used before the whole session is loaded
+    """
+
+    # Cues processed at every step
+    ChunkSize = 25
+    # Interval between steps when waiting for the workers (milliseconds)
+    PollInterval = 10
+
+    def __init__(self, app, session_file, new_session):
+        """
+        :param app: The application
+        :type app: lisp.application.Application
+        :param session_file: The session file path
+        :param new_session: Called with the session properties (dict), in the
+                            Qt thread, before adding any cue to the model
+        """
+        # (loaded, total), total is 0 until the file is completely parsed
+        self.progress = Signal()
+        # (SessionLoadTimes)
+        self.finished = Signal()
+        # Emitted when the session cannot be loaded
+        self.failed = Signal()
+
+        self._app = app
+        self._session_file = session_file
+        self._new_session = new_session
+
+        self._lock = Lock()
+        self._cancelled = False
+
+        # Parsed items, waiting to be processed, as (key, value) pairs
+        self._parsed = deque()
+        self._parse_done = False
+        self._parse_error = None
+
+        self._session_created = False
+        # Created cues, in session order, None for cues failed to load
+        self._cues = []
+        # For each cue, True when its media (if any) is ready
+        self._ready = []
+        self._added = 0
+
+        self._start = 0
+        self._parse_time = 0
+        self._instantiate_time = 0
+        self._pipeline_time = 0
+
+    @property
+    def session_file(self):
+        return self._session_file
+
+    def start(self):
+        self._start = time.monotonic()
+        self._parse()
+        QTimer.singleShot(0, self._step)
+
+    def cancel(self):
+        """Stop the loading, the cues already added to the model are kept."""
+        self._cancelled = True
+
+    @async_function
+    def _parse(self):
+        start = time.monotonic()
+        try:
+            with open(self._session_file, mode="r", encoding="utf-8") as file:
+                text = file.read()
+
+            for item in iter_session(text):
+                if self._cancelled:
+                    break
+
+                self._parsed.append(item)
+        except Exception as e:
+            self._parse_error = e
+        finally:
+            self._parse_time = time.monotonic() - start
+            self._parse_done = True
+
+    def _step(self):
+        if self._cancelled:
+            return
+
+        try:
+            if self._parse_error is not None:
+                raise self._parse_error
+
+            start = time.monotonic()
+            self._instantiate()
+            self._add_ready()
+            self._instantiate_time += time.monotonic() - start
+
+            parsed = self._parse_done and not self._parsed
+            if parsed and not self._session_created:
+                raise ValueError("Missing session properties")
+        except Exception:
+            self.cancel()
+            logger.exception(
+                translate(
+                    "ApplicationError",
+                    'Error while reading the session file "{}"',
+                ).format(self._session_file)
+            )
+            self.failed.emit()
+            return
+
+        total = len(self._cues) if parsed else 0
+        if parsed and self._added == total:
+            self._finish()
+        else:
+            self.progress.emit(self._added, total)
+            QTimer.singleShot(
+                0 if self._parsed else self.PollInterval, self._step
+            )
+
+    def _instantiate(self):
+        for _ in range(self.ChunkSize):
+            if not self._parsed:
+                break
+
+            key, value = self._parsed.popleft()
+            if key == "session":
+                self._new_session(value)
+                self._session_created = True
+            elif key == "cue":
+                self._instantiate_cue(value)
+
+    def _instantiate_cue(self, cue_dict):
+        cue_type = cue_dict.pop("_type_", "Undefined")
+        cue_id = cue_dict.pop("id")
+
+        cue = None
+        media_dict = None
+        try:
+            cue = self._app.cue_factory.create_cue(cue_type, cue_id=cue_id)
+            # The media are loaded by the workers
+            if isinstance(getattr(cue, "media", None), Media):
+                media_dict = cue_dict.pop("media", None)
+
+            cue.update_properties(cue_dict)
+        except Exception:
+            cue = None
+            self._cue_error(cue_dict.get("name", "No name"))
+
+        with self._lock:
+            index = len(self._cues)
+            self._cues.append(cue)
+            self._ready.append(cue is None or media_dict is None)
+
+        if cue is not None and media_dict is not None:
+            LoaderExecutor.submit(
+                self._load_media, args=(index, cue, media_dict)
+            )
+
+    def _load_media(self, index, cue, media_dict):
+        if self._cancelled:
+            return
+
+        pipeline_time = 0
+        try:
+            start = time.monotonic()
+            cue.media.update_properties(media_dict)
+            pipeline_time = time.monotonic() - start
+        except Exception:
+            self._cue_error(cue.name)
+            cue = None
+
+        with self._lock:
+            self._pipeline_time += pipeline_time
+            self._cues[index] = cue
+            self._ready[index] = True
+
+    def _add_ready(self):
+        if not self._session_created:
+            return
+
+        for _ in range(self.ChunkSize):
+            with self._lock:
+                if (
+                    self._added >= len(self._cues)
+                    or not self._ready[self._added]
+                ):
+                    break
+
+                cue = self._cues[self._added]
+
+            self._added += 1
+            if cue is not None:
+                try:
+                    self._app.cue_model.add(cue)
+                except Exception:
+                    self._cue_error(cue.name)
+
+    def _cue_error(self, name):
+        logger.exception(
+            translate(
+                "ApplicationError",
+                'Unable to create the cue "{}"',
+            ).format(name)
+        )
+
+    def _finish(self):
+        times = SessionLoadTimes(
+            parse=self._parse_time,
+            instantiate=self._instantiate_time,
+            pipeline=self._pipeline_time,
+            total=time.monotonic() - self._start,
+        )
+
+        logger.debug(
+            f"Session loaded, {self._added} cues in {times.total:.3f}s "
+            f"(parse: {times.parse:.3f}s, "
+            f"instantiate: {times.instantiate:.3f}s, "
+            f"pipeline: {times.pipeline:.3f}s)"
+        )
+
+        self.finished.emit(times)
@@ -27,6 +27,7 @@ from PyQt5.QtCore import QEvent, QObject
 from PyQt5.QtWidgets import QApplication
 
 from lisp.core.decorators import async_function
+from lisp.core.executor import CueExecutor, TaskPriority
 from lisp.core.util import weak_call_proxy
 
 __all__ = ["Signal", "Connection"]
@@ -51,6 +52,8 @@ def slot_id(slot_callable):
 class Slot:
     """Synchronous slot."""
 
+    __slots__ = ("_reference", "_callback", "_slot_id", "_no_args")
+
     def __init__(self, slot_callable, callback=None):
         if isinstance(slot_callable, MethodType):
             self._reference = weakref.WeakMethod(slot_callable, self._expired)
@@ -65,12 +68,16 @@ class Slot:
 
     def call(self, *args, **kwargs):
         """Call the callable object within the given parameters."""
+        # Dereference only once, the referent may die between two calls
+        target = self._reference()
+        if target is None:
+            return
+
         try:
-            if self.is_alive():
-                if self._no_args:
-                    self._reference()()
-                else:
-                    self._reference()(*args, **kwargs)
+            if self._no_args:
+                target()
+            else:
+                target(*args, **kwargs)
         except Exception as e:
             logger.warning(str(e), exc_info=True)
 
@@ -90,14 +97,32 @@ class Slot:
 class AsyncSlot(Slot):
     """Asynchronous slot, NOT queued, any call is performed in a new thread."""
 
+    __slots__ = ()
+
     @async_function
     def call(self, *args, **kwargs):
         super().call(*args, **kwargs)
 
 
+class PooledSlot(Slot):
+    """Asynchronous slot, calls are queued, in order, to the shared
+    :class:`lisp.core.executor.CueExecutor` with a low priority.
+    """
+
+    __slots__ = ()
+
+    @async_function(
+        executor=CueExecutor, priority=TaskPriority.Low, serial=True
+    )
+    def call(self, *args, **kwargs):
+        super().call(*args, **kwargs)
+
+
 class QtSlot(Slot):
     """Qt direct slot, execute the call inside the qt-event-loop."""
 
+    __slots__ = ("_invoker",)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -121,6 +146,8 @@ class QtSlot(Slot):
 class QtQueuedSlot(QtSlot):
     """Qt queued (safe) slot, execute the call inside the qt-event-loop."""
 
+    __slots__ = ()
+
     def call(self, *args, **kwargs):
         QApplication.instance().postEvent(
             self._invoker, self._event(*args, **kwargs)
@@ -142,6 +169,7 @@ class Connection(Enum):
 
     Direct = Slot
     Async = AsyncSlot
+    Pooled = PooledSlot
     QtDirect = QtSlot
     QtQueued = QtQueuedSlot
 
@@ -162,6 +190,10 @@ class Signal:
         * Internally, weak-references are used, so disconnection is not needed
           before delete a slot-owner object.
         * Signals with "arguments" can be connected to slot without arguments
+        * Emitting does not acquire any lock, slots are called from an
+          immutable snapshot, replaced on connect/disconnect. A slot
+          disconnected while an emission is in progress might still be called
+          by that emission.
 
     .. warning::
         Because of weakrefs, connecting like the following can't work:
@@ -173,6 +205,7 @@ class Signal:
 
     def __init__(self):
         self.__slots = {}
+        self.__snapshot = ()
         self.__lock = RLock()
 
     def connect(self, slot_callable, mode=Connection.Direct):
@@ -196,6 +229,7 @@ class Signal:
                     slot_callable,
                     weak_call_proxy(weakref.WeakMethod(self.__remove_slot)),
                 )
+                self.__snapshot = tuple(self.__slots.values())
 
     def disconnect(self, slot=None):
         """Disconnect the given slot, or all if no slot is specified.
@@ -207,16 +241,22 @@ class Signal:
         else:
             with self.__lock:
                 self.__slots.clear()
+                self.__snapshot = ()
+
+    def is_connected(self):
+        """Return True if at least one slot is connected."""
+        return bool(self.__snapshot)
 
     def emit(self, *args, **kwargs):
         """Emit the signal within the given arguments"""
-        with self.__lock:
-            for slot in self.__slots.values():
-                try:
-                    slot.call(*args, **kwargs)
-                except Exception:
-                    traceback.print_exc()
+        # The snapshot is replaced (never mutated), no lock is needed
+        for slot in self.__snapshot:
+            try:
+                slot.call(*args, **kwargs)
+            except Exception:
+                traceback.print_exc()
 
     def __remove_slot(self, id_):
         with self.__lock:
-            self.__slots.pop(id_, None)
+            if self.__slots.pop(id_, None) is not None:
+                self.__snapshot = tuple(self.__slots.values())
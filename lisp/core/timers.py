@@ -0,0 +1,144 @@
+# This file is part of Linux Show Player
+#
+# Copyright 2026 Francesco Ceruti <ceppofrancy@gmail.com>
+#
+# Linux Show Player is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Linux Show Player is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
+
+import logging
+import time
+from heapq import heappop, heappush
+from itertools import count
+from threading import Condition, Thread
+
+logger = logging.getLogger(__name__)
+
+
+class Timer:
+    """A callback scheduled via `TimerScheduler`."""
+
+    __slots__ = ("start", "deadline", "callback", "cancelled", "fired")
+
+    def __init__(self, start, deadline, callback):
+        self.start = start
+        self.deadline = deadline
+        self.callback = callback
+        self.cancelled = False
+        self.fired = False
+
+    def elapsed(self, now=None):
+        """Seconds elapsed since the timer was scheduled (max to deadline)."""
+        now = time.monotonic() if now is None else now
+        return min(now, self.deadline) - self.start
+
+    def remaining(self, now=None):
+        """Seconds remaining to the deadline."""
+        now = time.monotonic() if now is None else now
+        return max(self.deadline - now, 0)
+
+
+class TimerScheduler:
+    """Fire one-shot timers, ordered in a heap, from a single thread.
+
+    * The thread sleeps until the nearest deadline, the last millisecond
+      is spent yielding, to fire the callbacks with sub-millisecond accuracy
+    * Callbacks are called from the scheduler thread, they should not block,
+      longer operations should be dispatched elsewhere
+    """
+
+    # Below this threshold (seconds) the thread doesn't sleep
+    SpinThreshold = 0.001
+
+    def __init__(self, name="TimerScheduler"):
+        self._name = name
+        self._cond = Condition()
+        self._counter = count()
+        # Heap of (deadline, sequence, timer)
+        self._timers = []
+        self._thread = None
+
+    def time(self):
+        """The scheduler time (monotonic) in seconds."""
+        return time.monotonic()
+
+    def call_later(self, delay, callback):
+        """Call `callback` (without arguments) after `delay` seconds.
+
+        :rtype: Timer
+        """
+        now = time.monotonic()
+        timer = Timer(now, now + max(delay, 0), callback)
+
+        with self._cond:
+            heappush(self._timers, (timer.deadline, next(self._counter), timer))
+
+            if self._thread is None:
+                self._thread = Thread(
+                    target=self._run, name=self._name, daemon=True
+                )
+                self._thread.start()
+
+            self._cond.notify()
+
+        return timer
+
+    def cancel(self, timer):
+        """Cancel the timer.
+
+        :return: False if the timer has already been fired (or cancelled)
+        """
+        with self._cond:
+            if timer.fired or timer.cancelled:
+                return False
+
+            # Removed lazily from the heap
+            timer.cancelled = True
+            return True
+
+    def pending(self):
+        """Number of timers waiting to be fired."""
+        with self._cond:
+            return sum(1 for *_, t in self._timers if not t.cancelled)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while True:
+                    # Discard cancelled timers
+                    while self._timers and self._timers[0][2].cancelled:
+                        heappop(self._timers)
+
+                    if not self._timers:
+                        self._cond.wait()
+                        continue
+
+                    timeout = self._timers[0][0] - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    elif timeout > self.SpinThreshold:
+                        self._cond.wait(timeout - self.SpinThreshold)
+                    else:
+                        # Yield without releasing the lock for too long
+                        self._cond.wait(0)
+
+                timer = heappop(self._timers)[2]
+                timer.fired = True
+
+            try:
+                timer.callback()
+            except Exception:
+                logger.warning("Timer callback error", exc_info=True)
+
+
+# Shared scheduler
+MainTimerScheduler = TimerScheduler()
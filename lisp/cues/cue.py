@@ -15,13 +15,19 @@
 # You should have received a copy of the GNU General Public License
 # along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
 
+from functools import partial
 from threading import Lock
 from uuid import uuid4
 
 from lisp.core.decorators import async_function
+from lisp.core.executor import CueExecutor, TaskPriority
 from lisp.core.fade_functions import FadeInType, FadeOutType
 from lisp.core.has_properties import HasProperties
-from lisp.core.properties import Property, WriteOnceProperty
+from lisp.core.properties import (
+    Property,
+    ProvidedProperty,
+    WriteOnceProperty,
+)
 from lisp.core.rwait import RWait
 from lisp.core.signal import Signal
 from lisp.core.util import EqEnum, typename
@@ -116,7 +122,7 @@ class Cue(HasProperties):
     _type_ = WriteOnceProperty()
     id = WriteOnceProperty()
     name = Property(default="Untitled")
-    index = Property(default=-1)
+    index = ProvidedProperty(default=-1)
     description = Property(default="")
     stylesheet = Property(default="")
     duration = Property(default=0)
@@ -260,7 +266,9 @@ class Cue(HasProperties):
             type_class, self.app.conf.get("cue.fadeActionType"), default
         )
 
-    @async_function
+    @async_function(
+        executor=CueExecutor, priority=TaskPriority.High, serial=True
+    )
     def start(self, fade=False):
         """Start the cue."""
 
@@ -277,66 +285,79 @@ class Cue(HasProperties):
             # we need this to decide if we should start a post-wait
             init_state = self._state
 
-            # PreWait (blocking)
+            # PreWait (not blocking), the cue is started when it ends
             if self.pre_wait and init_state & (
                 CueState.IsStopped | CueState.PreWait_Pause
             ):
                 self._state = CueState.PreWait
-
-                # Start the wait, the lock is released during the wait and
-                # re-acquired after
-                if self._prewait.wait(self.pre_wait, lock=self._st_lock):
-                    # PreWait ended
-                    self._state ^= CueState.PreWait
-                else:
-                    # PreWait interrupted, check the state to be correct
-                    if self._state & CueState.PreWait:
-                        self._state ^= CueState.PreWait
-                    return
-
-            # Cue-Start, the __start__ function should not block
-            if init_state & (
-                CueState.IsStopped | CueState.Pause | CueState.PreWait_Pause
-            ):
-                running = self.__start__(fade)
-                self._state = CueState.Running
-                self.started.emit(self)
-
-                if not running:
-                    self._ended()
-
-            # PostWait (blocking)
-            if init_state & (
-                CueState.IsStopped
-                | CueState.PreWait_Pause
-                | CueState.PostWait_Pause
-            ):
-                if (
-                    self.next_action == CueNextAction.TriggerAfterWait
-                    or self.next_action == CueNextAction.SelectAfterWait
-                ):
-                    if self._state & CueState.PostWait_Pause:
-                        self._state ^= CueState.PostWait_Pause
-
-                    self._state |= CueState.PostWait
-
-                    # Start the wait, the lock is released during the wait and
-                    # re-acquired after
-                    if self._postwait.wait(self.post_wait, lock=self._st_lock):
-                        # PostWait ended
-                        self._state ^= CueState.PostWait
-                        self.next.emit(self)
-                    elif self._state & CueState.PostWait:
-                        # PostWait interrupted, check the state to be correct
-                        self._state ^= CueState.PostWait
-
-                    # If the cue was only post-waiting we remain with
-                    # an invalid state
-                    if not self._state:
-                        self._state = CueState.Stop
+                self._prewait.begin(
+                    self.pre_wait,
+                    partial(self.__prewait_ended, init_state, fade),
+                )
+            else:
+                self.__start_after_prewait(init_state, fade)
         finally:
             self._st_lock.release()
 
+    @async_function(
+        executor=CueExecutor, priority=TaskPriority.High, serial=True
+    )
+    def __prewait_ended(self, init_state, fade):
+        with self._st_lock:
+            # PreWait interrupted after the timeout (e.g. stopped)
+            if not self._state & CueState.PreWait:
+                return
+
+            self._state ^= CueState.PreWait
+            self.__start_after_prewait(init_state, fade)
+
+    def __start_after_prewait(self, init_state, fade):
+        """Start the cue, and the post-wait, `_st_lock` must be acquired."""
+
+        # Cue-Start, the __start__ function should not block
+        if init_state & (
+            CueState.IsStopped | CueState.Pause | CueState.PreWait_Pause
+        ):
+            running = self.__start__(fade)
+            self._state = CueState.Running
+            self.started.emit(self)
+
+            if not running:
+                self._ended()
+
+        # PostWait (not blocking)
+        if init_state & (
+            CueState.IsStopped
+            | CueState.PreWait_Pause
+            | CueState.PostWait_Pause
+        ):
+            if (
+                self.next_action == CueNextAction.TriggerAfterWait
+                or self.next_action == CueNextAction.SelectAfterWait
+            ):
+                if self._state & CueState.PostWait_Pause:
+                    self._state ^= CueState.PostWait_Pause
+
+                self._state |= CueState.PostWait
+                self._postwait.begin(self.post_wait, self.__postwait_ended)
+
+    @async_function(
+        executor=CueExecutor, priority=TaskPriority.High, serial=True
+    )
+    def __postwait_ended(self):
+        with self._st_lock:
+            # PostWait interrupted after the timeout (e.g. stopped)
+            if not self._state & CueState.PostWait:
+                return
+
+            self._state ^= CueState.PostWait
+            self.next.emit(self)
+
+            # If the cue was only post-waiting we remain with
+            # an invalid state
+            if not self._state:
+                self._state = CueState.Stop
+
     def resume(self, fade=False):
         """Restart the cue if paused."""
         if self._state & CueState.IsPaused:
@@ -361,7 +382,9 @@ class Cue(HasProperties):
         """
         return False
 
-    @async_function
+    @async_function(
+        executor=CueExecutor, priority=TaskPriority.High, serial=True
+    )
     def stop(self, fade=False):
         """Stop the cue."""
 
@@ -383,6 +406,10 @@ class Cue(HasProperties):
                     )
                     self._postwait.stop()
 
+                    # If the cue was only post-waiting
+                    if not self._state:
+                        self._state = CueState.Stop
+
                 # Stop the cue
                 if self._state & (CueState.Running | CueState.Pause):
                     # Here the __stop__ function should release and re-acquire
@@ -417,7 +444,9 @@ class Cue(HasProperties):
         """
         return False
 
-    @async_function
+    @async_function(
+        executor=CueExecutor, priority=TaskPriority.High, serial=True
+    )
     def pause(self, fade=False):
         """Pause the cue."""
 
@@ -471,7 +500,9 @@ class Cue(HasProperties):
         """
         return False
 
-    @async_function
+    @async_function(
+        executor=CueExecutor, priority=TaskPriority.High, serial=True
+    )
     def interrupt(self, fade=False):
         """Interrupt the cue.
 
@@ -492,6 +523,10 @@ class Cue(HasProperties):
                     )
                     self._postwait.stop()
 
+                    # If the cue was only post-waiting
+                    if not self._state:
+                        self._state = CueState.Stop
+
                 # Interrupt the cue
                 if self._state & (CueState.Running | CueState.Pause):
                     self.__interrupt__(fade)
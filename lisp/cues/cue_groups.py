@@ -0,0 +1,163 @@
+# This file is part of Linux Show Player
+#
+# Copyright 2026 Francesco Ceruti <ceppofrancy@gmail.com>
+#
+# Linux Show Player is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Linux Show Player is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
+
+import weakref
+from threading import RLock
+
+from lisp.core.signal import Signal
+from lisp.cues.group_cue import GroupCue
+
+
+class CueGroups:
+    """Index the parent/child relations of the GroupCue(s) in a CueModel.
+
+    The index is updated incrementally, when groups are added or removed, or
+    when their `children`/`open` properties are changed.
+    Children are resolved once (until the group, or the children, change),
+    and kept as weak-references.
+    """
+
+    def __init__(self, cue_model):
+        """
+        :type cue_model: lisp.cues.cue_model.CueModel
+        """
+        # (cue_ids) the cues that could have been shown/hidden
+        self.visibility_changed = Signal()
+
+        self._model = cue_model
+
+        self.__lock = RLock()
+        # {group_id: (child_id, ...)}
+        self.__children = {}
+        # {child_id: {group_id: None}}, used as ordered sets
+        self.__parents = {}
+        # {group_id: [weakref(child), ...]}, resolved on demand
+        self.__resolved = {}
+
+        cue_model.item_added.connect(self.__cue_added)
+        cue_model.item_removed.connect(self.__cue_removed)
+        cue_model.model_reset.connect(self.__reset)
+        cue_model.cue_properties_changed.connect(self.__properties_changed)
+
+    def children(self, group):
+        """Return the child cues of the given group, in the group order.
+
+        Only the children in the model are returned, never the group itself.
+        """
+        with self.__lock:
+            refs = self.__resolved.get(group.id)
+            if refs is None:
+                refs = self.__resolved[group.id] = self.__resolve(group)
+
+        children = []
+        for ref in refs:
+            child = ref()
+            if child is not None:
+                children.append(child)
+
+        return children
+
+    def parents(self, cue):
+        """Return the groups that have the given cue as a child."""
+        with self.__lock:
+            groups = tuple(self.__parents.get(cue.id, ()))
+
+        return [
+            group for group in map(self._model.get, groups) if group is not None
+        ]
+
+    def is_hidden(self, cue):
+        """True if the cue is a child of a closed group."""
+        return any(not group.open for group in self.parents(cue))
+
+    def __resolve(self, group):
+        refs = []
+        for child_id in self.__children.get(group.id, ()):
+            child = self._model.get(child_id)
+            if child is not None and child is not group:
+                refs.append(weakref.ref(child))
+
+        return refs
+
+    def __set_children(self, group, children):
+        """Replace the children of the group, return the affected ids."""
+        with self.__lock:
+            old = self.__children.pop(group.id, ())
+            for child_id in old:
+                parents = self.__parents.get(child_id)
+                if parents is not None:
+                    parents.pop(group.id, None)
+                    if not parents:
+                        del self.__parents[child_id]
+
+            if children:
+                self.__children[group.id] = children = tuple(children)
+                for child_id in children:
+                    self.__parents.setdefault(child_id, {})[group.id] = None
+
+            self.__resolved.pop(group.id, None)
+
+        return set(old).union(children)
+
+    def __invalidate(self, cue):
+        """Invalidate the resolved children of the groups of the given cue."""
+        with self.__lock:
+            for group_id in self.__parents.get(cue.id, ()):
+                self.__resolved.pop(group_id, None)
+
+            return cue.id in self.__parents
+
+    def __cue_added(self, cue):
+        affected = set()
+        if self.__invalidate(cue):
+            affected.add(cue.id)
+        if isinstance(cue, GroupCue):
+            affected.update(self.__set_children(cue, cue.children))
+
+        if affected:
+            self.visibility_changed.emit(affected)
+
+    def __cue_removed(self, cue):
+        affected = set()
+        if self.__invalidate(cue):
+            affected.add(cue.id)
+        if isinstance(cue, GroupCue):
+            affected.update(self.__set_children(cue, ()))
+
+        if affected:
+            self.visibility_changed.emit(affected)
+
+    def __properties_changed(self, cue, properties):
+        if not isinstance(cue, GroupCue):
+            return
+
+        if "children" in properties:
+            affected = self.__set_children(cue, properties["children"])
+        elif "open" in properties:
+            with self.__lock:
+                affected = set(self.__children.get(cue.id, ()))
+        else:
+            return
+
+        if affected:
+            self.visibility_changed.emit(affected)
+
+    def __reset(self):
+        with self.__lock:
+            self.__children.clear()
+            self.__parents.clear()
+            self.__resolved.clear()
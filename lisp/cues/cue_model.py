@@ -15,8 +15,14 @@
 # You should have received a copy of the GNU General Public License
 # along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
 
+from threading import Lock
+
+from sortedcontainers import SortedKeyList
+
 from lisp.core.model import Model
+from lisp.core.signal import Signal
 from lisp.cues.cue import Cue, CueAction
+from lisp.cues.cue_groups import CueGroups
 
 
 class CueModel(Model):
@@ -24,17 +30,56 @@ class CueModel(Model):
 
     The model can be iterated to retrieve the cues, to get id-cue pairs
     use the items() function, to get only the id(s) use the keys() function.
+
+    The cues are kept in insertion order, and indexed, to allow fast queries:
+     * by insertion position, in logarithmic time (see `item` and `position`)
+     * by type (see `filter`)
+     * by running state (see `running` and `is_running`)
+     * by name (see `find`)
+     * by group membership (see `groups`)
+
+    The cues state and property changes are also notified by the model, so
+    views don't need to connect to every cue.
     """
 
     def __init__(self):
         super().__init__()
+        # (cue) when a cue is started, or stops running (see `running`)
+        self.cue_state_changed = Signal()
+        # (cue, {name: value}) when properties of a cue are changed, once
+        # per batch (see `HasProperties.batch_update`)
+        self.cue_properties_changed = Signal()
+
         self.__cues = {}
 
+        # Cues sorted by insertion order {cue_id: insertion_number}
+        self.__insertions = {}
+        self.__inserted = 0
+        self.__order = SortedKeyList(key=lambda c: self.__insertions[c.id])
+
+        # {cue_type: {cue_id: cue}}, for the exact type of the cues
+        self.__types = {}
+        # {cue_class: (cue_type, ...)}, the indexed subtypes of a class
+        self.__subtypes = {}
+
+        # {property_name: {value: {cue_id: cue}}}
+        self.__by_property = {"name": {}}
+        # {cue_id: {property_name: value}}, the indexed values
+        self.__keys = {}
+
+        # {cue_id: cue}, updated by the cues signals, in starting order
+        self.__running = {}
+        self.__running_lock = Lock()
+
+        # Children of the GroupCue(s)
+        self.groups = CueGroups(self)
+
     def add(self, cue):
         if cue.id in self.__cues:
             raise ValueError("the cue is already in the model")
 
         self.__cues[cue.id] = cue
+        self.__index(cue)
         self.item_added.emit(cue)
 
     def remove(self, cue):
@@ -42,7 +87,9 @@ class CueModel(Model):
 
     def pop(self, cue_id):
         """:rtype: Cue"""
-        cue = self.__cues.pop(cue_id)
+        cue = self.__cues[cue_id]
+        self.__unindex(cue)
+        del self.__cues[cue_id]
 
         # Try to interrupt/stop the cue
         if CueAction.Interrupt in cue.CueActions:
@@ -61,6 +108,27 @@ class CueModel(Model):
         """
         return self.__cues.get(cue_id, default)
 
+    def item(self, position):
+        """Return the cue at the given position (insertion order).
+
+        The position is not the index of the cue in the layout (which can be
+        reordered), for that use `CueLayout.cue_at`.
+
+        :raise IndexError: if the position is out of range
+        :rtype: Cue
+        """
+        return self.__order[position]
+
+    def position(self, cue):
+        """Return the position of the given cue (insertion order).
+
+        :raise ValueError: if the cue is not in the model
+        """
+        if cue.id not in self.__cues:
+            raise ValueError("the cue is not in the model")
+
+        return self.__order.index(cue)
+
     def items(self):
         """Return a set-like object proving a view on model items (id, cue)"""
         return self.__cues.items()
@@ -70,14 +138,127 @@ class CueModel(Model):
         return self.__cues.keys()
 
     def reset(self):
+        for cue in self.__cues.values():
+            self.__disconnect(cue)
+
         self.__cues.clear()
+        self.__order.clear()
+        self.__insertions.clear()
+        self.__types.clear()
+        self.__subtypes.clear()
+        for index in self.__by_property.values():
+            index.clear()
+        self.__keys.clear()
+        with self.__running_lock:
+            self.__running.clear()
+
         self.model_reset.emit()
 
     def filter(self, cue_class=Cue):
-        """Return an iterator over cues that are instances of the given class"""
-        for cue in self.__cues.values():
-            if isinstance(cue, cue_class):
-                yield cue
+        """Return an iterator over cues that are instances of the given class
+
+        Cues of the same type are returned in insertion order.
+        """
+        subtypes = self.__subtypes.get(cue_class)
+        if subtypes is None:
+            subtypes = tuple(
+                cue_type
+                for cue_type in self.__types
+                if issubclass(cue_type, cue_class)
+            )
+            self.__subtypes[cue_class] = subtypes
+
+        for cue_type in subtypes:
+            yield from tuple(self.__types.get(cue_type, {}).values())
+
+    def running(self):
+        """Return a list of the running cues, in starting order."""
+        with self.__running_lock:
+            return list(self.__running.values())
+
+    def is_running(self, cue):
+        """Return True if the given cue is running (started and not ended)."""
+        return cue.id in self.__running
+
+    def find(self, name):
+        """Return a list of the cues with the given name, in insertion order."""
+        return list(self.__by_property["name"].get(name, {}).values())
+
+    def __index(self, cue):
+        self.__insertions[cue.id] = self.__inserted
+        self.__inserted += 1
+        self.__order.add(cue)
+
+        cue_type = type(cue)
+        if cue_type not in self.__types:
+            self.__types[cue_type] = {}
+            self.__subtypes.clear()
+        self.__types[cue_type][cue.id] = cue
+
+        keys = self.__keys[cue.id] = {}
+        for name, index in self.__by_property.items():
+            keys[name] = value = getattr(cue, name)
+            index.setdefault(value, {})[cue.id] = cue
+
+        cue.properties_changed.connect(self.__properties_changed)
+        cue.started.connect(self.__cue_started)
+        cue.paused.connect(self.__cue_ended)
+        cue.stopped.connect(self.__cue_ended)
+        cue.interrupted.connect(self.__cue_ended)
+        cue.end.connect(self.__cue_ended)
+        cue.error.connect(self.__cue_ended)
+
+    def __unindex(self, cue):
+        self.__disconnect(cue)
+
+        self.__order.remove(cue)
+        del self.__insertions[cue.id]
+
+        self.__types[type(cue)].pop(cue.id)
+        for name, value in self.__keys.pop(cue.id).items():
+            self.__remove_from(self.__by_property[name], value, cue)
+        self.__cue_ended(cue)
+
+    def __disconnect(self, cue):
+        cue.properties_changed.disconnect(self.__properties_changed)
+        cue.started.disconnect(self.__cue_started)
+        cue.paused.disconnect(self.__cue_ended)
+        cue.stopped.disconnect(self.__cue_ended)
+        cue.interrupted.disconnect(self.__cue_ended)
+        cue.end.disconnect(self.__cue_ended)
+        cue.error.disconnect(self.__cue_ended)
+
+    def __properties_changed(self, cue, properties):
+        keys = self.__keys.get(cue.id)
+        if keys is not None:
+            for name, index in self.__by_property.items():
+                if name in properties:
+                    value = properties[name]
+                    self.__remove_from(index, keys[name], cue)
+                    keys[name] = value
+                    index.setdefault(value, {})[cue.id] = cue
+
+        self.cue_properties_changed.emit(cue, properties)
+
+    def __cue_started(self, cue):
+        with self.__running_lock:
+            self.__running[cue.id] = cue
+
+        self.cue_state_changed.emit(cue)
+
+    def __cue_ended(self, cue):
+        with self.__running_lock:
+            self.__running.pop(cue.id, None)
+
+        self.cue_state_changed.emit(cue)
+
+    @staticmethod
+    def __remove_from(index, key, cue):
+        cues = index.get(key)
+        if cues is not None:
+            cues.pop(cue.id, None)
+            if not cues:
+                del index[key]
 
     def __iter__(self):
         return self.__cues.values().__iter__()
@@ -15,10 +15,11 @@
 # You should have received a copy of the GNU General Public License
 # along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
 
-from enum import IntEnum
+import time
+from threading import Lock
 from weakref import WeakValueDictionary
 
-from lisp.core.clock import Clock_33
+from lisp.core.clock import MasterClock
 from lisp.core.decorators import locked_method
 from lisp.core.signal import Connection, Signal
 from lisp.cues.cue import CueState
@@ -39,22 +40,121 @@ class MetaCueTime(type):
         return instance
 
 
+class CueTimeBroadcaster:
+    """Sample the current time of the running cues at a fixed interval.
+
+    At every tick, each cue is sampled only once, from the clock thread, the
+    value is cached (with a timestamp) and all the values are delivered in a
+    single batch, to the `updated` signal ({cue_id: time}) and to the
+    `notify` signal of the registered `CueTime`(s).
+
+    When `qt` is True, the batch is delivered inside the Qt event-loop, using
+    one queued event per tick, otherwise it's delivered from the clock thread.
+    """
+
+    def __init__(self, interval, qt=True, clock=None):
+        """
+        :param interval: the sampling interval in milliseconds
+        :param qt: deliver the batches inside the Qt event-loop
+        :param clock: the ClockScheduler to use, default to `MasterClock`
+        """
+        self.updated = Signal()
+
+        self._interval = interval
+        self._qt = qt
+        self._clock = MasterClock if clock is None else clock
+
+        self._lock = Lock()
+        # {CueTime: None}, used as an ordered set
+        self._times = {}
+        # Immutable copy of the registered CueTime(s), used while sampling
+        self._snapshot = ()
+        # {cue_id: (time, timestamp)}
+        self._samples = {}
+        # Created on first use, a Qt application could be needed
+        self._batch = None
+
+    def add(self, cue_time):
+        """Start sampling the cue of the given CueTime."""
+        with self._lock:
+            if cue_time in self._times:
+                return
+
+            if self._batch is None:
+                self._batch = Signal()
+                self._batch.connect(
+                    self._dispatch,
+                    Connection.QtQueued if self._qt else Connection.Direct,
+                )
+
+            if not self._times:
+                self._clock.subscribe(self._interval, self._tick)
+
+            self._times[cue_time] = None
+            self._snapshot = tuple(self._times)
+
+    def remove(self, cue_time):
+        """Stop sampling the cue of the given CueTime, if registered."""
+        with self._lock:
+            if cue_time not in self._times:
+                return
+
+            del self._times[cue_time]
+            self._snapshot = tuple(self._times)
+            self._samples.pop(cue_time.cue.id, None)
+
+            if not self._times:
+                self._clock.unsubscribe(self._interval, self._tick)
+
+    def sample(self, cue):
+        """The last sampled (time, timestamp) for the given cue, or None.
+
+        The timestamp is given in seconds, as returned by `time.monotonic`.
+        """
+        return self._samples.get(cue.id)
+
+    def _tick(self):
+        timestamp = time.monotonic()
+        batch = {}
+
+        for cue_time in self._snapshot:
+            cue = cue_time.cue
+            if cue.id not in batch and cue.state & (
+                CueState.Running ^ CueState.Pause
+            ):
+                batch[cue.id] = current = cue.current_time()
+                self._samples[cue.id] = (current, timestamp)
+
+        if batch:
+            self._batch.emit(batch)
+
+    def _dispatch(self, batch):
+        for cue_time in self._snapshot:
+            current = batch.get(cue_time.cue.id)
+            if current is not None:
+                cue_time.notify.emit(current)
+
+        self.updated.emit(batch)
+
+
 class CueTime(metaclass=MetaCueTime):
     """Provide timing for a Cue.
 
     Once created the notify signal provide timing for the given cue.
-    The current time is queried using `Cue.current_time()`.
+    The current time is sampled, together with all the other running cues,
+    by a `CueTimeBroadcaster`.
 
     .. note::
-        The notify signal is emitted only when the cue is running.
+        The notify signal is emitted only when the cue is running, inside
+        the Qt event-loop.
     """
 
-    _Clock = Clock_33
+    _Broadcaster = CueTimeBroadcaster(33)
 
     def __init__(self, cue):
         self.notify = Signal()
 
-        self._clock = self._Clock
+        self._broadcaster = self._Broadcaster
         self._active = False
         self._cue = cue
         self._cue.changed("duration").connect(self.__init)
@@ -83,67 +183,12 @@ class CueTime(metaclass=MetaCueTime):
             self.stop()
             self._active = False
 
-    def __notify(self):
-        """Notify the cue current-time"""
-        if self._cue.state & (CueState.Running ^ CueState.Pause):
-            self.notify.emit(self._cue.current_time())
-
-    def start(self):
-        self._clock.add_callback(self.__notify)
-
-    def stop(self):
-        try:
-            self._clock.remove_callback(self.__notify)
-        except Exception:
-            # TODO: catch only the exception when the callback is not registered
-            pass
-
-
-class CueWaitTime:
-    """Provide timing for Cue pre/post waits.
-
-    Once created the notify signal provide timing for the specified wait for the
-    given cue.
-    The time since the wait start is calculated internally using the :mod:`time`
-    module functions.
-    """
-
-    class Mode(IntEnum):
-        Pre = 0
-        Post = 1
-
-    def __init__(self, cue, mode=Mode.Pre):
-        self.notify = Signal()
-
-        self._clock = Clock_33
-        self._start_time = 0
-        self._last = 0
-        self._cue = cue
-        self._mode = mode
-
-        if self._mode == CueWaitTime.Mode.Pre:
-            self._cue.prewait_ended.connect(self.stop, Connection.QtQueued)
-            self._cue.prewait_start.connect(self.start, Connection.QtQueued)
-            self._cue.prewait_paused.connect(self.stop, Connection.QtQueued)
-            self._cue.prewait_stopped.connect(self.stop, Connection.QtQueued)
-        elif self._mode == CueWaitTime.Mode.Post:
-            self._cue.postwait_ended.connect(self.stop, Connection.QtQueued)
-            self._cue.postwait_start.connect(self.start, Connection.QtQueued)
-            self._cue.postwait_paused.connect(self.stop, Connection.QtQueued)
-            self._cue.postwait_stopped.connect(self.stop, Connection.QtQueued)
-
-    def __notify(self):
-        if self._mode == CueWaitTime.Mode.Pre:
-            self.notify.emit(int(self._cue.prewait_time() * 100) * 10)
-        else:
-            self.notify.emit(int(self._cue.postwait_time() * 100) * 10)
+    @property
+    def cue(self):
+        return self._cue
 
     def start(self):
-        self._clock.add_callback(self.__notify)
+        self._broadcaster.add(self)
 
     def stop(self):
-        try:
-            self._clock.remove_callback(self.__notify)
-        except Exception:
-            # TODO: catch only the exception when the callback is not registered
-            pass
+        self._broadcaster.remove(self)
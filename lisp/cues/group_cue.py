@@ -16,12 +16,14 @@
 # along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
 
 import random
+import weakref
 from enum import Enum
 
 from PyQt5.QtCore import QT_TRANSLATE_NOOP
 
 from lisp.core.properties import Property
 from lisp.cues.cue import Cue, CueAction
+from lisp.cues.sync_start import start_synchronized
 from lisp.ui.ui_utils import translate
 
 
@@ -58,12 +60,14 @@ class GroupCue(Cue):
     loop = Property(default=0)
     # Whether the group's children are visible/expanded in the UI
     open = Property(default=True)
+    # Simultaneous mode: start the media children at the same time (pre-roll)
+    sync_start = Property(default=False)
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.name = translate("CueName", self.Name)
         self._current_child_index = 0  # For sequential mode
-        self._execution_order = []     # Computed execution order
+        self._execution_order = []     # Computed execution order (weakrefs)
         self._remaining_loops = 0      # Finite loops counter (runtime only)
         
     def __start__(self, fade=False):
@@ -97,18 +101,23 @@ class GroupCue(Cue):
         print("  🔄 Starting all children simultaneously...")
         # Track running children so we can determine when the group is finished
         self._sim_children_remaining = 0
-        for child_id in self.children:
-            child_cue = self.app.cue_model.get(child_id)
-            if child_cue and child_cue is not self:
-                # Connect to child's end to know when all finished
-                try:
-                    child_cue.end.connect(self._on_sim_child_ended)
-                except Exception:
-                    pass
-                action = CueAction.FadeInStart if fade else CueAction.Start
-                print(f"    ▶️ Starting child: {child_cue.name}")
+        targets = []
+        for child_cue in self.app.cue_model.groups.children(self):
+            # Connect to child's end to know when all finished
+            try:
+                child_cue.end.connect(self._on_sim_child_ended)
+            except Exception:
+                pass
+            action = CueAction.FadeInStart if fade else CueAction.Start
+            print(f"    ▶️ Starting child: {child_cue.name}")
+            targets.append((child_cue, action))
+            self._sim_children_remaining += 1
+
+        if self.sync_start:
+            start_synchronized(targets)
+        else:
+            for child_cue, action in targets:
                 child_cue.execute(action=action)
-                self._sim_children_remaining += 1
 
         # If we started any children, keep the group running until they finish
         return self._sim_children_remaining > 0
@@ -116,16 +125,15 @@ class GroupCue(Cue):
     def _start_sequential(self, fade=False):
         """Start child cues one after another"""
         if not self._execution_order:
-            self._execution_order = list(self.children)
+            self._execution_order = self._child_refs()
             self._current_child_index = 0
             
         print(f"  📋 Sequential mode: {len(self._execution_order)} children in order")
         
         if self._current_child_index < len(self._execution_order):
-            child_id = self._execution_order[self._current_child_index]
-            child_cue = self.app.cue_model.get(child_id)
+            child_cue = self._execution_order[self._current_child_index]()
             
-            if child_cue and child_cue is not self:
+            if child_cue is not None:
                 # Connect to child's end signal to start next
                 child_cue.end.connect(self._on_child_ended)
                 
@@ -139,16 +147,23 @@ class GroupCue(Cue):
     def _start_random(self, fade=False):
         """Shuffle children and play sequentially"""
         # Shuffle the execution order
-        self._execution_order = list(self.children)
+        self._execution_order = self._child_refs()
         random.shuffle(self._execution_order)
         self._current_child_index = 0
         
         print(f"  🎲 Random mode: shuffled {len(self._execution_order)} children")
-        print(f"    Order: {[self.app.cue_model.get(cid).name if self.app.cue_model.get(cid) else 'N/A' for cid in self._execution_order]}")
+        print(f"    Order: {[ref().name if ref() else 'N/A' for ref in self._execution_order]}")
         
         # Start like sequential
         return self._start_sequential(fade)
     
+    def _child_refs(self):
+        """Weak-references to the children, in the group order"""
+        return [
+            weakref.ref(child)
+            for child in self.app.cue_model.groups.children(self)
+        ]
+
     def _on_child_ended(self, cue):
         """Called when a child cue ends in sequential/random mode"""
         print(f"    ✅ Child ended: {cue.name}")
@@ -173,10 +188,9 @@ class GroupCue(Cue):
         self._current_child_index += 1
         
         if self._current_child_index < len(self._execution_order):
-            child_id = self._execution_order[self._current_child_index]
-            child_cue = self.app.cue_model.get(child_id)
+            child_cue = self._execution_order[self._current_child_index]()
             
-            if child_cue and child_cue is not self:
+            if child_cue is not None:
                 child_cue.end.connect(self._on_child_ended)
                 print(f"    ▶️ Starting next child {self._current_child_index + 1}/{len(self._execution_order)}: {child_cue.name}")
                 child_cue.execute(action=CueAction.Start)
@@ -246,14 +260,12 @@ class GroupCue(Cue):
         print(f"⏹️ GroupCue '{self.name}' stopping all children")
         action = CueAction.FadeOutStop if fade else CueAction.Stop
         
-        for child_id in self.children:
-            child_cue = self.app.cue_model.get(child_id)
-            if child_cue and child_cue is not self:
-                try:
-                    child_cue.end.disconnect(self._on_child_ended)
-                except:
-                    pass
-                child_cue.execute(action=action)
+        for child_cue in self.app.cue_model.groups.children(self):
+            try:
+                child_cue.end.disconnect(self._on_child_ended)
+            except:
+                pass
+            child_cue.execute(action=action)
         
         self._execution_order = []
         self._current_child_index = 0
@@ -264,10 +276,8 @@ class GroupCue(Cue):
         print(f"⏸️ GroupCue '{self.name}' pausing all children")
         action = CueAction.FadeOutPause if fade else CueAction.Pause
         
-        for child_id in self.children:
-            child_cue = self.app.cue_model.get(child_id)
-            if child_cue and child_cue is not self:
-                child_cue.execute(action=action)
+        for child_cue in self.app.cue_model.groups.children(self):
+            child_cue.execute(action=action)
         return True
     
     def __resume__(self, fade=False):
@@ -275,10 +285,8 @@ class GroupCue(Cue):
         print(f"▶️ GroupCue '{self.name}' resuming all children")
         action = CueAction.FadeInResume if fade else CueAction.Resume
         
-        for child_id in self.children:
-            child_cue = self.app.cue_model.get(child_id)
-            if child_cue and child_cue is not self:
-                child_cue.execute(action=action)
+        for child_cue in self.app.cue_model.groups.children(self):
+            child_cue.execute(action=action)
         return True
     
     def __interrupt__(self, fade=False):
@@ -286,14 +294,12 @@ class GroupCue(Cue):
         print(f"⏹️ GroupCue '{self.name}' interrupting all children")
         action = CueAction.FadeOutInterrupt if fade else CueAction.Interrupt
         
-        for child_id in self.children:
-            child_cue = self.app.cue_model.get(child_id)
-            if child_cue and child_cue is not self:
-                try:
-                    child_cue.end.disconnect(self._on_child_ended)
-                except:
-                    pass
-                child_cue.execute(action=action)
+        for child_cue in self.app.cue_model.groups.children(self):
+            try:
+                child_cue.end.disconnect(self._on_child_ended)
+            except:
+                pass
+            child_cue.execute(action=action)
         
         self._execution_order = []
         self._current_child_index = 0
@@ -81,6 +81,13 @@ class GroupCueSettings(SettingsPage):
         self.modeButtonGroup.addButton(self.randomRadio, 2)
         self.modeGroup.layout().addWidget(self.randomRadio)
         
+        self.syncStartCheck = QCheckBox(
+            translate("GroupCue", "Start the media cues at the same time"),
+            self.modeGroup
+        )
+        self.modeGroup.layout().addWidget(self.syncStartCheck)
+        self.simultaneousRadio.toggled.connect(self.syncStartCheck.setEnabled)
+        
         # Default to simultaneous
         self.simultaneousRadio.setChecked(True)
         
@@ -246,6 +253,7 @@ class GroupCueSettings(SettingsPage):
             self.sequentialRadio.setChecked(True)
         elif mode == GroupMode.RANDOM.value:
             self.randomRadio.setChecked(True)
+        self.syncStartCheck.setChecked(settings.get("sync_start", False))
         
         # Load loop
         loop = settings.get("loop", 0)
@@ -301,7 +309,8 @@ class GroupCueSettings(SettingsPage):
         return {
             "mode": mode,
             "loop": loop,
-            "children": children
+            "children": children,
+            "sync_start": self.syncStartCheck.isChecked()
         }
 
 
@@ -20,6 +20,7 @@ from threading import Lock
 from PyQt5.QtCore import QT_TRANSLATE_NOOP
 
 from lisp.core.decorators import async_function
+from lisp.core.executor import CueExecutor, TaskPriority
 from lisp.core.fade_functions import FadeInType, FadeOutType
 from lisp.core.properties import Property
 from lisp.cues.cue import Cue, CueAction, CueState
@@ -78,10 +79,39 @@ class MediaCue(Cue):
         else:
             self.__fader = None
 
+    @async_function(
+        executor=CueExecutor, priority=TaskPriority.Low, serial=True
+    )
+    def arm(self):
+        """Pre-roll the media, so that the cue can start without delay.
+
+        Only stopped cues are armed. Cues fading-in on start are not, the
+        pre-rolled data would be played before the fade.
+        """
+        fades_in = (
+            self.default_start_action == CueAction.FadeInStart.value
+            and self.fadein_duration > 0
+        )
+        if self._state & CueState.IsStopped and not fades_in:
+            self.media.arm()
+
+    @async_function(
+        executor=CueExecutor, priority=TaskPriority.Low, serial=True
+    )
+    def disarm(self):
+        """Release the media pre-rolled by `arm`, if the cue is stopped."""
+        if self._state & CueState.IsStopped:
+            self.media.disarm()
+
     def __start__(self, fade=False):
+        # The media elements (e.g. volume) could be created on-demand
+        self.media.prepare()
+
         # If we are fading-in on the start of the media, we need to ensure
         # that the volume starts at 0
         if fade and self.fadein_duration > 0 and self._can_fade():
+            # The pre-rolled data, if any, is not faded
+            self.media.disarm()
             self.__volume.live_volume = 0
 
         self.media.play()
@@ -144,7 +174,7 @@ class MediaCue(Cue):
 
         self.media.stop()
 
-    @async_function
+    @async_function(executor=CueExecutor, serial=True)
     def fadein(self, duration, fade_type):
         if not self._st_lock.acquire(timeout=0.1):
             return
@@ -164,7 +194,7 @@ class MediaCue(Cue):
     def loop_release(self):
         self.media.loop_release()
 
-    @async_function
+    @async_function(executor=CueExecutor, serial=True)
     def fadeout(self, duration, fade_type):
         if not self._st_lock.acquire(timeout=0.1):
             return
@@ -238,7 +268,7 @@ class MediaCue(Cue):
     def _can_fade(self):
         return self.__volume is not None and self.__fader is not None
 
-    @async_function
+    @async_function(executor=CueExecutor, priority=TaskPriority.High)
     def _on_start_fade(self):
         if self._can_fade():
             self.__fadein(
@@ -0,0 +1,53 @@
+# This file is part of Linux Show Player
+#
+# Copyright 2026 Francesco Ceruti <ceppofrancy@gmail.com>
+#
+# Linux Show Player is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Linux Show Player is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
+
+from lisp.backend import get_backend
+from lisp.cues.cue import CueAction, CueState
+from lisp.cues.media_cue import MediaCue
+
+
+def _synchronizable(cue, action):
+    """True if the action starts the media cue immediately, without fades."""
+    if not isinstance(cue, MediaCue) or not cue.state & CueState.IsStopped:
+        return False
+
+    if action == CueAction.Default:
+        action = CueAction(cue.default_start_action)
+
+    if action == CueAction.FadeInStart:
+        # The pre-rolled data would be played before the fade
+        return cue.fadein_duration <= 0 and cue.pre_wait <= 0
+
+    return action == CueAction.Start and cue.pre_wait <= 0
+
+
+def start_synchronized(targets):
+    """Execute the given actions, starting the media cues together.
+
+    The media of the cues that are started (without fades or pre-waits)
+    are pre-rolled and synchronized by the backend, so that they start at
+    the same time, regardless of when each cue is actually executed.
+    The other actions are executed as usual.
+
+    :param targets: (cue, action) pairs
+    """
+    get_backend().synchronize_start(
+        [cue.media for cue, action in targets if _synchronizable(cue, action)]
+    )
+
+    for cue, action in targets:
+        cue.execute(action=action)
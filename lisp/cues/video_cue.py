@@ -94,6 +94,8 @@ class VideoCue(MediaCue):
             
     def __start__(self, fade=False):
         """Override start to apply video-specific settings"""
+        # The video element could be created on-demand
+        self.media.prepare()
         # Apply video effects before starting
         self.apply_video_effects()
         
@@ -18,6 +18,7 @@
 from PyQt5.QtCore import QT_TRANSLATE_NOOP, Qt
 from PyQt5.QtWidgets import (
     QAbstractItemView,
+    QCheckBox,
     QDialog,
     QDialogButtonBox,
     QGroupBox,
@@ -31,6 +32,7 @@ from PyQt5.QtWidgets import (
 from lisp.application import Application
 from lisp.core.properties import Property
 from lisp.cues.cue import Cue, CueAction
+from lisp.cues.sync_start import start_synchronized
 from lisp.ui.cuelistdialog import CueSelectDialog
 from lisp.ui.qdelegates import CueActionDelegate, CueSelectionDelegate
 from lisp.ui.qmodels import CueClassRole, SimpleCueListModel
@@ -53,16 +55,24 @@ class CollectionCue(Cue):
     )
 
     targets = Property(default=[])
+    sync_start = Property(default=False)
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.name = translate("CueName", self.Name)
 
     def __start__(self, fade=False):
+        targets = []
         for target_id, action in self.targets:
             cue = self.app.cue_model.get(target_id)
-            if cue is not self:
-                cue.execute(action=CueAction[action])
+            if cue is not None and cue is not self:
+                targets.append((cue, CueAction[action]))
+
+        if self.sync_start:
+            start_synchronized(targets)
+        else:
+            for cue, action in targets:
+                cue.execute(action=action)
 
         return False
 
@@ -111,6 +121,9 @@ class CollectionCueSettings(SettingsPage):
         )
         self.delButton.clicked.connect(self._removeCurrentCue)
 
+        self.syncStartCheck = QCheckBox(self.collectionGroup)
+        self.collectionGroup.layout().addWidget(self.syncStartCheck)
+
         self.retranslateUi()
 
     def retranslateUi(self):
@@ -119,6 +132,9 @@ class CollectionCueSettings(SettingsPage):
         )
         self.addButton.setText(translate("CollectionCue", "Add"))
         self.delButton.setText(translate("CollectionCue", "Remove"))
+        self.syncStartCheck.setText(
+            translate("CollectionCue", "Start the media cues at the same time")
+        )
 
     def enableCheck(self, enabled):
         self.setGroupEnabled(self.collectionGroup, enabled)
@@ -129,13 +145,18 @@ class CollectionCueSettings(SettingsPage):
             if target is not None:
                 self._addCue(target, CueAction(action))
 
+        self.syncStartCheck.setChecked(settings.get("sync_start", False))
+
     def getSettings(self):
         if self.isGroupEnabled(self.collectionGroup):
             targets = []
             for target_id, action in self.collectionModel.rows:
                 targets.append((target_id, action.value))
 
-            return {"targets": targets}
+            return {
+                "targets": targets,
+                "sync_start": self.syncStartCheck.isChecked(),
+            }
 
         return {}
 
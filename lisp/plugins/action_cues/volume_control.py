@@ -36,6 +36,7 @@ from lisp.backend.audio_utils import (
     linear_to_db,
 )
 from lisp.core.decorators import async_function
+from lisp.core.executor import CueExecutor
 from lisp.core.fade_functions import FadeInType, FadeOutType
 from lisp.core.fader import DummyFader
 from lisp.core.properties import Property
@@ -108,7 +109,7 @@ class VolumeControl(Cue):
 
     __interrupt__ = __stop__
 
-    @async_function
+    @async_function(executor=CueExecutor)
     def __fade(self, fade_type):
         try:
             self.__fader.prepare()
@@ -55,6 +55,7 @@ class CueWidget(QWidget):
         self._countdownMode = True
         self._showDBMeter = False
         self._showVolume = False
+        self._suspended = False
 
         self._dBMeterElement = None
         self._volumeElement = None
@@ -178,18 +179,9 @@ class CueWidget(QWidget):
     def showDBMeters(self, visible):
         if isinstance(self._cue, MediaCue):
             self._showDBMeter = visible
-
-            if self._dBMeterElement is not None:
-                self._dBMeterElement.level_ready.disconnect(self.dbMeter.plot)
-                self._dBMeterElement = None
+            self._connectDBMeter(visible and not self._suspended)
 
             if visible:
-                self._dBMeterElement = self._cue.media.element("DbMeter")
-                if self._dBMeterElement is not None:
-                    self._dBMeterElement.level_ready.connect(
-                        self.dbMeter.plot, Connection.QtQueued
-                    )
-
                 self.hLayout.insertWidget(2, self.dbMeter, 1)
                 self.dbMeter.show()
             else:
@@ -225,6 +217,25 @@ class CueWidget(QWidget):
 
             self.update()
 
+    def setSuspended(self, suspended):
+        """Stop, or restart, the time and dB-meter updates.
+
+        Used for the widgets that cannot be seen (e.g. in a hidden page).
+        """
+        if suspended == self._suspended:
+            return
+
+        # The CueTime is kept, re-creating it (and its connections) would
+        # make showing a page slower, the updates are ignored instead
+        self._suspended = suspended
+        if not suspended:
+            self._updateTime(self._cue.current_time(), True)
+
+        if isinstance(self._cue, MediaCue):
+            self._connectDBMeter(self._showDBMeter and not suspended)
+            if suspended:
+                self.dbMeter.reset()
+
     def resetVolume(self):
         if self._volumeElement is not None:
             self.volumeSlider.setValue(
@@ -280,12 +291,24 @@ class CueWidget(QWidget):
             self.seekSlider.sliderJumped.connect(self._cue.media.seek)
 
         self._cueTime = CueTime(self._cue)
-        self._cueTime.notify.connect(self._updateTime, Connection.QtQueued)
+        self._cueTime.notify.connect(self._updateTime)
 
         self._updateName(cue.name)
         self._updateStyle(cue.stylesheet)
         self._updateDuration(self._cue.duration)
 
+    def _connectDBMeter(self, connect):
+        if self._dBMeterElement is not None:
+            self._dBMeterElement.level_ready.disconnect(self.dbMeter.plot)
+            self._dBMeterElement = None
+
+        if connect:
+            self._dBMeterElement = self._cue.media.element("DbMeter")
+            if self._dBMeterElement is not None:
+                self._dBMeterElement.level_ready.connect(
+                    self.dbMeter.plot, Connection.QtQueued
+                )
+
     def _mediaUpdated(self):
         self.showDBMeters(self._showDBMeter)
         self.showVolumeSlider(self._showVolume)
@@ -374,7 +397,9 @@ class CueWidget(QWidget):
             self._updateTime(duration, True)
 
     def _updateTime(self, time, ignore_visibility=False):
-        if ignore_visibility or not self.visibleRegion().isEmpty():
+        if ignore_visibility or (
+            not self._suspended and not self.visibleRegion().isEmpty()
+        ):
             # If the given value is the duration or < 0 set the time to 0
             if time == self._cue.duration or time < 0:
                 time = 0
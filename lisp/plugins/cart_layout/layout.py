@@ -17,7 +17,7 @@
 
 import re
 
-from PyQt5.QtCore import QT_TRANSLATE_NOOP
+from PyQt5.QtCore import QT_TRANSLATE_NOOP, QTimer
 from PyQt5.QtWidgets import QAction, QInputDialog, QMessageBox
 
 from lisp.command.model import ModelInsertItemsCommand, ModelMoveItemCommand
@@ -58,6 +58,12 @@ class CartLayout(CueLayout):
 
     Config = DummyConfiguration()
 
+    # Delay (ms) before populating a page shown while cues are being added
+    PopulateDelay = 100
+    # Widgets created, for the pages next to the current one, in each
+    # iteration of the event loop (see `_prebuild_step`)
+    PrebuildChunk = 4
+
     tabs = ProxyProperty()
     seek_sliders_visible = ProxyProperty()
     volume_control_visible = ProxyProperty()
@@ -84,6 +90,24 @@ class CartLayout(CueLayout):
         self._cart_view.keyPressed.connect(self._key_pressed)
         self._cart_view.currentChanged.connect(self._tab_changed)
 
+        # The widgets of a page are created only when the page is first shown,
+        # while adding cues this is delayed, so the pages quickly passed
+        # through (e.g. while loading a session) are not populated
+        self._adding = False
+        self._populate_timer = QTimer(self._cart_view)
+        self._populate_timer.setSingleShot(True)
+        self._populate_timer.setInterval(CartLayout.PopulateDelay)
+        self._populate_timer.timeout.connect(self._populate_current_page)
+
+        # The pages next to the current one are populated when idle, a few
+        # widgets at the time, so switching to them is fast. A page being
+        # built is (index, cues iterator), any change to the model cancels it
+        self._prebuild = None
+        self._prebuild_pages = []
+        self._prebuild_timer = QTimer(self._cart_view)
+        self._prebuild_timer.setInterval(0)
+        self._prebuild_timer.timeout.connect(self._prebuild_step)
+
         # Layout menu
         layout_menu = self.app.window.menuLayout
 
@@ -220,6 +244,7 @@ class CartLayout(CueLayout):
                 yield widget.cue
 
     def select_all(self, cue_type=Cue):
+        self._populate_pages()
         for widget in self._widgets():
             if isinstance(widget.cue, cue_type):
                 widget.selected = True
@@ -230,6 +255,7 @@ class CartLayout(CueLayout):
                 widget.selected = False
 
     def invert_selection(self):
+        self._populate_pages()
         for widget in self._widgets():
             widget.selected = not widget.selected
 
@@ -269,6 +295,10 @@ class CartLayout(CueLayout):
 
     def remove_page(self, index):
         if self._cart_view.count() > index >= 0:
+            # The pages indices are changing
+            self._cancel_prebuild()
+            self._prebuild_pages.clear()
+
             page = self._page(index)
             page.moveWidgetRequested.disconnect()
             page.copyWidgetRequested.disconnect()
@@ -378,6 +408,9 @@ class CartLayout(CueLayout):
             return -1
 
     def finalize(self):
+        self._populate_timer.stop()
+        self._prebuild_timer.stop()
+
         # Clean layout menu
         self.app.window.menuLayout.clear()
 
@@ -391,9 +424,76 @@ class CartLayout(CueLayout):
         del self._reset_volume_action
 
     def _widgets(self):
+        """Iterate over the widgets of the populated pages."""
         for page in self._cart_view.pages():
             yield from page.widgets()
 
+    def _populate_page(self, index):
+        page = self._page(index)
+        if page is None or page.isPopulated():
+            return
+
+        if self._prebuild is not None and self._prebuild[0] == index:
+            # Complete the page, the widgets already created are still valid
+            cues = self._prebuild[1]
+            self._prebuild = None
+        else:
+            cues = self._cart_model.iter_page(index)
+
+        page.setPopulated(True)
+        for cue in cues:
+            _, row, column = self.to_3d_index(cue.index)
+            page.addWidget(self.__create_widget(cue), row, column)
+
+    def _populate_current_page(self):
+        index = self._cart_view.currentIndex()
+
+        self._populate_page(index)
+        self._prebuild_pages = [index + 1, index - 1]
+        self._prebuild_timer.start()
+
+    def _prebuild_step(self):
+        if self._prebuild is None:
+            while self._prebuild_pages:
+                index = self._prebuild_pages.pop(0)
+                page = self._page(index)
+                if index >= 0 and page is not None and not page.isPopulated():
+                    self._prebuild = (index, self._cart_model.iter_page(index))
+                    break
+            else:
+                self._prebuild_timer.stop()
+                return
+
+        index, cues = self._prebuild
+        page = self._page(index)
+        for _ in range(CartLayout.PrebuildChunk):
+            cue = next(cues, None)
+            if cue is None:
+                self._prebuild = None
+                page.setPopulated(True)
+                break
+
+            # The page is hidden, the widgets are added suspended
+            _, row, column = self.to_3d_index(cue.index)
+            page.addWidget(self.__create_widget(cue), row, column)
+
+    def _cancel_prebuild(self):
+        """Remove the widgets of the page being built, before a model change."""
+        if self._prebuild is not None:
+            index = self._prebuild[0]
+            self._prebuild = None
+
+            page = self._page(index)
+            for row, column in [page.indexOf(w) for w in page.widgets()]:
+                self.__delete_widget(page.takeWidget(row, column))
+
+            # Start again from this page
+            self._prebuild_pages.insert(0, index)
+
+    def _populate_pages(self):
+        for index in range(self._cart_view.count()):
+            self._populate_page(index)
+
     def _page(self, index):
         """:rtype: CartPageWidget"""
         return self._cart_view.widget(index)
@@ -433,12 +533,19 @@ class CartLayout(CueLayout):
         page, row, column = self.to_3d_index(cue.index)
         widget = self._page(page).widget(row, column)
 
-        widget.resetVolume()
+        # Widgets are not created for the pages never shown
+        if widget is not None:
+            widget.resetVolume()
 
     def _tab_changed(self, index):
         self._cart_model.current_page = index
 
-    def __cue_added(self, cue):
+        if self._adding:
+            self._populate_timer.start()
+        else:
+            self._populate_current_page()
+
+    def __create_widget(self, cue):
         widget = CueWidget(cue)
 
         widget.contextMenuRequested.connect(self._cue_context_menu)
@@ -451,34 +558,61 @@ class CartLayout(CueLayout):
         widget.showDBMeters(self.dbmeters_visible)
         widget.showSeekSlider(self.seek_sliders_visible)
 
+        return widget
+
+    def __delete_widget(self, widget):
+        widget.setSuspended(True)
+        widget.cueExecuted.disconnect()
+        widget.contextMenuRequested.disconnect()
+        widget.editRequested.disconnect()
+
+        widget.deleteLater()
+
+    def __cue_added(self, cue):
+        # While adding cues (e.g. loading a session) the pages are not built
+        # in the background, this is resumed after the population delay
+        self._cancel_prebuild()
+        self._prebuild_timer.stop()
+        self._populate_timer.start()
+
         page, row, column = self.to_3d_index(cue.index)
         if page >= self._cart_view.count():
             self.add_page()
 
-        self._page(page).addWidget(widget, row, column)
+        if self._page(page).isPopulated():
+            self._page(page).addWidget(self.__create_widget(cue), row, column)
+
+        self._adding = True
         self._cart_view.setCurrentIndex(page)
+        self._adding = False
 
     def __cue_removed(self, cue):
+        self._cancel_prebuild()
         page, row, column = self.to_3d_index(cue.index)
-        widget = self._page(page).takeWidget(row, column)
-
-        widget.cueExecuted.disconnect()
-        widget.contextMenuRequested.disconnect()
-        widget.editRequested.disconnect()
-
-        widget.deleteLater()
+        if self._page(page).isPopulated():
+            self.__delete_widget(self._page(page).takeWidget(row, column))
 
     def __cue_moved(self, old_index, new_index):
+        self._cancel_prebuild()
         o_page, o_row, o_column = self.to_3d_index(old_index)
         n_page, n_row, n_column = self.to_3d_index(new_index)
+        o_populated = self._page(o_page).isPopulated()
+        n_populated = self._page(n_page).isPopulated()
 
         if o_page == n_page:
-            self._page(n_page).moveWidget(o_row, o_column, n_row, n_column)
-        else:
+            if n_populated:
+                self._page(n_page).moveWidget(o_row, o_column, n_row, n_column)
+        elif o_populated and n_populated:
             widget = self._page(o_page).takeWidget(o_row, o_column)
             self._page(n_page).addWidget(widget, n_row, n_column)
+        elif o_populated:
+            self.__delete_widget(self._page(o_page).takeWidget(o_row, o_column))
+        elif n_populated:
+            widget = self.__create_widget(self._cart_model.item(new_index))
+            self._page(n_page).addWidget(widget, n_row, n_column)
 
     def __model_reset(self):
+        self._cancel_prebuild()
         for page in self._cart_view.pages():
             page.reset()
 
@@ -39,6 +39,7 @@ class CartPageWidget(QWidget):
         self.__rows = rows
         self.__columns = columns
         self.__widgets = SortedDict()
+        self.__populated = False
 
         self.setLayout(QGridLayout())
         self.layout().setContentsMargins(4, 4, 4, 4)
@@ -57,6 +58,7 @@ class CartPageWidget(QWidget):
             widget.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)
             self.__widgets[(row, column)] = widget
             self.layout().addWidget(widget, row, column)
+            widget.setSuspended(not self.isVisible())
             widget.show()
         else:
             raise IndexError(f"cell {row, column} already used")
@@ -92,6 +94,23 @@ class CartPageWidget(QWidget):
     def reset(self):
         self.__widgets.clear()
 
+    def isPopulated(self):
+        """True if the widgets of the page have been created."""
+        return self.__populated
+
+    def setPopulated(self, populated):
+        self.__populated = populated
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        for widget in self.__widgets.values():
+            widget.setSuspended(False)
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        for widget in self.__widgets.values():
+            widget.setSuspended(True)
+
     def contextMenuEvent(self, event):
         self.contextMenuRequested.emit(event.globalPos())
 
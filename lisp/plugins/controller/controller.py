@@ -16,7 +16,10 @@
 # along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
 
 import logging
+import time
+from functools import partial
 
+from lisp.core.latency import LatencyCounter
 from lisp.core.plugin import Plugin
 from lisp.core.properties import Property
 from lisp.cues.cue import Cue, CueAction
@@ -26,6 +29,7 @@ from lisp.plugins.controller.controller_settings import (
     CueControllerSettingsPage,
     ControllerLayoutConfiguration,
 )
+from lisp.plugins.controller.dispatch import DispatchTable
 from lisp.ui.settings.app_configuration import AppConfigurationDialog
 from lisp.ui.settings.cue_settings import CueSettingsRegistry
 from lisp.ui.ui_utils import translate
@@ -44,9 +48,15 @@ class Controller(Plugin):
     def __init__(self, app):
         super().__init__(app)
 
-        self.__cue_map = {}
-        self.__global_map = {}
+        # {key: ((cue, (CueAction, ...)), ...)}
+        self.__cue_map = DispatchTable()
+        # {key: ((protocol_name, (LayoutAction, ...)), ...)}
+        self.__global_map = DispatchTable()
         self.__protocols = {}
+        # {protocol_name: LatencyCounter}, from event to cue.execute
+        self.__latency = {}
+        # Keep a reference to the protocols events handlers
+        self.__handlers = {}
 
         # Register a new Cue property to store settings
         Cue.controller = Property(default={})
@@ -71,9 +81,9 @@ class Controller(Plugin):
         # Load available protocols
         self.__load_protocols()
 
-        self.global_changed(Controller.Config)
-        Controller.Config.updated.connect(self.global_changed)
-        Controller.Config.changed.connect(self.global_changed)
+        self.global_changed()
+        Controller.Config.updated.connect(self.__global_updated)
+        Controller.Config.changed.connect(self.__global_option_changed)
 
     def session_init(self):
         for protocol in self.__protocols.values():
@@ -86,93 +96,185 @@ class Controller(Plugin):
             protocol.reset()
 
     def global_changed(self, *args):
-        # Here we just rebuild everything which is not the best solution
-        # but is the easiest
-        self.__global_map = {}
-        for protocol in Controller.Config["protocols"].values():
-            for key, action in protocol:
-                self.__global_map.setdefault(key, set()).add(
-                    LayoutAction(action)
-                )
-
-    def cue_changed(self, cue, property_name, value):
-        if property_name == "controller":
-            self.delete_from_cue_map(cue)
+        """Rebuild the session actions of all the protocols."""
+        self.__global_map.clear()
+        for protocol in Controller.Config["protocols"]:
+            self.__protocol_global_changed(protocol)
 
-            for protocol in self.__protocols:
-                for key, action in value.get(protocol, ()):
-                    actions_map = self.__cue_map.setdefault(key, {})
-                    actions_map.setdefault(cue, set()).add(CueAction(action))
+    def cue_changed(self, cue, properties):
+        if "controller" in properties:
+            controller = properties["controller"]
+            self.__cue_map.set(
+                cue,
+                (
+                    (key, CueAction(action))
+                    for protocol in self.__protocols
+                    for key, action in self.__parse_entries(
+                        protocol, controller.get(protocol, ())
+                    )
+                ),
+            )
 
     def delete_from_cue_map(self, cue):
-        for actions_map in self.__cue_map.values():
-            actions_map.pop(cue, None)
+        self.__cue_map.remove(cue)
 
-    def perform_cue_action(self, key):
-        for cue, actions in self.__cue_map.get(key, {}).items():
+    def perform_cue_action(self, key, latency=None, received=None):
+        """Execute the cues actions mapped to the given key.
+
+        :param latency: a LatencyCounter, to record the time between
+                        `received` and each `cue.execute` call
+        :param received: when the event was received (`time.perf_counter`)
+        """
+        for cue, actions in self.__cue_map.get(key):
             for action in actions:
+                if latency is not None:
+                    latency.record(time.perf_counter() - received)
+
                 cue.execute(action)
 
+    def latency_stats(self):
+        """Return the latency, from event to `cue.execute`, per protocol.
+
+        :rtype: dict[str, lisp.core.latency.LatencyStats]
+        """
+        return {
+            protocol: counter.stats()
+            for protocol, counter in self.__latency.items()
+        }
+
+    def reset_latency_stats(self):
+        for counter in self.__latency.values():
+            counter.reset()
+
     def perform_session_action(self, key):
-        for action in self.__global_map.get(key, ()):
-            if action is LayoutAction.Go:
-                self.app.layout.go()
-            elif action is LayoutAction.Reset:
-                self.app.layout.interrupt_all()
-                self.app.layout.set_standby_index(0)
-            elif action is LayoutAction.StopAll:
-                self.app.layout.stop_all()
-            elif action is LayoutAction.PauseAll:
-                self.app.layout.pause_all()
-            elif action is LayoutAction.ResumeAll:
-                self.app.layout.resume_all()
-            elif action is LayoutAction.InterruptAll:
-                self.app.layout.interrupt_all()
-            elif action is LayoutAction.FadeOutAll:
-                self.app.layout.fadeout_all()
-            elif action is LayoutAction.FadeInAll:
-                self.app.layout.fadein_all()
-            elif action is LayoutAction.StandbyForward:
-                self.app.layout.set_standby_index(
-                    self.app.layout.standby_index() + 1
-                )
-            elif action is LayoutAction.StandbyBack:
-                self.app.layout.set_standby_index(
-                    self.app.layout.standby_index() - 1
-                )
-            elif action is LayoutAction.NextPage:
-                self.app.layout.set_current_page(
-                    self.app.layout.current_page() + 1
-                )
-            elif action is LayoutAction.PreviousPage:
-                self.app.layout.set_current_page(
-                    self.app.layout.current_page() - 1
+        for _, actions in self.__global_map.get(key):
+            for action in actions:
+                self.__perform_layout_action(action)
+
+    def __perform_layout_action(self, action):
+        if action is LayoutAction.Go:
+            self.app.layout.go()
+        elif action is LayoutAction.Reset:
+            self.app.layout.interrupt_all()
+            self.app.layout.set_standby_index(0)
+        elif action is LayoutAction.StopAll:
+            self.app.layout.stop_all()
+        elif action is LayoutAction.PauseAll:
+            self.app.layout.pause_all()
+        elif action is LayoutAction.ResumeAll:
+            self.app.layout.resume_all()
+        elif action is LayoutAction.InterruptAll:
+            self.app.layout.interrupt_all()
+        elif action is LayoutAction.FadeOutAll:
+            self.app.layout.fadeout_all()
+        elif action is LayoutAction.FadeInAll:
+            self.app.layout.fadein_all()
+        elif action is LayoutAction.StandbyForward:
+            self.app.layout.set_standby_index(
+                self.app.layout.standby_index() + 1
+            )
+        elif action is LayoutAction.StandbyBack:
+            self.app.layout.set_standby_index(
+                self.app.layout.standby_index() - 1
+            )
+        elif action is LayoutAction.NextPage:
+            self.app.layout.set_current_page(self.app.layout.current_page() + 1)
+        elif action is LayoutAction.PreviousPage:
+            self.app.layout.set_current_page(self.app.layout.current_page() - 1)
+        else:
+            logger.warning(
+                translate(
+                    "Controller", 'Unrecognized layout action: "{}"'
+                ).format(action)
+            )
+
+    def __cue_added(self, cue):
+        cue.properties_changed.connect(self.cue_changed)
+        self.cue_changed(cue, {"controller": cue.controller})
+
+    def __cue_removed(self, cue):
+        cue.properties_changed.disconnect(self.cue_changed)
+        self.delete_from_cue_map(cue)
+
+    def __global_updated(self, diff):
+        for protocol in diff.get("protocols", {}):
+            self.__protocol_global_changed(protocol)
+
+    def __global_option_changed(self, path, _):
+        path = Controller.Config.sp(path)
+        if path[0] != "protocols":
+            return
+
+        if len(path) > 1:
+            self.__protocol_global_changed(path[1])
+        else:
+            self.global_changed()
+
+    def __protocol_global_changed(self, protocol):
+        self.__global_map.set(
+            protocol,
+            (
+                (key, LayoutAction(action))
+                for key, action in self.__parse_entries(
+                    protocol, Controller.Config.get(f"protocols.{protocol}", ())
                 )
-            else:
+            ),
+        )
+
+    def __parse_entries(self, protocol, entries):
+        """Convert the stored (string) keys into the protocol ones."""
+        protocol = self.__protocols.get(protocol)
+        if protocol is None:
+            return
+
+        for key, action in entries:
+            try:
+                yield protocol.parse_key(key), action
+            except Exception:
                 logger.warning(
                     translate(
-                        "Controller", 'Unrecognized layout action: "{}"'
-                    ).format(action)
+                        "Controller", 'Invalid controller key: "{}"'
+                    ).format(key),
+                    exc_info=True,
                 )
 
-    def __cue_added(self, cue):
-        cue.property_changed.connect(self.cue_changed)
-        self.cue_changed(cue, "controller", cue.controller)
+    def __is_mapped(self, key):
+        return key in self.__cue_map or key in self.__global_map
 
-    def __cue_removed(self, cue):
-        cue.property_changed.disconnect(self.cue_changed)
-        self.delete_from_cue_map(cue)
+    def __protocol_event(self, protocol, key, received):
+        # A failing cue action must not prevent the session ones (and v.v.)
+        try:
+            self.perform_cue_action(key, self.__latency[protocol], received)
+        except Exception:
+            logger.exception(
+                translate(
+                    "Controller", 'Cannot perform the cue actions for: "{}"'
+                ).format(key)
+            )
+
+        try:
+            self.perform_session_action(key)
+        except Exception:
+            logger.exception(
+                translate(
+                    "Controller", 'Cannot perform the session actions for: "{}"'
+                ).format(key)
+            )
 
     def __load_protocols(self):
         protocols.load()
 
         for protocol_class in protocols.Protocols:
             try:
+                name = protocol_class.__name__.lower()
                 protocol = protocol_class()
-                protocol.protocol_event.connect(self.perform_cue_action)
-                protocol.protocol_event.connect(self.perform_session_action)
 
-                self.__protocols[protocol_class.__name__.lower()] = protocol
+                self.__latency[name] = LatencyCounter()
+                self.__handlers[name] = partial(self.__protocol_event, name)
+                protocol.protocol_event.connect(self.__handlers[name])
+                protocol.set_filter(self.__is_mapped)
+
+                self.__protocols[name] = protocol
             except Exception:
                 logger.warning(
                     translate(
@@ -0,0 +1,96 @@
+# This file is part of Linux Show Player
+#
+# Copyright 2026 Francesco Ceruti <ceppofrancy@gmail.com>
+#
+# Linux Show Player is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Linux Show Player is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
+
+from threading import Lock
+
+
+class DispatchTable:
+    """Map protocol keys to the actions of some targets (e.g. cues).
+
+    For every key a tuple of `(target, actions)` pairs is kept, where
+    `actions` is a tuple too. The tuples are never modified, but replaced,
+    so `get` can be used from any thread, without locking.
+
+    A reverse index (target -> keys) is maintained, so that the entries of a
+    target can be updated, or removed, touching only its own keys.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        # {key: {target: (action, ...)}}
+        self._entries = {}
+        # {target: frozenset(keys)}
+        self._keys = {}
+        # {key: ((target, (action, ...)), ...)}
+        self._table = {}
+
+    def get(self, key):
+        """Return the `(target, actions)` pairs for the given key."""
+        return self._table.get(key, ())
+
+    def keys(self, target):
+        """Return the keys mapped for the given target."""
+        return self._keys.get(target, frozenset())
+
+    def set(self, target, mappings):
+        """Replace the entries of the given target.
+
+        :param mappings: (key, action) pairs, actions are kept in order,
+                         duplicates are ignored
+        """
+        actions = {}
+        for key, action in mappings:
+            actions.setdefault(key, {})[action] = None
+
+        with self._lock:
+            old_keys = self._keys.pop(target, frozenset())
+            for key in old_keys:
+                if key not in actions:
+                    self._entries[key].pop(target, None)
+
+            for key, key_actions in actions.items():
+                self._entries.setdefault(key, {})[target] = tuple(key_actions)
+
+            if actions:
+                self._keys[target] = frozenset(actions)
+
+            self.__freeze(old_keys.union(actions))
+
+    def remove(self, target):
+        """Remove all the entries of the given target."""
+        self.set(target, ())
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._keys.clear()
+            self._table = {}
+
+    def __freeze(self, keys):
+        for key in keys:
+            entries = self._entries.get(key)
+            if entries:
+                self._table[key] = tuple(entries.items())
+            else:
+                self._entries.pop(key, None)
+                self._table.pop(key, None)
+
+    def __contains__(self, key):
+        return key in self._table
+
+    def __len__(self):
+        return len(self._table)
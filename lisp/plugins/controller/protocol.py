@@ -15,6 +15,8 @@
 # You should have received a copy of the GNU General Public License
 # along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
 
+import time
+
 from lisp.core.signal import Signal
 
 
@@ -25,7 +27,14 @@ class Protocol:
     and deleted.
 
     When an event that can trigger a cue is "detected", the protocol_event
-    signal should be emitted with the event representation.
+    signal should be emitted with the event representation (key), using
+    `emit_event`, so the events that cannot match any mapping are discarded.
+    The time the event was received (`time.perf_counter`) should be taken
+    as soon as possible, in the receive callback, and given to `emit_event`.
+
+    Keys are stored (e.g. in the session) as strings, protocols can use a
+    more compact representation for the emitted keys, and convert the stored
+    ones via `parse_key`.
 
     To be loaded correctly the class should follow the ClassesLoader
     specification.
@@ -36,6 +45,32 @@ class Protocol:
 
     def __init__(self):
         self.protocol_event = Signal()
+        # Predicate used to discard the keys which cannot match any mapping
+        self._filter = None
+
+    @staticmethod
+    def parse_key(key):
+        """Return the key, as emitted by protocol_event, of a stored key."""
+        return key
+
+    def set_filter(self, filter_):
+        """Set a predicate, keys for which it's False are not emitted.
+
+        :type filter_: typing.Callable[[typing.Hashable], bool] | None
+        """
+        self._filter = filter_
+
+    def emit_event(self, key, received=None):
+        """Emit protocol_event (key, received), if the key can be mapped.
+
+        :param received: when the event was received (`time.perf_counter`),
+                         if None, the current time is used
+        """
+        if self._filter is None or self._filter(key):
+            if received is None:
+                received = time.perf_counter()
+
+            self.protocol_event.emit(key, received)
 
     def init(self):
         pass
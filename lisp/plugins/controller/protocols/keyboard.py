@@ -15,6 +15,8 @@
 # You should have received a copy of the GNU General Public License
 # along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
 
+import time
+
 from PyQt5.QtCore import Qt, QT_TRANSLATE_NOOP
 from PyQt5.QtGui import QKeySequence
 from PyQt5.QtWidgets import (
@@ -155,9 +157,10 @@ class Keyboard(Protocol):
         Application().layout.key_pressed.disconnect(self.__key_pressed)
 
     def __key_pressed(self, key_event):
+        received = time.perf_counter()
         if not key_event.isAutoRepeat():
             sequence = keyEventKeySequence(key_event)
             if sequence:
-                self.protocol_event.emit(
-                    sequence.toString(QKeySequence.PortableText)
+                self.emit_event(
+                    sequence.toString(QKeySequence.PortableText), received
                 )
@@ -15,6 +15,8 @@
 # You should have received a copy of the GNU General Public License
 # along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
 import logging
+import time
+from functools import lru_cache
 
 from PyQt5.QtCore import Qt, QT_TRANSLATE_NOOP
 from PyQt5.QtWidgets import (
@@ -332,7 +334,31 @@ class Midi(Protocol):
         get_plugin("Midi").input.new_message.connect(self.__new_message)
 
     def __new_message(self, message):
+        received = time.perf_counter()
+        self.emit_event(self.key_from_message(message), received)
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def parse_key(key):
+        return Midi.key_from_message(midi_from_str(key))
+
+    @staticmethod
+    def key_from_message(message):
+        """Return a compact key for the message, the velocity is ignored.
+
+        Messages up to 3 bytes (all but sysex) are packed in an integer,
+        the status byte is always >= 0x80, so there are no collisions
+        between messages of different length.
+        """
+        data = message.bytes()
         if hasattr(message, "velocity"):
-            message = message.copy(velocity=0)
+            data[2] = 0
 
-        self.protocol_event.emit(str(message))
+        if len(data) == 3:
+            return data[0] << 16 | data[1] << 8 | data[2]
+        if len(data) == 2:
+            return data[0] << 8 | data[1]
+        if len(data) == 1:
+            return data[0]
+
+        return tuple(data)
@@ -19,6 +19,7 @@
 
 import ast
 import logging
+import time
 
 from PyQt5.QtCore import Qt, QT_TRANSLATE_NOOP
 from PyQt5.QtWidgets import (
@@ -465,8 +466,22 @@ class Osc(Protocol):
         osc.server.new_message.connect(self.__new_message)
 
     def __new_message(self, path, args, types, *_, **__):
-        key = self.key_from_message(path, types, args)
-        self.protocol_event.emit(key)
+        received = time.perf_counter()
+        self.emit_event(Osc.compact_key(path, types, args), received)
+
+    @staticmethod
+    def parse_key(key):
+        path, types, *args = Osc.message_from_key(key)
+        return Osc.compact_key(path, types, args)
+
+    @staticmethod
+    def compact_key(path, types, args):
+        """Return a (hashable) tuple key, blob arguments are lists."""
+        return (
+            path,
+            types,
+            *(tuple(arg) if isinstance(arg, list) else arg for arg in args),
+        )
 
     @staticmethod
     def key_from_message(path, types, args):
@@ -34,7 +34,9 @@ from lisp.plugins.gst_backend.gst_media_cue import (
     UriAudioCueFactory,
 )
 from lisp.plugins.gst_backend.gst_media_settings import GstMediaSettings
+from lisp.plugins.gst_backend.gst_pipeline_budget import PipelineBudget
 from lisp.plugins.gst_backend.gst_settings import GstSettings
+from lisp.plugins.gst_backend.gst_sync import synchronize_start
 from lisp.plugins.gst_backend.gst_utils import (
     gst_parse_tags_list,
     gst_uri_metadata,
@@ -59,6 +61,10 @@ class GstBackend(Plugin, BaseBackend):
 
         # Initialize GStreamer
         Gst.init(None)
+        # Build pipelines on-demand, if enabled
+        self.__configure_budget()
+        GstBackend.Config.changed.connect(self.__configure_budget)
+        GstBackend.Config.updated.connect(self.__configure_budget)
         # Register GStreamer settings widgets
         AppConfigurationDialog.registerSettingsPage(
             "plugins.gst", GstSettings, GstBackend.Config
@@ -105,6 +111,16 @@ class GstBackend(Plugin, BaseBackend):
     def uri_duration(self, uri):
         return gst_uri_duration(uri)
 
+    def __configure_budget(self, *args):
+        PipelineBudget.configure(
+            lazy=GstBackend.Config.get("lazyPipelines.enabled", False),
+            max_pipelines=GstBackend.Config.get(
+                "lazyPipelines.maxPipelines", 0
+            ),
+            max_memory=GstBackend.Config.get("lazyPipelines.maxMemory", 0),
+        )
+        PipelineBudget.enforce()
+
     def uri_tags(self, uri):
         tags = gst_uri_metadata(uri).get_tags()
         if tags is not None:
@@ -123,6 +139,9 @@ class GstBackend(Plugin, BaseBackend):
 
         return extensions
 
+    def synchronize_start(self, medias):
+        return synchronize_start(medias)
+
     def uri_waveform(self, uri, duration=None):
         if duration is None or duration <= 0:
             duration = self.uri_duration(uri)
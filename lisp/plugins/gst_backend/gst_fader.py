@@ -18,7 +18,14 @@
 from time import perf_counter_ns
 from typing import Union
 
-from lisp.core.fade_functions import ntime, FadeInType, FadeOutType
+import numpy as np
+
+from lisp.core.fade_functions import (
+    FadeCurve,
+    FadeInType,
+    FadeOutType,
+    fade_curve,
+)
 from lisp.core.fader import BaseFader
 
 
@@ -31,7 +38,7 @@ class GstFader(BaseFader):
         self,
         duration: float,
         to_value: float,
-        fade_type: Union[FadeInType, FadeOutType],
+        fade_type: Union[FadeInType, FadeOutType, FadeCurve],
     ) -> bool:
         base_value = getattr(self._target, self._attribute)
         value_diff = to_value - base_value
@@ -39,20 +46,14 @@ class GstFader(BaseFader):
         if value_diff == 0:
             return True
 
-        functor = fade_type.value
         steps = 100
         steps_duration = (duration * 1000) / steps
-        control_points = {}
-
-        for step in range(steps):
-            control_points[step * steps_duration] = round(
-                functor(
-                    ntime(step, 0, steps - 1),
-                    value_diff,
-                    base_value,
-                ),
-                6,
-            )
+        values = np.round(
+            fade_curve(fade_type).points(steps, value_diff, base_value), 6
+        )
+        control_points = dict(
+            zip((np.arange(steps) * steps_duration).tolist(), values.tolist())
+        )
 
         controller = self._target.get_controller(self.attribute)
         controller.set(control_points)
@@ -17,14 +17,21 @@
 
 import logging
 import weakref
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from threading import RLock
 
 from lisp.backend.media import Media, MediaState
+from lisp.core.decorators import async_in_pool
 from lisp.core.properties import Property
-from lisp.core.util import weak_call_proxy
+from lisp.core.session_uri import SessionURI
+from lisp.core.util import filter_live_properties, weak_call_proxy
 from lisp.plugins.gst_backend import elements as gst_elements
 from lisp.plugins.gst_backend.gi_repository import Gst
 from lisp.plugins.gst_backend.gst_element import GstMediaElements
-from lisp.plugins.gst_backend.gst_utils import GstError
+from lisp.plugins.gst_backend.gst_pipeline_budget import PipelineBudget
+from lisp.plugins.gst_backend.gst_properties import GstURIProperty
+from lisp.plugins.gst_backend.gst_utils import GstError, gst_uri_duration
 from lisp.ui.ui_utils import translate
 
 logger = logging.getLogger(__name__)
@@ -52,7 +59,12 @@ def media_finalizer(pipeline, message_handler, media_elements):
 
 
 class GstMedia(Media):
-    """Media implementation based on the GStreamer framework."""
+    """Media implementation based on the GStreamer framework.
+
+    When `PipelineBudget.lazy` is True, the pipeline is built only when
+    needed (see `prepare`), until then, and after being released, only the
+    elements properties are kept.
+    """
 
     pipe = Property(default=())
     elements = Property(default=GstMediaElements.class_defaults())
@@ -61,12 +73,20 @@ class GstMedia(Media):
         super().__init__()
         self.elements = GstMediaElements()
 
+        self.__lock = RLock()
         self.__pipeline = None
         self.__finalizer = None
         self.__loop = 0  # current number of loops left to do
         self.__current_pipe = None  # A copy of the pipe property
+        self.__armed = False  # Pre-rolled at start_time, but not started
+        self.__sync = None  # (clock, base_time) for the next (armed) play
+        self.__synced = False  # The pipeline is using a shared clock
+        # {element_name: properties}, used while the pipeline is not built
+        self.__elements_properties = {}
 
         self.changed("loop").connect(self.__on_loops_changed)
+        self.changed("start_time").connect(self.__on_segment_changed)
+        self.changed("stop_time").connect(self.__on_segment_changed)
         self.changed("pipe").connect(self.__on_pipe_changed)
 
     @Media.state.getter
@@ -86,26 +106,127 @@ class GstMedia(Media):
         return 0
 
     def play(self):
-        if self.state == MediaState.Null:
-            self.__init_pipeline()
+        with self.__lock:
+            if self.state == MediaState.Null:
+                self.__init_pipeline()
 
-        if self.state == MediaState.Ready or self.state == MediaState.Paused:
-            self.on_play.emit(self)
+            if (
+                self.state == MediaState.Ready
+                or self.state == MediaState.Paused
+            ):
+                self.on_play.emit(self)
 
-            for element in self.elements:
-                element.play()
+                for element in self.elements:
+                    element.play()
+
+                if self.__armed:
+                    # Already pre-rolled at the start position
+                    self.__armed = False
+                elif self.state != MediaState.Paused:
+                    self.__pipeline.set_state(Gst.State.PAUSED)
+                    self.__pipeline.get_state(Gst.SECOND)
+                    self.__seek(self.start_time)
+                else:
+                    self.__seek(self.current_time())
 
-            if self.state != MediaState.Paused:
-                self.__pipeline.set_state(Gst.State.PAUSED)
+                # Start at the synchronized time, if any (see `synchronize`)
+                self.__apply_sync()
+                self.__pipeline.set_state(Gst.State.PLAYING)
                 self.__pipeline.get_state(Gst.SECOND)
-                self.__seek(self.start_time)
-            else:
-                self.__seek(self.current_time())
 
-            self.__pipeline.set_state(Gst.State.PLAYING)
+                self.played.emit(self)
+
+        PipelineBudget.used(self)
+
+    def prepare(self):
+        with self.__lock:
+            if self.__pipeline is None and self.pipe:
+                self.__init_pipeline()
+
+        PipelineBudget.used(self)
+
+    def arm(self):
+        with self.__lock:
+            if self.__armed:
+                return True
+
+            if self.state == MediaState.Null and self.pipe:
+                self.__init_pipeline()
+
+            if self.state != MediaState.Ready:
+                return False
+
+            self.__pipeline.set_state(Gst.State.PAUSED)
             self.__pipeline.get_state(Gst.SECOND)
+            self.__armed = self.__seek(self.start_time)
+            # Wait for the pre-roll to complete after the (flushing) seek
+            self.__pipeline.get_state(Gst.SECOND)
+
+            if not self.__armed:
+                self.__pipeline.set_state(Gst.State.READY)
+                self.__pipeline.get_state(Gst.SECOND)
+
+        PipelineBudget.used(self)
+        return self.__armed
+
+    def synchronize(self, clock, base_time):
+        """Start the next playback at the given time of the given clock.
+
+        Only armed media can be synchronized, in that case `play` only sets
+        the pipeline to PLAYING, using `clock`, and the given `base_time`
+        (in place of the one selected by the pipeline). Media synchronized
+        with the same values start to output at the same time, even if
+        `play` is called at (slightly) different times, as long as it is
+        called before `base_time`, after that the media start in sync, but
+        skipping the part already "played".
+        Stopping, or disarming, the media cancels the synchronization.
+
+        :param clock: the clock shared by the synchronized media
+        :type clock: Gst.Clock
+        :param base_time: the clock time when the playback should start
+        :return: False if the media is not armed
+        """
+        with self.__lock:
+            if not self.__armed:
+                return False
+
+            self.__sync = (clock, base_time)
+            return True
+
+    def disarm(self):
+        with self.__lock:
+            if self.__armed:
+                self.__armed = False
+                self.__sync = None
+                self.__pipeline.set_state(Gst.State.READY)
+                self.__pipeline.get_state(Gst.SECOND)
+
+    def release(self):
+        # Never wait, the media could be in use (e.g. starting)
+        if not self.__lock.acquire(blocking=False):
+            return False
+
+        try:
+            if self.__pipeline is None:
+                return True
+            if self.state in (MediaState.Playing, MediaState.Paused):
+                return False
+
+            self.__elements_properties = self.elements.properties(
+                filter=filter_live_properties
+            )
+
+            # Set pipeline to NULL, finalize bus-handler and elements
+            self.__finalizer()
+            self.__finalizer = None
+            self.__pipeline = None
+        finally:
+            self.__lock.release()
+
+        PipelineBudget.discard(self)
+        self.elements_changed.emit(self)
 
-            self.played.emit(self)
+        return True
 
     def pause(self):
         if self.state == MediaState.Playing:
@@ -123,7 +244,11 @@ class GstMedia(Media):
             self.paused.emit(self)
 
     def stop(self):
-        if self.state == MediaState.Playing or self.state == MediaState.Paused:
+        if self.__armed:
+            self.disarm()
+        elif (
+            self.state == MediaState.Playing or self.state == MediaState.Paused
+        ):
             self.on_stop.emit(self)
 
             for element in self.elements:
@@ -136,7 +261,8 @@ class GstMedia(Media):
             self.stopped.emit(self)
 
     def seek(self, position):
-        if self.__seek(position):
+        # Armed media are not started, as stopped ones they cannot be sought
+        if not self.__armed and self.__seek(position):
             self.sought.emit(self, position)
 
     def loop_release(self):
@@ -146,21 +272,138 @@ class GstMedia(Media):
         return getattr(self.elements, class_name, None)
 
     def input_uri(self):
+        with self.__lock:
+            if self.__pipeline is None:
+                # Sources providing an input uri store it as "uri"
+                uri = self.__source_properties().get("uri")
+                return SessionURI(uri) if uri else None
+
         try:
             return self.elements[0].input_uri()
         except (IndexError, AttributeError):
             pass
 
-    def update_properties(self, properties):
+    def properties(self, defaults=True, filter=None):
+        properties = super().properties(defaults=defaults, filter=filter)
+
+        with self.__lock:
+            if self.__pipeline is None and "elements" in properties:
+                properties["elements"] = self.__copy_elements_properties()
+
+        return properties
+
+    def update_properties(self, properties, coalesce=False):
         # In order to update the other properties we need the pipeline first
         pipe = properties.pop("pipe", ())
         if pipe:
             self.pipe = pipe
 
-        super().update_properties(properties)
+        with self.__lock:
+            elements = None
+            if self.__pipeline is None:
+                elements = properties.pop("elements", None)
+
+        super().update_properties(properties, coalesce=coalesce)
+
+        if elements is not None:
+            self.__update_elements_properties(elements)
+
+    def __source_properties(self):
+        if self.pipe:
+            return self.__elements_properties.get(self.pipe[0], {})
+
+        return {}
+
+    def __copy_elements_properties(self):
+        all_elements = gst_elements.all_elements()
+        elements = {}
+
+        for name, properties in self.__elements_properties.items():
+            properties = deepcopy(properties)
+
+            # Store URIs as the elements do, relative to the session
+            element_class = all_elements.get(name)
+            for key, value in properties.items():
+                prop = getattr(element_class, key, None)
+                if isinstance(prop, GstURIProperty) and value:
+                    uri = SessionURI(value)
+                    properties[key] = (
+                        uri.relative_path if uri.is_local else uri.uri
+                    )
+
+            elements[name] = properties
+
+        return elements
+
+    def __update_elements_properties(self, elements):
+        with self.__lock:
+            if self.__pipeline is not None:
+                # Built in the meantime
+                self.elements.update_properties(elements)
+                return
+
+            old_uri = self.__source_properties().get("uri")
+            for name, properties in elements.items():
+                if name in self.pipe:
+                    self.__elements_properties.setdefault(name, {}).update(
+                        properties
+                    )
+
+            source = self.__source_properties()
+            uri = source.get("uri")
+            if old_uri is not None and uri != old_uri:
+                probe = bool(uri)
+            elif source.get("duration", 0) > 0:
+                probe = False
+            elif self.duration > 0:
+                # Saved with the media (already set), the source, once built,
+                # must provide the same value
+                probe = False
+                if uri:
+                    source["duration"] = self.duration
+            else:
+                probe = bool(uri)
+
+        if probe:
+            self.__probe_duration(uri)
+
+    @async_in_pool(pool=ThreadPoolExecutor(1))
+    def __probe_duration(self, uri):
+        duration = gst_uri_duration(SessionURI(uri))
+
+        with self.__lock:
+            # The pipeline (source) provides the duration once built
+            if self.__pipeline is not None:
+                return
+
+            source = self.__source_properties()
+            if source.get("uri") != uri:
+                return
+
+            source["duration"] = duration
+
+        self.duration = duration
 
     def __reset_media(self):
         self.__loop = self.loop
+        self.__armed = False
+        self.__sync = None
+
+    def __apply_sync(self):
+        if self.__sync is not None:
+            clock, base_time = self.__sync
+            self.__sync = None
+
+            # Do not let the pipeline select the clock and the base-time
+            self.__pipeline.use_clock(clock)
+            self.__pipeline.set_start_time(Gst.CLOCK_TIME_NONE)
+            self.__pipeline.set_base_time(base_time)
+            self.__synced = True
+        elif self.__synced:
+            # Restore the defaults
+            self.__pipeline.auto_clock()
+            self.__pipeline.set_start_time(0)
+            self.__synced = False
 
     def __segment_stop_position(self):
         if 0 < self.stop_time < self.duration:
@@ -213,16 +456,40 @@ class GstMedia(Media):
 
     def __on_loops_changed(self, loops):
         self.__loop = loops
+        # The pre-roll depends on the loops (see __seek)
+        self.disarm()
+
+    def __on_segment_changed(self):
+        # The pre-roll segment is no more at the start/stop positions
+        self.disarm()
 
     def __on_pipe_changed(self, new_pipe):
         # Rebuild the pipeline only if something is changed
         if new_pipe != self.__current_pipe:
             self.__current_pipe = new_pipe
-            self.__init_pipeline()
+
+            with self.__lock:
+                if self.__pipeline is None and PipelineBudget.lazy:
+                    # Built when needed, forget the removed elements
+                    self.__elements_properties = {
+                        name: props
+                        for name, props in self.__elements_properties.items()
+                        if name in new_pipe
+                    }
+                else:
+                    self.__init_pipeline()
 
     def __init_pipeline(self):
         # Make a copy of the current elements properties
-        elements_properties = self.elements.properties()
+        if self.__pipeline is None:
+            elements_properties = self.__elements_properties
+            self.__elements_properties = {}
+        else:
+            elements_properties = self.elements.properties()
+
+        self.__armed = False
+        self.__sync = None
+        self.__synced = False
 
         # Call the current media-finalizer, if any
         if self.__finalizer is not None:
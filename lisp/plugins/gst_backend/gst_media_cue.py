@@ -52,10 +52,10 @@ class UriAudioCueFactory(GstCueFactory):
         cue = super().__call__(app, id=id)
 
         if uri is not None:
-            try:
-                cue.media.elements.UriInput.uri = uri
-            except AttributeError:
-                pass
+            # Works also when the pipeline is not built yet
+            cue.media.update_properties(
+                {"elements": {"UriInput": {"uri": uri}}}
+            )
 
         return cue
 
@@ -0,0 +1,155 @@
+# This file is part of Linux Show Player
+#
+# Copyright 2026 Francesco Ceruti <ceppofrancy@gmail.com>
+#
+# Linux Show Player is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Linux Show Player is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
+
+import logging
+import os
+import weakref
+from collections import OrderedDict
+from threading import Lock
+
+from lisp.core.executor import CueExecutor, TaskPriority
+
+logger = logging.getLogger(__name__)
+
+
+def resident_memory():
+    """Resident memory of the current process in MiB, or 0 if unknown."""
+    try:
+        with open("/proc/self/statm", "r") as file:
+            pages = int(file.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return 0
+
+    return pages * os.sysconf("SC_PAGE_SIZE") / 1048576
+
+
+class GstPipelineBudget:
+    """Track the built pipelines, releasing the least recently used ones.
+
+    Used only when `lazy` is True, in that case media build their pipeline
+    only when needed (see `GstMedia.prepare`), and notify the budget when
+    used. When too many pipelines are built (`max_pipelines`), or the
+    process uses too much memory (`max_memory`), the pipelines of the least
+    recently used media are released, playing/paused ones are kept.
+
+    Released pipelines are not (promptly) returned to the OS, so the memory
+    limit is turned in a number of pipelines: the ones built when it was
+    exceeded, until the memory is back under the limit.
+    The budget is enforced by a low-priority task, not by the caller of
+    `used` (e.g. while starting a cue).
+    """
+
+    def __init__(self):
+        self.lazy = False
+        # Maximum number of pipelines, 0 for no limit
+        self.max_pipelines = 0
+        # Maximum resident memory (MiB), 0 for no limit
+        self.max_memory = 0
+
+        self._lock = Lock()
+        # {id(media): weakref(media)}, least recently used first
+        self._media = OrderedDict()
+        # Pipelines allowed by the memory limit, 0 if not exceeded
+        self._memory_pipelines = 0
+        self._enforce_pending = False
+
+    def configure(self, lazy=False, max_pipelines=0, max_memory=0):
+        self.lazy = lazy
+        self.max_pipelines = max_pipelines
+        self.max_memory = max_memory
+        self._memory_pipelines = 0
+
+    def count(self):
+        """Number of built pipelines being tracked."""
+        with self._lock:
+            return len(self._media)
+
+    def used(self, media):
+        """Mark the media as the most recently used, then enforce the budget.
+
+        The budget is enforced asynchronously, see `enforce`.
+
+        :type media: lisp.plugins.gst_backend.gst_media.GstMedia
+        """
+        if not self.lazy:
+            return
+
+        with self._lock:
+            key = id(media)
+            if key in self._media:
+                self._media.move_to_end(key)
+            else:
+                self._media[key] = weakref.ref(
+                    media, lambda _: self._discard(key)
+                )
+
+            if self._enforce_pending:
+                return
+            self._enforce_pending = True
+
+        CueExecutor.submit(self.__enforce_task, priority=TaskPriority.Low)
+
+    def discard(self, media):
+        """Stop tracking the media, e.g. when the pipeline is released."""
+        self._discard(id(media))
+
+    def enforce(self):
+        """Release pipelines until the budget is respected (if possible).
+
+        The most recently used media is never released.
+        """
+        if not self.lazy:
+            return
+
+        with self._lock:
+            candidates = [ref() for ref in self._media.values()][:-1]
+            count = len(self._media)
+
+        if self.max_memory > 0:
+            if resident_memory() <= self.max_memory:
+                self._memory_pipelines = 0
+            elif not self._memory_pipelines:
+                self._memory_pipelines = max(1, count - 1)
+                logger.debug(
+                    f"Memory limit exceeded with {count} pipelines, "
+                    f"limited to {self._memory_pipelines}"
+                )
+
+        limits = [self.max_pipelines, self._memory_pipelines]
+        limit = min((limit for limit in limits if limit > 0), default=0)
+        if not limit:
+            return
+
+        for media in candidates:
+            if self.count() <= limit:
+                break
+
+            if media is not None:
+                media.release()
+
+    def __enforce_task(self):
+        with self._lock:
+            self._enforce_pending = False
+
+        self.enforce()
+
+    def _discard(self, key):
+        with self._lock:
+            self._media.pop(key, None)
+
+
+PipelineBudget = GstPipelineBudget()
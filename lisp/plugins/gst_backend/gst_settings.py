@@ -16,7 +16,14 @@
 # along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
 
 from PyQt5.QtCore import Qt, QT_TRANSLATE_NOOP
-from PyQt5.QtWidgets import QVBoxLayout, QGroupBox, QLabel
+from PyQt5.QtWidgets import (
+    QVBoxLayout,
+    QGroupBox,
+    QLabel,
+    QCheckBox,
+    QGridLayout,
+    QSpinBox,
+)
 
 from lisp.plugins.gst_backend.gst_pipe_edit import GstPipeEdit
 from lisp.ui.settings.pages import SettingsPage
@@ -48,6 +55,30 @@ class GstSettings(SettingsPage):
         self.pipeEdit = GstPipeEdit("", app_mode=True)
         self.pipeGroup.layout().addWidget(self.pipeEdit)
 
+        # Pipelines built on-demand
+        self.lazyGroup = QGroupBox(self)
+        self.lazyGroup.setLayout(QGridLayout())
+        self.layout().addWidget(self.lazyGroup)
+
+        self.lazyCheck = QCheckBox(self.lazyGroup)
+        self.lazyGroup.layout().addWidget(self.lazyCheck, 0, 0, 1, 2)
+
+        self.maxPipelinesLabel = QLabel(self.lazyGroup)
+        self.lazyGroup.layout().addWidget(self.maxPipelinesLabel, 1, 0)
+        self.maxPipelinesSpin = QSpinBox(self.lazyGroup)
+        self.maxPipelinesSpin.setRange(0, 10000)
+        self.lazyGroup.layout().addWidget(self.maxPipelinesSpin, 1, 1)
+
+        self.maxMemoryLabel = QLabel(self.lazyGroup)
+        self.lazyGroup.layout().addWidget(self.maxMemoryLabel, 2, 0)
+        self.maxMemorySpin = QSpinBox(self.lazyGroup)
+        self.maxMemorySpin.setRange(0, 1048576)
+        self.maxMemorySpin.setSuffix(" MiB")
+        self.lazyGroup.layout().addWidget(self.maxMemorySpin, 2, 1)
+
+        self.lazyCheck.toggled.connect(self.maxPipelinesSpin.setEnabled)
+        self.lazyCheck.toggled.connect(self.maxMemorySpin.setEnabled)
+
         self.retranslateUi()
 
     def retranslateUi(self):
@@ -56,8 +87,37 @@ class GstSettings(SettingsPage):
             translate("GstSettings", "Applied only to new cues.")
         )
 
+        self.lazyGroup.setTitle(translate("GstSettings", "Pipelines"))
+        self.lazyCheck.setText(
+            translate("GstSettings", "Build the pipelines only when needed")
+        )
+        self.maxPipelinesSpin.setSpecialValueText(
+            translate("GstSettings", "No limit")
+        )
+        self.maxPipelinesLabel.setText(
+            translate("GstSettings", "Max built pipelines")
+        )
+        self.maxMemorySpin.setSpecialValueText(
+            translate("GstSettings", "No limit")
+        )
+        self.maxMemoryLabel.setText(translate("GstSettings", "Max memory"))
+
     def loadSettings(self, settings):
         self.pipeEdit.set_pipe(settings["pipeline"])
 
+        lazy = settings.get("lazyPipelines", {})
+        self.lazyCheck.setChecked(lazy.get("enabled", False))
+        self.maxPipelinesSpin.setValue(lazy.get("maxPipelines", 0))
+        self.maxMemorySpin.setValue(lazy.get("maxMemory", 0))
+        self.maxPipelinesSpin.setEnabled(self.lazyCheck.isChecked())
+        self.maxMemorySpin.setEnabled(self.lazyCheck.isChecked())
+
     def getSettings(self):
-        return {"pipeline": list(self.pipeEdit.get_pipe())}
+        return {
+            "pipeline": list(self.pipeEdit.get_pipe()),
+            "lazyPipelines": {
+                "enabled": self.lazyCheck.isChecked(),
+                "maxPipelines": self.maxPipelinesSpin.value(),
+                "maxMemory": self.maxMemorySpin.value(),
+            },
+        }
@@ -0,0 +1,52 @@
+# This file is part of Linux Show Player
+#
+# Copyright 2026 Francesco Ceruti <ceppofrancy@gmail.com>
+#
+# Linux Show Player is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Linux Show Player is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
+
+from concurrent.futures import ThreadPoolExecutor
+
+from lisp.plugins.gst_backend.gi_repository import Gst
+from lisp.plugins.gst_backend.gst_media import GstMedia
+
+# Time (ms) between the end of the pre-roll and the synchronized start,
+# all the media should be played within this time
+SyncStartDelay = 50
+
+# Pre-roll multiple pipelines concurrently
+_ArmPool = ThreadPoolExecutor(8, thread_name_prefix="GstSyncArm")
+
+
+def synchronize_start(medias, delay=SyncStartDelay):
+    """Arm the given media and schedule them to start at the same time.
+
+    All the pipelines are pre-rolled, then they are given the same clock
+    (the system one) and the same base-time, `delay` milliseconds in the
+    future, when played they start to output at that time.
+
+    :param medias: the media to be synchronized, only GstMedia are
+    :param delay: time (ms) from now, when the media should start
+    :return: the synchronized media
+    """
+    medias = [media for media in medias if isinstance(media, GstMedia)]
+    armed = list(_ArmPool.map(GstMedia.arm, medias))
+
+    clock = Gst.SystemClock.obtain()
+    base_time = clock.get_time() + delay * Gst.MSECOND
+
+    return [
+        media
+        for media, media_armed in zip(medias, armed)
+        if media_armed and media.synchronize(clock, base_time)
+    ]
@@ -84,9 +84,9 @@ class UriVideoCueFactory(GstVideoCueFactory):
         
         # Set the URI like the audio cues do
         if uri is not None:
-            try:
-                cue.media.elements.UriInput.uri = uri
-            except AttributeError:
-                pass
+            # Works also when the pipeline is not built yet
+            cue.media.update_properties(
+                {"elements": {"UriInput": {"uri": uri}}}
+            )
         
         return cue
\ No newline at end of file
@@ -19,6 +19,7 @@ import logging
 import numpy as np
 
 from lisp.backend.waveform import Waveform
+from lisp.backend.waveform_reducer import WaveformReducer
 from .gi_repository import Gst, GLib
 from .gst_utils import GstError
 
@@ -30,31 +31,31 @@ class GstWaveform(Waveform):
 
     PIPELINE_TEMPLATE = (
         'uridecodebin uri="{uri}" '
-        "! audioconvert ! audio/x-raw, format=S16LE "
-        "! audiobuffersplit output-buffer-duration={sample_length} "
+        "! audioconvert ! audio/x-raw, format=S16LE, layout=interleaved "
+        "! audiobuffersplit output-buffer-duration={buffer_duration} "
         "! appsink name=app_sink emit-signals=true sync=false"
     )
-    MAX_S16_PCM_VALUE = 32768
+    # Seconds of audio received at each 'new-sample' event (a fraction)
+    BUFFER_DURATION = "1/4"
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._pipeline = None
         self._bus_id = None
-
-        self._temp_peak = []
-        self._temp_rms = []
+        # Created when the format (channels, rate) is known
+        self._reducer = None
 
     def _load_waveform(self):
         # Make sure we start from zero
         self._clear()
 
-        # Create the pipeline with an appropriate buffer-size to control
-        # how many seconds of data we receive at each 'new-sample' event.
+        # Create the pipeline, the buffers are reduced to the final samples
+        # as they are received (see WaveformReducer), a few large buffers
+        # are processed faster than many small ones.
         try:
             self._pipeline = Gst.parse_launch(
                 self.PIPELINE_TEMPLATE.format(
-                    uri=self._uri.uri,
-                    sample_length=f"{self.duration // 1000}/{self.max_samples}",
+                    uri=self._uri.uri, buffer_duration=self.BUFFER_DURATION
                 )
             )
         except GLib.GError:
@@ -95,25 +96,28 @@ class GstWaveform(Waveform):
 
         self._bus_id = None
         self._pipeline = None
-
-        self._temp_peak = []
-        self._temp_rms = []
+        self._reducer = None
 
     def _on_new_sample(self, sink, _):
         """Called by GStreamer every time we have a new sample ready."""
-        buffer = sink.emit("pull-sample").get_buffer()
+        sample = sink.emit("pull-sample")
+        buffer = sample.get_buffer()
         if buffer is not None:
-            # Get the all data from the buffer.
-            # We expect each audio sample to be 16bits signed integer
-            buffer = buffer.extract_dup(0, buffer.get_size())
-            # Convert to suitable numpy array
-            data = np.absolute(np.frombuffer(buffer, dtype=np.int16)).astype(
-                int
-            )
-            # Get the max value of the samples
-            self._temp_peak.append(np.max(data))
-            # Get rms of the samples
-            self._temp_rms.append(np.sqrt(np.mean(data**2)))
+            if self._reducer is None:
+                caps = sample.get_caps().get_structure(0)
+                self._reducer = WaveformReducer(
+                    self.samples_count(),
+                    caps.get_value("rate") * self.duration // 1000,
+                    caps.get_value("channels"),
+                )
+
+            # Read the data in-place, we expect 16bits signed integers
+            mapped, info = buffer.map(Gst.MapFlags.READ)
+            if mapped:
+                try:
+                    self._reducer.add(np.frombuffer(info.data, dtype=np.int16))
+                finally:
+                    buffer.unmap(info)
 
         return Gst.FlowReturn.OK
 
@@ -132,14 +136,13 @@ class GstWaveform(Waveform):
 
     def _eos(self):
         """Called when the file has been processed."""
-        # Normalize data
-        self.peak_samples = np.round(
-            np.divide(self._temp_peak, self.MAX_S16_PCM_VALUE),
-            self.MAX_DECIMALS,
-        ).tolist()
-        self.rms_samples = np.round(
-            np.divide(self._temp_rms, self.MAX_S16_PCM_VALUE), self.MAX_DECIMALS
-        ).tolist()
+        if self._reducer is not None:
+            # Normalize data
+            self.peak_samples, self.rms_samples = self._reducer.result()
+        else:
+            # No audio data
+            self.peak_samples = np.zeros(self.samples_count(), np.float32)
+            self.rms_samples = self.peak_samples
 
         # Dump the data into a file (does nothing if caching is disabled)
         self._to_cache()
@@ -0,0 +1,99 @@
+# This file is part of Linux Show Player
+#
+# Copyright 2026 Francesco Ceruti <ceppofrancy@gmail.com>
+#
+# Linux Show Player is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Linux Show Player is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
+
+from lisp.core.signal import Connection
+from lisp.cues.media_cue import MediaCue
+
+
+class CueArmer:
+    """Keep the standby cue, and the following ones, armed.
+
+    Armed cues have their media pre-rolled (see `MediaCue.arm`), so that the
+    GO only needs to resume the playback. Cues are (dis)armed by the
+    `CueExecutor`, in order with the other actions of the same cue, and
+    re-armed when stopped, while in range.
+    """
+
+    def __init__(self, list_model, count=0):
+        """
+        :type list_model: lisp.plugins.list_layout.models.CueListModel
+        :param count: how many cues to keep armed, from the standby one
+        """
+        self._model = list_model
+        self._count = count
+        self._standby = -1
+        # The cues in range, in list order
+        self._armed = []
+
+        self._model.item_added.connect(self._model_changed)
+        self._model.item_removed.connect(self._model_changed)
+        self._model.item_moved.connect(self._model_changed)
+        self._model.model_reset.connect(self._model_changed)
+
+    @property
+    def count(self):
+        return self._count
+
+    @count.setter
+    def count(self, count):
+        if count != self._count:
+            self._count = count
+            self.update()
+
+    def set_standby(self, index):
+        if index != self._standby:
+            self._standby = index
+            self.update()
+
+    def update(self):
+        """Arm the cues in range, disarm the others."""
+        in_range = []
+        if self._standby >= 0:
+            stop = min(self._standby + self._count, len(self._model))
+            for index in range(self._standby, stop):
+                cue = self._model.item(index)
+                if isinstance(cue, MediaCue):
+                    in_range.append(cue)
+
+        for cue in self._armed:
+            if cue not in in_range:
+                cue.stopped.disconnect(self._cue_stopped)
+                cue.interrupted.disconnect(self._cue_stopped)
+                cue.end.disconnect(self._cue_stopped)
+                cue.disarm()
+
+        for cue in in_range:
+            if cue not in self._armed:
+                cue.stopped.connect(self._cue_stopped, Connection.QtQueued)
+                cue.interrupted.connect(self._cue_stopped, Connection.QtQueued)
+                cue.end.connect(self._cue_stopped, Connection.QtQueued)
+
+            cue.arm()
+
+        self._armed = in_range
+
+    def clear(self):
+        """Disarm all the cues."""
+        self._standby = -1
+        self.update()
+
+    def _model_changed(self, *args):
+        self.update()
+
+    def _cue_stopped(self, cue):
+        if cue in self._armed:
+            cue.arm()
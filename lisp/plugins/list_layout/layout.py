@@ -30,6 +30,7 @@ from lisp.layout.cue_menu import (
     MENU_PRIORITY_CUE,
     MenuActionsGroup,
 )
+from lisp.plugins.list_layout.armer import CueArmer
 from lisp.plugins.list_layout.list_view import CueListView
 from lisp.plugins.list_layout.models import CueListModel, RunningCueModel
 from lisp.plugins.list_layout.view import ListLayoutView
@@ -92,9 +93,16 @@ class ListLayout(CueLayout):
             self.interrupt_all
         )
         # Cue list
-        self._view.listView.itemDoubleClicked.connect(self._double_clicked)
+        self._view.listView.doubleClicked.connect(self._double_clicked)
         self._view.listView.contextMenuInvoked.connect(self._context_invoked)
         self._view.listView.keyPressed.connect(self._key_pressed)
+        self._view.listView.standbyChanged.connect(self.__standby_changed)
+
+        # Keep the standby cue, and the following ones, pre-rolled
+        self._armer = CueArmer(self._list_model)
+        self.__configure_armer()
+        ListLayout.Config.changed.connect(self.__configure_armer)
+        ListLayout.Config.updated.connect(self.__configure_armer)
 
         # Layout menu
         layout_menu = self.app.window.menuLayout
@@ -245,12 +253,12 @@ class ListLayout(CueLayout):
         return self._list_model.item(index)
 
     def selected_cues(self, cue_type=Cue):
-        for item in self._view.listView.selectedItems():
-            yield self._list_model.item(
-                self._view.listView.indexOfTopLevelItem(item)
-            )
+        for row in self._view.listView.selectedRows():
+            yield self._list_model.item(row)
 
     def finalize(self):
+        # Release the pre-rolled media
+        self._armer.clear()
         # Clean layout menu
         self.app.window.menuLayout.clear()
         # Clean context-menu
@@ -260,20 +268,25 @@ class ListLayout(CueLayout):
 
     def select_all(self, cue_type=Cue):
         if self.selection_mode:
-            for index in range(self._view.listView.topLevelItemCount()):
-                if isinstance(self._list_model.item(index), cue_type):
-                    self._view.listView.topLevelItem(index).setSelected(True)
+            self._view.listView.setRowsSelected(
+                index
+                for index, cue in enumerate(self._list_model)
+                if isinstance(cue, cue_type)
+            )
 
     def deselect_all(self, cue_type=Cue):
-        for index in range(self._view.listView.topLevelItemCount()):
-            if isinstance(self._list_model.item(index), cue_type):
-                self._view.listView.topLevelItem(index).setSelected(False)
+        self._view.listView.setRowsSelected(
+            (
+                index
+                for index, cue in enumerate(self._list_model)
+                if isinstance(cue, cue_type)
+            ),
+            selected=False,
+        )
 
     def invert_selection(self):
         if self.selection_mode:
-            for index in range(self._view.listView.topLevelItemCount()):
-                item = self._view.listView.topLevelItem(index)
-                item.setSelected(not item.isSelected())
+            self._view.listView.invertSelection()
 
     def _key_pressed(self, event):
         event.ignore()
@@ -380,7 +393,7 @@ class ListLayout(CueLayout):
 
             standby = self.standby_index()
             if standby >= 0:
-                self._view.listView.topLevelItem(standby).setSelected(True)
+                self._view.listView.setRowsSelected((standby,))
         else:
             self.deselect_all()
             self._view.listView.setSelectionMode(CueListView.NoSelection)
@@ -408,7 +421,7 @@ class ListLayout(CueLayout):
 
     def _context_invoked(self, event):
         # This is called in response to CueListView context-events
-        if self._view.listView.itemAt(event.pos()) is not None:
+        if self._view.listView.indexAt(event.pos()).isValid():
             cues = list(self.selected_cues())
             if not cues:
                 context_index = self._view.listView.indexAt(event.pos())
@@ -469,6 +482,12 @@ class ListLayout(CueLayout):
             import traceback
             traceback.print_exc()
 
+    def __standby_changed(self):
+        self._armer.set_standby(self.standby_index())
+
+    def __configure_armer(self, *args):
+        self._armer.count = ListLayout.Config.get("armedCues", 0)
+
     def __cue_added(self, cue):
         cue.next.connect(self.__cue_next, Connection.QtQueued)
 
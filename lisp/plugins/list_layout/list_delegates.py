@@ -0,0 +1,255 @@
+# This file is part of Linux Show Player
+#
+# Copyright 2026 Francesco Ceruti <ceppofrancy@gmail.com>
+#
+# Linux Show Player is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Linux Show Player is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
+
+from PyQt5.QtCore import QRect, QSize, Qt
+from PyQt5.QtGui import (
+    QBrush,
+    QColor,
+    QFontDatabase,
+    QFontMetrics,
+    QIcon,
+    QPainter,
+    QPainterPath,
+    QPalette,
+    QPen,
+)
+from PyQt5.QtWidgets import (
+    QApplication,
+    QProgressBar,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionProgressBar,
+    QStyleOptionViewItem,
+)
+
+from lisp.plugins.list_layout.models import AccentRole, TimeRole
+
+ITEM_CURRENT_BG = QBrush(QColor(250, 220, 0, 100))
+
+
+def widget_style(widget):
+    return QApplication.style() if widget is None else widget.style()
+
+
+class CueItemDelegate(QStyledItemDelegate):
+    """Paint a cell of the cue list.
+
+    The background (and selection) is painted by the style, the content is
+    painted by `paintContent`, by default the item text.
+    The current (standby) row is highlighted.
+    """
+
+    MARGIN = 3
+
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        # Focus is already shown by the current row highlight
+        option.state &= ~QStyle.State_HasFocus
+
+        view = option.widget
+        if view is not None and view.currentIndex().row() == index.row():
+            option.backgroundBrush = ITEM_CURRENT_BG
+            # The cue color is not used on the highlighted background
+            option.palette.setBrush(QPalette.Text, view.palette().text())
+
+    def paint(self, painter, option, index):
+        option = QStyleOptionViewItem(option)
+        self.initStyleOption(option, index)
+
+        # Draw only the background, without text or icon
+        background = QStyleOptionViewItem(option)
+        background.text = ""
+        background.icon = QIcon()
+        background.features &= ~(
+            QStyleOptionViewItem.HasDisplay | QStyleOptionViewItem.HasDecoration
+        )
+        widget_style(option.widget).drawControl(
+            QStyle.CE_ItemViewItem, background, painter, option.widget
+        )
+
+        painter.save()
+        self.paintContent(painter, option, index)
+        painter.restore()
+
+    def paintContent(self, painter, option, index):
+        self.paintText(painter, option, option.rect)
+
+    def paintText(self, painter, option, rect):
+        if not option.text:
+            return
+
+        rect = rect.adjusted(self.MARGIN, 0, -self.MARGIN, 0)
+        text = QFontMetrics(option.font).elidedText(
+            option.text, option.textElideMode, rect.width()
+        )
+        role = (
+            QPalette.HighlightedText
+            if option.state & QStyle.State_Selected
+            else QPalette.Text
+        )
+
+        painter.setFont(option.font)
+        widget_style(option.widget).drawItemText(
+            painter,
+            rect,
+            int(option.displayAlignment),
+            option.palette,
+            bool(option.state & QStyle.State_Enabled),
+            text,
+            role,
+        )
+
+
+class IndexDelegate(CueItemDelegate):
+    def sizeHint(self, option, index):
+        size = super().sizeHint(option, index)
+        # Provide some spacing, depending on the current font
+        return size + QSize(
+            option.fontMetrics.size(Qt.TextSingleLine, "00").width(), 0
+        )
+
+
+class NameDelegate(CueItemDelegate):
+    ACCENT_WIDTH = 4
+
+    def paintContent(self, painter, option, index):
+        rect = option.rect
+        accent = index.data(AccentRole)
+
+        if accent is not None:
+            painter.fillRect(
+                QRect(rect.x(), rect.y(), self.ACCENT_WIDTH, rect.height()),
+                accent,
+            )
+            rect = rect.adjusted(self.ACCENT_WIDTH, 0, 0, 0)
+
+        self.paintText(painter, option, rect)
+
+
+class CueStatusDelegate(CueItemDelegate):
+    MARGIN = 6
+
+    def paintContent(self, painter, option, index):
+        painter.setRenderHint(QPainter.HighQualityAntialiasing, True)
+
+        rect = option.rect
+        indicator_height = rect.height()
+        indicator_width = indicator_height // 2
+        status_size = indicator_height - self.MARGIN * 2
+
+        view = option.widget
+        if view is not None and view.currentIndex().row() == index.row():
+            # Draw something like this
+            # |‾\
+            # |  \
+            # |  /
+            # |_/
+            path = QPainterPath()
+            path.moveTo(0, 1)
+            path.lineTo(0, indicator_height - 1)
+            path.lineTo(indicator_width // 3, indicator_height - 1)
+            path.lineTo(indicator_width, indicator_width)
+            path.lineTo(indicator_width // 3, 1)
+            path.lineTo(0, 1)
+            path.translate(rect.x(), rect.y())
+
+            painter.setPen(QPen(QBrush(QColor(0, 0, 0)), 2))
+            painter.setBrush(QBrush(QColor(250, 220, 0)))
+            painter.drawPath(path)
+
+        icon = index.data(Qt.DecorationRole)
+        if icon is not None:
+            painter.drawPixmap(
+                QRect(
+                    rect.x() + indicator_width + self.MARGIN,
+                    rect.y() + self.MARGIN,
+                    status_size,
+                    status_size,
+                ),
+                icon.pixmap(status_size),
+            )
+
+
+class NextActionDelegate(CueItemDelegate):
+    SIZE = 16
+
+    def paintContent(self, painter, option, index):
+        icon = index.data(Qt.DecorationRole)
+        if icon is not None:
+            rect = QRect(0, 0, self.SIZE, self.SIZE)
+            rect.moveCenter(option.rect.center())
+            icon.paint(painter, rect, Qt.AlignCenter)
+
+
+class TimeDelegate(CueItemDelegate):
+    """Paint a time (see `TimeData`) as a progress-bar.
+
+    The bars are painted by the style, using a hidden (template) progress-bar
+    for each state, so the theme rules for "#ListTimeWidget" are applied.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._font = QFontDatabase.systemFont(QFontDatabase.FixedFont)
+        # {state: QProgressBar}
+        self._templates = {}
+
+    def sizeHint(self, option, index):
+        size = super().sizeHint(option, index)
+        return QSize(size.width(), self._template("stop").sizeHint().height())
+
+    def paintContent(self, painter, option, index):
+        data = index.data(TimeRole)
+        if data is None:
+            return
+
+        template = self._template(data.state)
+
+        bar = QStyleOptionProgressBar()
+        bar.initFrom(template)
+        bar.rect = option.rect
+        bar.state |= QStyle.State_Horizontal
+        bar.orientation = Qt.Horizontal
+        bar.textAlignment = Qt.AlignCenter
+        # Avoid settings min and max to 0, or the bar go in busy state
+        bar.minimum = 0 if data.duration > 0 else -1
+        bar.maximum = max(int(data.duration), 0)
+        bar.progress = max(bar.minimum, min(int(data.value), bar.maximum))
+        bar.textVisible = data.text is not None
+        bar.text = data.text or ""
+        if data.duration <= 0:
+            # Display as disabled
+            bar.state &= ~QStyle.State_Enabled
+
+        painter.setFont(self._font)
+        template.style().drawControl(
+            QStyle.CE_ProgressBar, bar, painter, template
+        )
+
+    def _template(self, state):
+        template = self._templates.get(state)
+        if template is None:
+            template = QProgressBar(self.parent())
+            template.setObjectName("ListTimeWidget")
+            template.setProperty("state", state)
+            template.setFont(self._font)
+            template.hide()
+            template.ensurePolished()
+
+            self._templates[state] = template
+
+        return template
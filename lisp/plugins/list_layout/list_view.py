@@ -15,38 +15,43 @@
 # You should have received a copy of the GNU General Public License
 # along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
 
+from itertools import groupby
+
 from PyQt5.QtCore import (
     pyqtSignal,
     Qt,
     QDataStream,
     QIODevice,
+    QItemSelection,
+    QItemSelectionModel,
+    QModelIndex,
+    QRect,
     QT_TRANSLATE_NOOP,
     QTimer,
 )
-from PyQt5.QtGui import QKeyEvent, QContextMenuEvent, QBrush, QColor
-from PyQt5.QtWidgets import QTreeWidget, QHeaderView, QTreeWidgetItem
+from PyQt5.QtGui import QKeyEvent, QContextMenuEvent
+from PyQt5.QtWidgets import QTreeView, QHeaderView
 
 from lisp.application import Application
 from lisp.backend import get_backend
 from lisp.command.model import ModelMoveItemsCommand, ModelInsertItemsCommand
-from lisp.core.util import subdict
-from lisp.plugins.list_layout.list_widgets import (
-    CueStatusIcons,
-    NameWidget,
-    PreWaitWidget,
-    CueTimeWidget,
-    NextActionIcon,
-    PostWaitWidget,
-    IndexWidget,
+from lisp.core.signal import Connection
+from lisp.plugins.list_layout.list_delegates import (
+    CueStatusDelegate,
+    IndexDelegate,
+    NameDelegate,
+    NextActionDelegate,
+    TimeDelegate,
 )
-from lisp.ui.ui_utils import translate, css_to_dict, dict_to_css
+from lisp.plugins.list_layout.models import CueListTableModel, CueRole
+from lisp.ui.ui_utils import translate
 from lisp.cues.group_cue import GroupCue
 
 
 class ListColumn:
-    def __init__(self, name, widget, resize=None, width=None, visible=True):
+    def __init__(self, name, delegate, resize=None, width=None, visible=True):
         self.baseName = name
-        self.widget = widget
+        self.delegate = delegate
         self.resize = resize
         self.width = width
         self.visible = visible
@@ -56,62 +61,69 @@ class ListColumn:
         return translate("ListLayoutHeader", self.baseName)
 
 
-class CueTreeWidgetItem(QTreeWidgetItem):
-    def __init__(self, cue, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-
-        self.cue = cue
-        self.current = False
+class CueListView(QTreeView):
+    """A virtualised view of a CueListModel.
 
+    Cells are painted by delegates (see `list_delegates`) only when visible,
+    data is provided by a `CueListTableModel`.
+    """
 
-# TODO: use a custom Model/View
-class CueListView(QTreeWidget):
     keyPressed = pyqtSignal(QKeyEvent)
     contextMenuInvoked = pyqtSignal(QContextMenuEvent)
+    # (int) the new standby index, -1 if none
+    standbyChanged = pyqtSignal(int)
 
     # TODO: add ability to show/hide
     # TODO: implement columns (cue-type / target / etc..)
     COLUMNS = [
-        ListColumn("", CueStatusIcons, QHeaderView.Fixed, width=45),
-        ListColumn("#", IndexWidget, QHeaderView.ResizeToContents),
+        ListColumn("", CueStatusDelegate, QHeaderView.Fixed, width=45),
+        ListColumn("#", IndexDelegate, QHeaderView.ResizeToContents),
         ListColumn(
             QT_TRANSLATE_NOOP("ListLayoutHeader", "Cue"),
-            NameWidget,
+            NameDelegate,
             QHeaderView.Stretch,
         ),
         ListColumn(
-            QT_TRANSLATE_NOOP("ListLayoutHeader", "Pre wait"), PreWaitWidget
+            QT_TRANSLATE_NOOP("ListLayoutHeader", "Pre wait"), TimeDelegate
         ),
         ListColumn(
-            QT_TRANSLATE_NOOP("ListLayoutHeader", "Action"), CueTimeWidget
+            QT_TRANSLATE_NOOP("ListLayoutHeader", "Action"), TimeDelegate
         ),
         ListColumn(
-            QT_TRANSLATE_NOOP("ListLayoutHeader", "Post wait"), PostWaitWidget
+            QT_TRANSLATE_NOOP("ListLayoutHeader", "Post wait"), TimeDelegate
         ),
-        ListColumn("", NextActionIcon, QHeaderView.Fixed, width=18),
+        ListColumn("", NextActionDelegate, QHeaderView.Fixed, width=18),
     ]
 
-    ITEM_DEFAULT_BG = QBrush(Qt.transparent)
-    ITEM_CURRENT_BG = QBrush(QColor(250, 220, 0, 100))
-
     def __init__(self, listModel, parent=None):
         """
         :type listModel: lisp.plugins.list_layout.models.CueListModel
         """
         super().__init__(parent)
-        self.__itemMoving = False
         self.__scrollRangeGuard = False
 
-        # Watch for model changes
         self._model = listModel
-        self._model.item_added.connect(self.__cueAdded)
-        self._model.item_moved.connect(self.__cueMoved)
-        self._model.item_removed.connect(self.__cueRemoved)
-        self._model.model_reset.connect(self.__modelReset)
+        self._tableModel = CueListTableModel(
+            listModel, (c.name for c in CueListView.COLUMNS), self
+        )
+        self._tableModel.rowsInserted.connect(self.__rowsInserted)
+        self._tableModel.propertiesChanged.connect(self.__cuePropsChanged)
+        self.setModel(self._tableModel)
 
-        # Setup the columns headers
-        self.setHeaderLabels((c.name for c in CueListView.COLUMNS))
+        # Only the rows of the cues affected by a group change are updated
+        self._model.model.groups.visibility_changed.connect(
+            self.__updateChildrenVisibility, Connection.QtQueued
+        )
+
+        # Scroll to the last added row, once per event-loop iteration
+        self.__addedRow = -1
+        self.__scrollTimer = QTimer(self)
+        self.__scrollTimer.setSingleShot(True)
+        self.__scrollTimer.timeout.connect(self.__scrollToAdded)
+
+        # Setup the columns
         for i, column in enumerate(CueListView.COLUMNS):
+            self.setItemDelegateForColumn(i, column.delegate(self))
             if column.resize is not None:
                 self.header().setSectionResizeMode(i, column.resize)
             if column.width is not None:
@@ -119,18 +131,24 @@ class CueListView(QTreeWidget):
 
         self.header().setDragEnabled(False)
         self.header().setStretchLastSection(False)
+        # Size the columns by their content using only the visible rows
+        self.header().setResizeContentsPrecision(0)
 
         self.setDragDropMode(self.InternalMove)
+        self.setSelectionBehavior(self.SelectRows)
 
         # Set some visual options
         self.setIndentation(0)
+        self.setRootIsDecorated(False)
+        self.setItemsExpandable(False)
+        self.setUniformRowHeights(True)
         self.setAlternatingRowColors(True)
         self.setVerticalScrollMode(self.ScrollPerItem)
 
         # This allows to have some spare space at the end of the scroll-area
         self.verticalScrollBar().rangeChanged.connect(self.__updateScrollRange)
-        self.currentItemChanged.connect(
-            self.__currentItemChanged, Qt.QueuedConnection
+        self.selectionModel().currentRowChanged.connect(
+            self.__currentRowChanged, Qt.QueuedConnection
         )
 
     def dragEnterEvent(self, event):
@@ -145,10 +163,10 @@ class CueListView(QTreeWidget):
     def dropEvent(self, event):
         if event.mimeData().hasUrls():
             # Check if dropping on a GroupCue
-            item = self.itemAt(event.pos())
-            if item and isinstance(item.cue, GroupCue):
+            cue = self.indexAt(event.pos()).data(CueRole)
+            if isinstance(cue, GroupCue):
                 # Add files as cues inside the group
-                self._add_cues_to_group_from_urls(item.cue, event.mimeData().urls())
+                self._add_cues_to_group_from_urls(cue, event.mimeData().urls())
             else:
                 # If files are being dropped, add them as cues at root level
                 get_backend().add_cue_from_urls(event.mimeData().urls())
@@ -157,9 +175,7 @@ class CueListView(QTreeWidget):
 
             # Decode mimedata information about the drag&drop event, since only
             # internal movement are allowed we assume the data format is correct
-            data = event.mimeData().data(
-                "application/x-qabstractitemmodeldatalist"
-            )
+            data = event.mimeData().data(CueListTableModel.MimeType)
             stream = QDataStream(data, QIODevice.ReadOnly)
 
             # Get the starting-item row
@@ -211,7 +227,7 @@ class CueListView(QTreeWidget):
     def mousePressEvent(self, event):
         if (
             not event.buttons() & Qt.RightButton
-            or not self.selectionMode() == QTreeWidget.NoSelection
+            or not self.selectionMode() == QTreeView.NoSelection
         ):
             super().mousePressEvent(event)
 
@@ -219,12 +235,56 @@ class CueListView(QTreeWidget):
         super().resizeEvent(event)
         self.updateHeadersSizes()
 
+    def currentChanged(self, current, previous):
+        super().currentChanged(current, previous)
+
+        # The current row is highlighted in all the columns
+        self.__updateRow(previous.row())
+        self.__updateRow(current.row())
+
+        self.standbyChanged.emit(current.row())
+
     def standbyIndex(self):
-        return self.indexOfTopLevelItem(self.currentItem())
+        return self.currentIndex().row()
 
     def setStandbyIndex(self, newIndex):
-        if 0 <= newIndex < self.topLevelItemCount():
-            self.setCurrentItem(self.topLevelItem(newIndex))
+        if 0 <= newIndex < self._tableModel.rowCount():
+            self.setCurrentIndex(self._tableModel.index(newIndex, 0))
+
+    def selectedRows(self):
+        """The selected rows, in ascending order."""
+        return sorted(
+            index.row() for index in self.selectionModel().selectedRows()
+        )
+
+    def setRowsSelected(self, rows, selected=True):
+        """Select, or deselect, the given rows, with a single operation."""
+        command = (
+            QItemSelectionModel.Select
+            if selected
+            else QItemSelectionModel.Deselect
+        )
+        selection = QItemSelection()
+        for first, last in self.__rowRanges(sorted(rows)):
+            selection.select(
+                self._tableModel.index(first, 0),
+                self._tableModel.index(last, 0),
+            )
+
+        self.selectionModel().select(
+            selection, command | QItemSelectionModel.Rows
+        )
+
+    def invertSelection(self):
+        rows = self._tableModel.rowCount()
+        if rows:
+            self.selectionModel().select(
+                QItemSelection(
+                    self._tableModel.index(0, 0),
+                    self._tableModel.index(rows - 1, 0),
+                ),
+                QItemSelectionModel.Toggle | QItemSelectionModel.Rows,
+            )
 
     def updateHeadersSizes(self):
         """Some hack to have "stretchable" columns with a minimum size
@@ -246,141 +306,61 @@ class CueListView(QTreeWidget):
                 header.setSectionResizeMode(i, QHeaderView.Fixed)
                 header.resizeSection(i, max(contentWidth, stretchWidth))
 
-    def __currentItemChanged(self, current, previous):
-        if previous is not None:
-            previous.current = False
-            self.__updateItemStyle(previous)
-
-        if current is not None:
-            current.current = True
-            self.__updateItemStyle(current)
-
-            if self.selectionMode() == QTreeWidget.NoSelection:
+    def __currentRowChanged(self):
+        current = self.currentIndex()
+        if current.isValid():
+            if self.selectionMode() == QTreeView.NoSelection:
                 # Ensure the current item is in the middle of the viewport.
                 # This is skipped in "selection-mode" otherwise it creates
                 # confusion during drang&drop operations
-                self.scrollToItem(current, QTreeWidget.PositionAtCenter)
-            elif not self.selectedIndexes():
-                current.setSelected(True)
-
-    def __updateItemStyle(self, item):
-        if item.treeWidget() is not None:
-            css = css_to_dict(item.cue.stylesheet)
-            brush = QBrush()
-
-            if item.current:
-                widget_css = subdict(css, ("font-size",))
-                brush = CueListView.ITEM_CURRENT_BG
-            else:
-                widget_css = subdict(css, ("color", "font-size"))
-                css_bg = css.get("background")
-                if css_bg is not None:
-                    color = QColor(css_bg)
-                    # Stronger alpha for better visibility
-                    color.setAlpha(150)
-                    brush = QBrush(color)
-
-                # Highlight Group Cues with a left border accent
-                if isinstance(item.cue, GroupCue):
-                    accent = css_bg or "#4a7a9a"
-                    widget_css["border-left"] = f"4px solid {accent}"
-                    widget_css["border-radius"] = "3px"
-                    # Make group names a bit bolder
-                    widget_css.setdefault("font-weight", "600")
-
-            for column in range(self.columnCount()):
-                self.itemWidget(item, column).setStyleSheet(
-                    dict_to_css(widget_css)
-                )
-                item.setBackground(column, brush)
+                self.scrollTo(current, QTreeView.PositionAtCenter)
+            elif not self.selectionModel().hasSelection():
+                self.setRowsSelected((current.row(),))
+
+    def __updateRow(self, row):
+        if row >= 0:
+            rect = self.visualRect(self._tableModel.index(row, 0))
+            self.viewport().update(
+                QRect(0, rect.y(), self.viewport().width(), rect.height())
+            )
 
-    def __cuePropChanged(self, cue, property_name, _):
-        if property_name == "stylesheet":
-            self.__updateItemStyle(self.topLevelItem(cue.index))
-        if property_name == "name":
+    def __cuePropsChanged(self, properties):
+        if "name" in properties:
             QTimer.singleShot(1, self.updateHeadersSizes)
-        # If group's open state or children changed, refresh visibility
-        if property_name in ("open", "children"):
-            QTimer.singleShot(0, self.__updateChildrenVisibility)
-
-    def __cueAdded(self, cue):
-        item = CueTreeWidgetItem(cue)
-        # Allow drop on GroupCue items for adding files as children
-        if not isinstance(cue, GroupCue):
-            item.setFlags(item.flags() & ~Qt.ItemIsDropEnabled)
-        cue.property_changed.connect(self.__cuePropChanged)
-
-        self.insertTopLevelItem(cue.index, item)
-        self.__setupItemWidgets(item)
-        self.__updateItemStyle(item)
-
-        if self.topLevelItemCount() == 1:
+
+    def __rowsInserted(self, parent, first, last):
+        if self._tableModel.rowCount() == 1:
             # If it's the only item in the view, set it as current
-            self.setCurrentItem(item)
+            self.setCurrentIndex(self._tableModel.index(first, 0))
         else:
             # Scroll to the last item added
-            self.scrollToItem(item)
+            self.__addedRow = last
+            self.__scrollTimer.start(0)
 
         # Ensure that the focus is set
         self.setFocus()
-        # Refresh visibility in case added cue is child of a closed group
-        QTimer.singleShot(0, self.__updateChildrenVisibility)
-
-    def __cueMoved(self, before, after):
-        item = self.takeTopLevelItem(before)
-        self.insertTopLevelItem(after, item)
-        self.__setupItemWidgets(item)
-
-    def __cueRemoved(self, cue):
-        cue.property_changed.disconnect(self.__cuePropChanged)
-        self.takeTopLevelItem(cue.index)
-        QTimer.singleShot(0, self.__updateChildrenVisibility)
-
-    def __modelReset(self):
-        self.reset()
-        self.clear()
-        QTimer.singleShot(0, self.__updateChildrenVisibility)
-
-    def __updateChildrenVisibility(self):
-        """Hide top-level items that are children of a GroupCue marked as closed.
-
-        This layout keeps cues as top-level items. A GroupCue can toggle
-        visibility of its children by setting its `open` property. When a
-        group is closed we hide all items whose id appears in that group's
-        children list.
+
+    def __scrollToAdded(self):
+        if 0 <= self.__addedRow < self._tableModel.rowCount():
+            self.scrollTo(self._tableModel.index(self.__addedRow, 0))
+
+    def __updateChildrenVisibility(self, cue_ids):
+        """Hide the rows of the cues children of a closed GroupCue.
+
+        This layout keeps cues as top-level items, a GroupCue can toggle the
+        visibility of its children by setting its `open` property.
+        Only the rows of the given cues are checked.
         """
-        try:
-            # Build set of child ids to hide (for groups where open==False)
-            hidden_ids = set()
-            app = Application()
-            for i in range(len(app.cue_model)):
-                g = app.cue_model.item(i)
-                if isinstance(g, GroupCue):
-                    try:
-                        if not getattr(g, "open", True):
-                            for cid in getattr(g, "children", ()):
-                                hidden_ids.add(cid)
-                    except Exception:
-                        continue
-
-            # Apply hiding to top-level items
-            for idx in range(self.topLevelItemCount()):
-                item = self.topLevelItem(idx)
-                if item and item.cue:
-                    # Never hide the group itself
-                    if item.cue.id in hidden_ids:
-                        item.setHidden(True)
-                    else:
-                        item.setHidden(False)
-        except Exception:
-            # Do not raise during UI refresh
-            pass
-
-    def __setupItemWidgets(self, item):
-        for i, column in enumerate(CueListView.COLUMNS):
-            self.setItemWidget(item, i, column.widget(item))
+        cueModel = self._model.model
+        rowCount = self._tableModel.rowCount()
+        root = QModelIndex()
 
-        self.updateGeometries()
+        for cue in filter(None, map(cueModel.get, cue_ids)):
+            row = cue.index
+            if 0 <= row < rowCount and self._model.item(row) is cue:
+                hidden = cueModel.groups.is_hidden(cue)
+                if self.isRowHidden(row, root) != hidden:
+                    self.setRowHidden(row, root, hidden)
 
     def __updateScrollRange(self, min_, max_):
         if not self.__scrollRangeGuard:
@@ -388,6 +368,13 @@ class CueListView(QTreeWidget):
             self.verticalScrollBar().setMaximum(max_ + 1)
             self.__scrollRangeGuard = False
 
+    @staticmethod
+    def __rowRanges(rows):
+        """Group the given (sorted) rows in (first, last) consecutive ranges."""
+        for _, group in groupby(enumerate(rows), lambda p: p[1] - p[0]):
+            group = list(group)
+            yield group[0][1], group[-1][1]
+
     def _add_cues_to_group_from_urls(self, group_cue, urls):
         """Add audio/video files as cues inside a group cue"""
         from lisp.backend import get_backend
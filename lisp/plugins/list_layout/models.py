@@ -15,18 +15,71 @@
 # You should have received a copy of the GNU General Public License
 # along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
 
+from functools import partial
+from threading import Lock
+from typing import NamedTuple, Optional
+
+from PyQt5.QtCore import (
+    QAbstractTableModel,
+    QDataStream,
+    QIODevice,
+    QMimeData,
+    QModelIndex,
+    Qt,
+    QTimer,
+    pyqtSignal,
+)
+from PyQt5.QtGui import QBrush, QColor, QFont
+
+from lisp.core.block_list import BlockList
 from lisp.core.model_adapter import ModelAdapter
 from lisp.core.proxy_model import ReadOnlyProxyModel
+from lisp.core.signal import Connection, Signal
+from lisp.core.util import strtime
+from lisp.cues.cue import Cue, CueNextAction, CueState
+from lisp.cues.cue_time import CueTime
+from lisp.cues.group_cue import GroupCue
+from lisp.ui.icons import IconTheme
+from lisp.ui.ui_utils import css_to_dict
+from lisp.ui.widgets.cue_next_actions import tr_next_action
+
+# The cue of the row
+CueRole = Qt.UserRole + 1
+# A `TimeData` for the time columns
+TimeRole = Qt.UserRole + 2
+# The color (QColor) of the left border of group cues
+AccentRole = Qt.UserRole + 3
 
 
 class CueListModel(ModelAdapter):
+    """Keep the cues in a list, providing the cues `index` property.
+
+    Cues are stored in a `BlockList`, which knows the position of its items,
+    so positions are computed on demand (see `Cue.index`), and are never
+    written into the cues.
+    Changing the list emits a single `indices_changed` signal, instead of
+    one `index` change for every following cue.
+    """
+
     def __init__(self, model):
         super().__init__(model)
-        self.__cues = []
+        # (start, stop) indices of the cues with a changed index
+        self.indices_changed = Signal()
+
+        self.__lock = Lock()
+        self.__cues = BlockList()
 
     def item(self, index):
         return self.__cues[index]
 
+    def index_of(self, cue):
+        """Return the index of the given cue.
+
+        :raise ValueError: if the cue is not in the list
+        """
+        with self.__lock:
+            return self.__cues.index(cue)
+
     def insert(self, item, index):
         item.index = index
         self.add(item)
@@ -41,51 +94,54 @@ class CueListModel(ModelAdapter):
             if new_index >= len(self.__cues):
                 new_index = len(self.__cues) - 1
 
-            cue = self.__cues.pop(old_index)
-            self.__cues.insert(new_index, cue)
-
-            if old_index < new_index:
-                min_index = old_index
-                max_index = new_index
-            else:
-                min_index = new_index
-                max_index = old_index
+            with self.__lock:
+                self.__cues.insert(new_index, self.__cues.pop(old_index))
 
-            self._update_indices(min_index, max_index + 1)
             self.item_moved.emit(old_index, new_index)
+            self.indices_changed.emit(
+                min(old_index, new_index), max(old_index, new_index) + 1
+            )
 
     def _model_reset(self):
-        self.__cues.clear()
+        for cue in self.__cues:
+            Cue.index.set_provider(cue, None)
+
+        with self.__lock:
+            self.__cues.clear()
+
         self.model_reset.emit()
 
     def _item_added(self, item):
-        if not isinstance(item.index, int) or not 0 <= item.index <= len(
-            self.__cues
-        ):
-            item.index = len(self.__cues)
+        with self.__lock:
+            index = item.index
+            if not isinstance(index, int) or not 0 <= index <= len(self.__cues):
+                index = len(self.__cues)
+
+            self.__cues.insert(index, item)
 
-        self.__cues.insert(item.index, item)
-        self._update_indices(item.index)
+        Cue.index.set_provider(item, self.index_of)
 
         self.item_added.emit(item)
+        if index + 1 < len(self.__cues):
+            self.indices_changed.emit(index + 1, len(self.__cues))
 
     def _item_removed(self, item):
-        self.__cues.pop(item.index)
-        self._update_indices(item.index)
+        # From now on the cue keep its last index (e.g. to be re-inserted)
+        Cue.index.set_provider(item, None)
+        index = item.index
 
-        self.item_removed.emit(item)
-
-    def _update_indices(self, start, stop=-1):
-        """Update the indices of cues from start to stop-1"""
-        if not 0 <= stop <= len(self.__cues):
-            stop = len(self.__cues)
+        with self.__lock:
+            del self.__cues[index]
 
-        for index in range(start, stop):
-            self.__cues[index].index = index
+        self.item_removed.emit(item)
+        if index < len(self.__cues):
+            self.indices_changed.emit(index, len(self.__cues))
 
     def __iter__(self):
-        for cue in self.__cues:
-            yield cue
+        yield from self.__cues
+
+    def __len__(self):
+        return len(self.__cues)
 
 
 class RunningCueModel(ReadOnlyProxyModel):
@@ -135,3 +191,474 @@ class RunningCueModel(ReadOnlyProxyModel):
 
     def __contains__(self, item):
         return item in self.__playing
+
+
+class TimeData(NamedTuple):
+    state: str
+    """One of "running", "pause", "stop" or "error" """
+    value: int
+    """Current time (milliseconds)"""
+    duration: int
+    """Total time (milliseconds), the time is disabled when <= 0"""
+    text: Optional[str]
+    """Displayed text, None to hide the text"""
+
+
+class CueListTableModel(QAbstractTableModel):
+    """Expose a CueListModel to the Qt model/view framework.
+
+    Rows are the cues, in the list order, columns are fixed (see the
+    `*Column` constants). Changes to the cues, notified by the CueModel,
+    only mark them as changed, the changed rows are refreshed together,
+    with a single `dataChanged`, once per event-loop iteration.
+    Action times are taken from the batches of the `CueTime` broadcaster,
+    wait times are sampled by a single timer, only while some cue is waiting.
+    """
+
+    StatusColumn = 0
+    IndexColumn = 1
+    NameColumn = 2
+    PreWaitColumn = 3
+    ActionColumn = 4
+    PostWaitColumn = 5
+    NextActionColumn = 6
+
+    # Interval between wait times updates (milliseconds)
+    WaitInterval = 33
+    # Used for the drag&drop of rows, as QAbstractItemModel does
+    MimeType = "application/x-qabstractitemmodeldatalist"
+    # Left border color of group cues without a background
+    GroupAccent = "#4a7a9a"
+
+    # (set) names of the cues properties changed since the last refresh
+    propertiesChanged = pyqtSignal(set)
+
+    def __init__(self, listModel, headers, parent=None):
+        """
+        :param listModel: A CueListModel over a CueModel
+        :type listModel: lisp.plugins.list_layout.models.CueListModel
+        :param headers: The columns headers text
+        """
+        super().__init__(parent)
+        self._model = listModel
+        self._headers = list(headers)
+
+        self.__lock = Lock()
+        # {cue_id: cue} changed since the last refresh
+        self.__changed = {}
+        self.__changedProperties = set()
+        # Emitted once for every batch of changes
+        self.__refresh = Signal()
+        self.__refresh.connect(self.__refreshChanged, Connection.QtQueued)
+
+        # {cue_id: cue}
+        self.__cues = {}
+        # {cue_id: slot}, wait signals have no arguments, we need a slot
+        # bound to the cue, it must be kept alive (signals use weakrefs)
+        self.__waitSlots = {}
+        # {cue_id: CueTime}, created the first time a cue is started
+        self.__cueTimes = {}
+        # {cue_id: time} of the running/paused cues
+        self.__times = {}
+        # {cue_id: (stylesheet, style)}
+        self.__styles = {}
+        # {cue_id: cue} of the cues in pre/post wait
+        self.__waiting = {}
+
+        self.__waitTimer = QTimer(self)
+        self.__waitTimer.setInterval(self.WaitInterval)
+        self.__waitTimer.timeout.connect(self.__updateWaiting)
+
+        CueTime._Broadcaster.updated.connect(self.__timesUpdated)
+
+        self._model.item_added.connect(self.__cueAdded)
+        self._model.item_moved.connect(self.__cueMoved)
+        self._model.item_removed.connect(self.__cueRemoved)
+        self._model.indices_changed.connect(self.__indicesChanged)
+        self._model.model_reset.connect(self.__modelReset)
+        self._model.model.cue_state_changed.connect(self.__cueChanged)
+        self._model.model.cue_properties_changed.connect(
+            self.__cuePropertiesChanged
+        )
+
+        for cue in self._model:
+            self.__connect(cue)
+
+    def cue(self, row):
+        return self._model.item(row)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._model)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if (
+            orientation == Qt.Horizontal
+            and role == Qt.DisplayRole
+            and 0 <= section < len(self._headers)
+        ):
+            return self._headers[section]
+
+    def flags(self, index):
+        if not index.isValid():
+            # Allow to drop between the rows
+            return Qt.ItemIsDropEnabled
+
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsDragEnabled
+        # Files can be dropped on group cues, to add them as children
+        if isinstance(self._model.item(index.row()), GroupCue):
+            flags |= Qt.ItemIsDropEnabled
+
+        return flags
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        cue = self._model.item(index.row())
+        column = index.column()
+
+        if role == CueRole:
+            return cue
+        if role == Qt.DisplayRole:
+            if column == self.IndexColumn:
+                return str(index.row() + 1)
+            if column == self.NameColumn:
+                return cue.name
+            if self.PreWaitColumn <= column <= self.PostWaitColumn:
+                return self.__timeData(cue, column).text
+        elif role == TimeRole:
+            if self.PreWaitColumn <= column <= self.PostWaitColumn:
+                return self.__timeData(cue, column)
+        elif role == Qt.DecorationRole:
+            if column == self.StatusColumn:
+                return self.__statusIcon(cue)
+            if column == self.NextActionColumn:
+                return self.__nextActionIcon(cue)
+        elif role == Qt.ToolTipRole:
+            if column == self.NextActionColumn:
+                return tr_next_action(CueNextAction(cue.next_action))
+        elif role == Qt.TextAlignmentRole:
+            if column == self.IndexColumn:
+                return Qt.AlignCenter
+            if column == self.NameColumn:
+                return Qt.AlignLeft | Qt.AlignVCenter
+        elif role == Qt.FontRole:
+            if column == self.IndexColumn or column == self.NameColumn:
+                return self.__cueStyle(cue).font
+        elif role == Qt.ForegroundRole:
+            return self.__cueStyle(cue).foreground
+        elif role == Qt.BackgroundRole:
+            return self.__cueStyle(cue).background
+        elif role == AccentRole:
+            return self.__cueStyle(cue).accent
+
+        return None
+
+    def supportedDropActions(self):
+        return Qt.MoveAction | Qt.CopyAction
+
+    def mimeTypes(self):
+        return [self.MimeType]
+
+    def mimeData(self, indexes):
+        """Encode only the rows of the given indexes.
+
+        The format is the one used by QAbstractItemModel, without the items
+        data (rows are enough to move/copy the cues).
+        """
+        data = QMimeData()
+        encoded = data.data(self.MimeType)
+        stream = QDataStream(encoded, QIODevice.WriteOnly)
+
+        for row in sorted({index.row() for index in indexes}):
+            # row, column, number of (role, value) pairs
+            stream.writeInt(row)
+            stream.writeInt(0)
+            stream.writeInt(0)
+
+        data.setData(self.MimeType, encoded)
+        return data
+
+    def __timeData(self, cue, column):
+        if column == self.ActionColumn:
+            return self.__actionTime(cue, "error")
+        if column == self.PreWaitColumn:
+            return self.__waitTime(
+                cue,
+                cue.pre_wait,
+                cue.prewait_time,
+                CueState.PreWait,
+                CueState.PreWait_Pause,
+            )
+
+        if cue.next_action in (
+            CueNextAction.TriggerAfterEnd,
+            CueNextAction.SelectAfterEnd,
+        ):
+            # The post-wait is the cue itself
+            return self.__actionTime(cue, "stop")
+
+        return self.__waitTime(
+            cue,
+            cue.post_wait,
+            cue.postwait_time,
+            CueState.PostWait,
+            CueState.PostWait_Pause,
+        )
+
+    def __actionTime(self, cue, errorState):
+        duration = cue.duration
+        state = cue.state
+
+        if state & (CueState.Running | CueState.Pause):
+            time = self.__times.get(cue.id, 0)
+            return TimeData(
+                "running" if state & CueState.Running else "pause",
+                time,
+                duration,
+                strtime(time, accurate=1) if duration > 0 else None,
+            )
+
+        return TimeData(
+            errorState if state & CueState.Error else "stop",
+            0,
+            duration,
+            strtime(duration, accurate=2) if duration > 0 else None,
+        )
+
+    def __waitTime(self, cue, wait, current, running, paused):
+        # The wait time is in seconds, we need milliseconds
+        duration = wait * 1000
+        state = cue.state
+
+        if state & (running | paused):
+            time = int(current() * 100) * 10
+            return TimeData(
+                "running" if state & running else "pause",
+                time,
+                duration,
+                strtime(time, accurate=1),
+            )
+
+        return TimeData("stop", 0, duration, strtime(duration, accurate=2))
+
+    def __statusIcon(self, cue):
+        state = cue.state
+        if state & CueState.Running:
+            return IconTheme.get("led-running")
+        if state & CueState.Pause:
+            return IconTheme.get("led-pause")
+        if state & CueState.Error:
+            return IconTheme.get("led-error")
+
+        return None
+
+    def __nextActionIcon(self, cue):
+        action = CueNextAction(cue.next_action)
+        if action in (
+            CueNextAction.TriggerAfterWait,
+            CueNextAction.TriggerAfterEnd,
+        ):
+            return IconTheme.get("cue-trigger-next")
+        if action in (
+            CueNextAction.SelectAfterWait,
+            CueNextAction.SelectAfterEnd,
+        ):
+            return IconTheme.get("cue-select-next")
+
+        return None
+
+    def __cueStyle(self, cue):
+        cached = self.__styles.get(cue.id)
+        if cached is None or cached[0] != cue.stylesheet:
+            cached = (cue.stylesheet, CueStyle.fromCue(cue, self.GroupAccent))
+            self.__styles[cue.id] = cached
+
+        return cached[1]
+
+    def __connect(self, cue):
+        self.__cues[cue.id] = cue
+        self.__waitSlots[cue.id] = slot = partial(self.__cueChanged, cue)
+
+        # The end of the waits is detected by the wait timer
+        cue.prewait_start.connect(slot)
+        cue.postwait_start.connect(slot)
+
+    def __disconnect(self, cue):
+        self.__cues.pop(cue.id, None)
+        self.__cueTimes.pop(cue.id, None)
+        self.__times.pop(cue.id, None)
+        self.__styles.pop(cue.id, None)
+        self.__waiting.pop(cue.id, None)
+        slot = self.__waitSlots.pop(cue.id, None)
+
+        if slot is not None:
+            cue.prewait_start.disconnect(slot)
+            cue.postwait_start.disconnect(slot)
+
+    def __cueChanged(self, cue):
+        # Can be called from any thread, also for cues not (yet) in the list
+        with self.__lock:
+            refresh = not self.__changed
+            self.__changed[cue.id] = cue
+
+        if refresh:
+            self.__refresh.emit()
+
+    def __cuePropertiesChanged(self, cue, properties):
+        with self.__lock:
+            self.__changedProperties.update(properties)
+
+        self.__cueChanged(cue)
+
+    def __refreshChanged(self):
+        with self.__lock:
+            changed, self.__changed = self.__changed, {}
+            properties = self.__changedProperties
+            self.__changedProperties = set()
+
+        rows = []
+        for cue in changed.values():
+            if cue.id in self.__cues:
+                self.__updateTimes(cue)
+                rows.append(cue.index)
+
+        if rows:
+            self.__rowsChanged(min(rows), max(rows))
+        if properties:
+            self.propertiesChanged.emit(properties)
+
+    def __updateTimes(self, cue):
+        state = cue.state
+
+        if state & CueState.Running:
+            if cue.id not in self.__cueTimes:
+                # From now on, the cue time is sampled while running
+                self.__cueTimes[cue.id] = CueTime(cue)
+        elif state & CueState.Pause:
+            self.__times[cue.id] = cue.current_time()
+        else:
+            self.__times.pop(cue.id, None)
+
+        if state & (CueState.PreWait | CueState.PostWait):
+            self.__waiting[cue.id] = cue
+            if not self.__waitTimer.isActive():
+                self.__waitTimer.start()
+
+    def __updateWaiting(self):
+        rows = []
+        for cue in list(self.__waiting.values()):
+            if not cue.state & (CueState.PreWait | CueState.PostWait):
+                del self.__waiting[cue.id]
+            if cue.id in self.__cues:
+                rows.append(cue.index)
+
+        if not self.__waiting:
+            self.__waitTimer.stop()
+
+        if rows:
+            # The post-wait column can show the cue time, all cells are
+            # updated, to reflect the state changes
+            self.__rowsChanged(min(rows), max(rows))
+
+    def __timesUpdated(self, times):
+        rows = []
+        for cue_id, time in times.items():
+            cue = self.__cues.get(cue_id)
+            if cue is not None:
+                self.__times[cue_id] = time
+                rows.append(cue.index)
+
+        if rows:
+            self.dataChanged.emit(
+                self.index(min(rows), self.ActionColumn),
+                self.index(max(rows), self.PostWaitColumn),
+                [Qt.DisplayRole, TimeRole],
+            )
+
+    def __rowsChanged(self, first, last):
+        self.dataChanged.emit(
+            self.index(first, 0), self.index(last, self.columnCount() - 1)
+        )
+
+    def __cueAdded(self, cue):
+        row = cue.index
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.__connect(cue)
+        self.endInsertRows()
+
+    def __cueMoved(self, before, after):
+        # Moving down, the destination is the row after the final position
+        destination = after + 1 if after > before else after
+        if self.beginMoveRows(
+            QModelIndex(), before, before, QModelIndex(), destination
+        ):
+            self.endMoveRows()
+
+    def __cueRemoved(self, cue):
+        # The cue keep its last index (see CueListModel)
+        row = cue.index
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self.__disconnect(cue)
+        self.endRemoveRows()
+
+    def __indicesChanged(self, start, stop):
+        stop = min(stop, len(self._model)) - 1
+        if start <= stop:
+            self.dataChanged.emit(
+                self.index(start, self.IndexColumn),
+                self.index(stop, self.IndexColumn),
+                [Qt.DisplayRole],
+            )
+
+    def __modelReset(self):
+        self.beginResetModel()
+        for cue in list(self.__cues.values()):
+            self.__disconnect(cue)
+        self.endResetModel()
+
+
+class CueStyle(NamedTuple):
+    font: Optional[QFont]
+    foreground: Optional[QBrush]
+    background: Optional[QBrush]
+    accent: Optional[QColor]
+
+    @classmethod
+    def fromCue(cls, cue, groupAccent):
+        """Build the style from the cue stylesheet."""
+        css = css_to_dict(cue.stylesheet)
+        group = isinstance(cue, GroupCue)
+
+        font = None
+        size = css.get("font-size", "")
+        if size or group:
+            font = QFont()
+            if size.endswith("px") and size[:-2].isdigit():
+                font.setPixelSize(int(size[:-2]))
+            elif size.endswith("pt") and size[:-2].isdigit():
+                font.setPointSize(int(size[:-2]))
+            if group:
+                # Make group names a bit bolder
+                font.setWeight(QFont.DemiBold)
+
+        foreground = None
+        if "color" in css:
+            foreground = QBrush(QColor(css["color"]))
+
+        background = None
+        if "background" in css:
+            color = QColor(css["background"])
+            # Stronger alpha for better visibility
+            color.setAlpha(150)
+            background = QBrush(color)
+
+        accent = None
+        if group:
+            # Highlight Group Cues with a left border accent
+            accent = QColor(css.get("background", groupAccent))
+
+        return cls(font, foreground, background, accent)
@@ -58,7 +58,7 @@ class RunningCueWidget(QWidget):
 
         self.cue = cue
         self.cue_time = CueTime(cue)
-        self.cue_time.notify.connect(self._time_updated, Connection.QtQueued)
+        self.cue_time.notify.connect(self._time_updated)
 
         # Use this to avoid transparent background
         self.gridLayoutWidget = QWidget(self)
@@ -97,6 +97,12 @@ class ListLayoutSettings(QScrollArea, SettingsPage):
         self.goDelaySpin.setMaximum(10000)
         self.behaviorsGroup.layout().addWidget(self.goDelaySpin, 4, 1)
 
+        self.armedCuesLabel = QLabel(self.behaviorsGroup)
+        self.behaviorsGroup.layout().addWidget(self.armedCuesLabel, 5, 0)
+        self.armedCuesSpin = QSpinBox(self.behaviorsGroup)
+        self.armedCuesSpin.setMaximum(16)
+        self.behaviorsGroup.layout().addWidget(self.armedCuesSpin, 5, 1)
+
         self.useFadeGroup = QGroupBox(self.contentWidget)
         self.useFadeGroup.setLayout(QGridLayout())
         self.contentWidget.layout().addWidget(self.useFadeGroup)
@@ -140,6 +146,12 @@ class ListLayoutSettings(QScrollArea, SettingsPage):
         self.goDelayLabel.setText(
             translate("ListLayout", "GO minimum interval (ms):")
         )
+        self.armedCuesLabel.setText(
+            translate("ListLayout", "Pre-loaded cues (from standby):")
+        )
+        self.armedCuesSpin.setSpecialValueText(
+            translate("ListLayout", "Disabled")
+        )
 
         self.useFadeGroup.setTitle(
             translate("ListLayout", "Use fade (buttons)")
@@ -165,6 +177,7 @@ class ListLayoutSettings(QScrollArea, SettingsPage):
         )
         self.goActionCombo.setCurrentItem(settings["goAction"])
         self.goDelaySpin.setValue(settings["goDelay"])
+        self.armedCuesSpin.setValue(settings["armedCues"])
 
         self.stopCueFade.setChecked(settings["stopCueFade"])
         self.pauseCueFade.setChecked(settings["pauseCueFade"])
@@ -186,6 +199,7 @@ class ListLayoutSettings(QScrollArea, SettingsPage):
             ),
             "goAction": self.goActionCombo.currentItem(),
             "goDelay": self.goDelaySpin.value(),
+            "armedCues": self.armedCuesSpin.value(),
             "goKeyDisabledWhilePlaying": self.goKeyDisabledWhilePlaying.isChecked(),
             "stopCueFade": self.stopCueFade.isChecked(),
             "pauseCueFade": self.pauseCueFade.isChecked(),
@@ -175,7 +175,7 @@ class ListLayoutView(QWidget):
         # CUE VIEW (center-left)
         self.listView = CueListView(listModel, self)
         self.listView.setMinimumWidth(200)
-        self.listView.currentItemChanged.connect(self.__listViewCurrentChanged)
+        self.listView.standbyChanged.connect(self.__listViewCurrentChanged)
         self.centralSplitter.addWidget(self.listView)
         self.centralSplitter.setCollapsible(0, False)
 
@@ -270,12 +270,10 @@ class ListLayoutView(QWidget):
         for n in range(splitter.count()):
             splitter.handle(n).setEnabled(enabled)
 
-    def __listViewCurrentChanged(self, current, _):
+    def __listViewCurrentChanged(self, index):
         cue = None
-        if current is not None:
-            index = self.listView.indexOfTopLevelItem(current)
-            if index < len(self.listModel):
-                cue = self.listModel.item(index)
+        if 0 <= index < len(self.listModel):
+            cue = self.listModel.item(index)
 
         self.infoPanel.cue = cue
         
@@ -37,8 +37,18 @@ class CuesListEndPoint(EndPoint):
     UriTemplate = "/cues"
 
     def on_get(self, request: Request, response: Response):
+        cue_model = self.app.cue_model
+        name = request.get_param("name")
+
+        if request.get_param_as_bool("running"):
+            cues = tuple(cue.id for cue in cue_model.running())
+        elif name is not None:
+            cues = tuple(cue.id for cue in cue_model.find(name))
+        else:
+            cues = tuple(cue_model.keys())
+
         response.status = falcon.HTTP_OK
-        response.text = json.dumps({"cues": tuple(self.app.cue_model.keys())})
+        response.text = json.dumps({"cues": cues})
 
 
 class CueEndPoint(EndPoint):
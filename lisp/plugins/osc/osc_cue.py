@@ -35,6 +35,7 @@ from PyQt5.QtWidgets import (
 )
 
 from lisp.core.decorators import async_function
+from lisp.core.executor import CueExecutor
 from lisp.core.fade_functions import FadeInType, FadeOutType
 from lisp.core.fader import Fader
 from lisp.core.has_properties import Property
@@ -149,7 +150,7 @@ class OscCue(Cue):
 
     __interrupt__ = __stop__
 
-    @async_function
+    @async_function(executor=CueExecutor)
     def __fade(self, fade_type):
         self.__position = 0
         self.__fader.prepare()
@@ -195,10 +195,8 @@ class OscBridge(QThread):
         logger.info(f"⏹️ OSC: STOP ALL command received")
         try:
             # Stop all cues in the model
-            for i in range(len(self.app.cue_model)):
-                cue = self.app.cue_model.item(i)
-                if cue:
-                    cue.execute(action=CueAction.Stop)
+            for cue in self.app.cue_model:
+                cue.execute(action=CueAction.Stop)
         except Exception as e:
             logger.error(f"❌ Error in stop_all: {e}")
     
@@ -214,10 +212,9 @@ class OscBridge(QThread):
             cue_index = int(parts[2])
             logger.info(f"▶️ OSC: Start cue {cue_index}")
             
-            if cue_index < len(self.app.cue_model):
-                cue = self.app.cue_model.item(cue_index)
-                if cue:
-                    cue.execute(action=CueAction.Start)
+            cue = self._cue_at(cue_index)
+            if cue is not None:
+                cue.execute(action=CueAction.Start)
             else:
                 logger.warning(f"⚠️ Cue index {cue_index} out of range")
         except (ValueError, IndexError) as e:
@@ -234,10 +231,9 @@ class OscBridge(QThread):
             cue_index = int(parts[2])
             logger.info(f"⏹️ OSC: Stop cue {cue_index}")
             
-            if cue_index < len(self.app.cue_model):
-                cue = self.app.cue_model.item(cue_index)
-                if cue:
-                    cue.execute(action=CueAction.Stop)
+            cue = self._cue_at(cue_index)
+            if cue is not None:
+                cue.execute(action=CueAction.Stop)
             else:
                 logger.warning(f"⚠️ Cue index {cue_index} out of range")
         except (ValueError, IndexError) as e:
@@ -254,15 +250,23 @@ class OscBridge(QThread):
             cue_index = int(parts[2])
             logger.info(f"⏸️ OSC: Pause cue {cue_index}")
             
-            if cue_index < len(self.app.cue_model):
-                cue = self.app.cue_model.item(cue_index)
-                if cue:
-                    cue.execute(action=CueAction.Pause)
+            cue = self._cue_at(cue_index)
+            if cue is not None:
+                cue.execute(action=CueAction.Pause)
             else:
                 logger.warning(f"⚠️ Cue index {cue_index} out of range")
         except (ValueError, IndexError) as e:
             logger.warning(f"⚠️ Could not parse cue index from {address}: {e}")
     
+    def _cue_at(self, index):
+        """Return the cue at the given index of the layout, or None"""
+        if index < 0:
+            return None
+        try:
+            return self.app.layout.cue_at(index)
+        except IndexError:
+            return None
+    
     # === Legacy Companion Handler ===
     
     def _execute_button(self, page, row, column):
@@ -303,8 +307,8 @@ class OscBridge(QThread):
             # Auto-map: try to execute cue at index button_index - 1
             if self._auto_map and button_index > 0:
                 cue_index = button_index - 1
-                if cue_index < len(self.app.cue_model):
-                    cue = self.app.cue_model.item(cue_index)
+                cue = self._cue_at(cue_index)
+                if cue is not None:
                     logger.info(f"▶️ Auto-executing cue {cue_index}: {cue.name}")
                     cue.execute(action=CueAction.Start)
                 else:
@@ -315,8 +319,9 @@ class OscBridge(QThread):
         logger.info("🎬 GO button pressed")
         # Find the next cue to execute
         # Simple approach: find first cue that's not running
-        for cue in self.app.cue_model:
-            if not cue.is_running():
+        cue_model = self.app.cue_model
+        for cue in self.app.layout.cues():
+            if not cue_model.is_running(cue):
                 logger.info(f"▶️ GO → {cue.name}")
                 cue.execute(action=CueAction.Start)
                 break
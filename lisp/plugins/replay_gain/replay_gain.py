@@ -137,6 +137,8 @@ class UpdateGainCommand(Command):
         self._old_volumes = []
 
     def add_media(self, media, new_volume):
+        # The media elements could be created on-demand
+        media.prepare()
         volume_element = media.element("Volume")
         if volume_element is not None:
             self._media_list.append(media)
@@ -20,9 +20,7 @@ import logging
 from enum import Enum
 from threading import Lock
 
-from lisp.core.clock import Clock
-from lisp.core.signal import Connection
-from lisp.cues.cue_time import CueTime
+from lisp.cues.cue_time import CueTime, CueTimeBroadcaster
 from lisp.ui.ui_utils import translate
 
 logger = logging.getLogger(__name__)
@@ -35,7 +33,8 @@ class TcFormat(Enum):
 
 
 class HRCueTime(CueTime):
-    _Clock = Clock(30)  # 1000 / 30  = 33.3333 milliseconds
+    # 1000 / 30  = 33.3333 milliseconds, delivered from the clock thread
+    _Broadcaster = CueTimeBroadcaster(30, qt=False)
 
 
 class TimecodeCueTracker:
@@ -98,8 +97,9 @@ class TimecodeCueTracker:
 
         # Send a "starting" time
         self.send(self.__cue.current_time())
-        # Start watching the new cue
-        self.__cue_time.notify.connect(self.send, Connection.QtQueued)
+        # Start watching the new cue, the clock doesn't tick in the Qt thread,
+        # sending directly avoid the delays of the Qt event-loop
+        self.__cue_time.notify.connect(self.send)
 
     def untrack(self):
         """Stop tracking the current cue"""
@@ -114,17 +114,20 @@ class TimecodeCueTracker:
         """Send time as timecode"""
         if self.__lock.acquire(blocking=False):
             try:
-                if not self.__protocol.send(self.format, time, self.__track):
-                    logger.warning(
-                        translate(
-                            "TimecodeWarning",
-                            "Cannot send timecode, untracking cue",
-                        )
-                    )
-                    self.untrack()
+                sent = self.__protocol.send(self.format, time, self.__track)
             finally:
                 self.__lock.release()
 
+            if not sent:
+                logger.warning(
+                    translate(
+                        "TimecodeWarning",
+                        "Cannot send timecode, untracking cue",
+                    )
+                )
+                # Outside the lock, untrack needs to acquire it
+                self.untrack()
+
     def finalize(self):
         self.untrack()
         self.protocol = None
@@ -108,9 +108,9 @@ class Timecode(Plugin):
         self.__cue_tracker.untrack()
         self.__cues.clear()
 
-    def __cue_changed(self, cue, property_name, value):
-        if property_name == "timecode":
-            if value.get("enabled", False):
+    def __cue_changed(self, cue, properties):
+        if "timecode" in properties:
+            if properties["timecode"].get("enabled", False):
                 cue.started.connect(
                     self.__cue_tracker.track, Connection.QtQueued
                 )
@@ -118,12 +118,12 @@ class Timecode(Plugin):
                 self.__disable_on_cue(cue)
 
     def __cue_added(self, cue):
-        cue.property_changed.connect(self.__cue_changed)
+        cue.properties_changed.connect(self.__cue_changed)
         # Check for current cue settings
-        self.__cue_changed(cue, "timecode", cue.timecode)
+        self.__cue_changed(cue, {"timecode": cue.timecode})
 
     def __cue_removed(self, cue):
-        cue.property_changed.disconnect(self.__cue_changed)
+        cue.properties_changed.disconnect(self.__cue_changed)
         self.__disable_on_cue(cue)
 
     def __disable_on_cue(self, cue):
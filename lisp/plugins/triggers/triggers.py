@@ -18,7 +18,7 @@
 from lisp.core.plugin import Plugin
 from lisp.core.properties import Property
 from lisp.cues.cue import Cue
-from lisp.plugins.triggers.triggers_handler import CueHandler
+from lisp.plugins.triggers.triggers_handler import TriggersGraph
 from lisp.plugins.triggers.triggers_settings import TriggersSettings
 from lisp.ui.settings.cue_settings import CueSettingsRegistry
 
@@ -31,7 +31,7 @@ class Triggers(Plugin):
     def __init__(self, app):
         super().__init__(app)
 
-        self.__handlers = {}
+        self.__graph = TriggersGraph(self.app.cue_model)
 
         # Register a Cue property to store settings
         Cue.triggers = Property({})
@@ -40,28 +40,35 @@ class Triggers(Plugin):
         # Register SettingsPage
         CueSettingsRegistry().add(TriggersSettings)
 
-        # On session destroy
+        # On session loaded/destroy
+        self.app.session_loaded.connect(self.__session_loaded)
         self.app.session_before_finalize.connect(self.session_reset)
 
         self.app.cue_model.item_added.connect(self.__cue_added)
         self.app.cue_model.item_removed.connect(self.__cue_removed)
 
     def session_reset(self):
-        self.__handlers.clear()
+        self.__graph.clear()
 
-    def __cue_changed(self, cue, property_name, value):
-        if property_name == "triggers":
-            if cue.id in self.__handlers:
-                self.__handlers[cue.id].triggers = cue.triggers
-            else:
-                self.__handlers[cue.id] = CueHandler(
-                    self.app, cue, cue.triggers
-                )
+    def latency_stats(self):
+        """Latency from the source signal to the targets execution.
+
+        :rtype: lisp.core.latency.LatencyStats
+        """
+        return self.__graph.latency_stats()
+
+    def __session_loaded(self, _):
+        self.__graph.check_cycles()
+
+    def __cue_changed(self, cue, properties):
+        if "triggers" in properties:
+            self.__graph.set_triggers(cue, properties["triggers"])
+            self.__graph.check_cycles()
 
     def __cue_added(self, cue):
-        cue.property_changed.connect(self.__cue_changed)
-        self.__cue_changed(cue, "triggers", cue.triggers)
+        cue.properties_changed.connect(self.__cue_changed)
+        self.__graph.cue_added(cue)
 
     def __cue_removed(self, cue):
-        cue.property_changed.disconnect(self.__cue_changed)
-        self.__handlers.pop(cue.id, None)
+        cue.properties_changed.disconnect(self.__cue_changed)
+        self.__graph.cue_removed(cue)
@@ -15,12 +15,20 @@
 # You should have received a copy of the GNU General Public License
 # along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
 
+import logging
+import time
+import weakref
 from enum import Enum
+from threading import RLock
 
 from PyQt5.QtCore import QT_TRANSLATE_NOOP
 
-from lisp.core.signal import Connection
+from lisp.core.executor import CueExecutor, TaskPriority
+from lisp.core.latency import LatencyCounter
 from lisp.cues.cue import CueAction
+from lisp.ui.ui_utils import translate
+
+logger = logging.getLogger(__name__)
 
 
 class CueTriggers(Enum):
@@ -31,31 +39,282 @@ class CueTriggers(Enum):
 
 
 class CueHandler:
-    def __init__(self, app, cue, triggers):
-        self.app = app
-        self.triggers = triggers
+    """Forward the state changes of a cue to the TriggersGraph."""
+
+    def __init__(self, graph, cue):
+        self.graph = graph
         self.cue = cue
 
-        self.cue.started.connect(self.__started, Connection.Async)
-        self.cue.paused.connect(self.__paused, Connection.Async)
-        self.cue.stopped.connect(self.__stopped, Connection.Async)
-        self.cue.end.connect(self.__ended, Connection.Async)
+        # Direct connections, only a task is submitted to the executor
+        self.cue.started.connect(self.__started)
+        self.cue.paused.connect(self.__paused)
+        self.cue.stopped.connect(self.__stopped)
+        self.cue.end.connect(self.__ended)
+
+    def disconnect(self):
+        self.cue.started.disconnect(self.__started)
+        self.cue.paused.disconnect(self.__paused)
+        self.cue.stopped.disconnect(self.__stopped)
+        self.cue.end.disconnect(self.__ended)
 
     def __paused(self):
-        self.__execute(CueTriggers.Paused.value)
+        self.graph.fire(self.cue, CueTriggers.Paused)
 
     def __started(self):
-        self.__execute(CueTriggers.Started.value)
+        self.graph.fire(self.cue, CueTriggers.Started)
 
     def __stopped(self):
-        self.__execute(CueTriggers.Stopped.value)
+        self.graph.fire(self.cue, CueTriggers.Stopped)
 
     def __ended(self):
-        self.__execute(CueTriggers.Ended.value)
+        self.graph.fire(self.cue, CueTriggers.Ended)
+
+
+class TriggersGraph:
+    """The triggers of the cues in a model, compiled for a fast dispatch.
+
+    The triggers settings (`{trigger: [(target_id, action), ...]}`) are
+    compiled, for every source cue, into tuples of (target, CueAction), with
+    the targets resolved once, and kept as weak-references. Sources are
+    recompiled only when their settings change, or when one of their
+    targets is added to, or removed from, the model.
+
+    Fired triggers are executed by the `CueExecutor`, in order for each
+    source cue, the latency from the source signal to the targets execution
+    is recorded.
+
+    Triggers closing a loop (e.g. A ended -> start B, B ended -> start A)
+    would keep the cues triggering each other forever, they are not
+    compiled, see `check_cycles`.
+    """
+
+    def __init__(self, cue_model, executor=CueExecutor):
+        """
+        :type cue_model: lisp.cues.cue_model.CueModel
+        :type executor: lisp.core.executor.PriorityExecutor
+        """
+        self._model = cue_model
+        self._executor = executor
+        self._latency = LatencyCounter()
+
+        self.__lock = RLock()
+        # {source_id: {CueTriggers: ((target_id, CueAction), ...)}}
+        self.__triggers = {}
+        # {source_id: {CueTriggers: ((weakref(target), CueAction), ...)}}
+        self.__compiled = {}
+        # {target_id: {source_id: None}}, used as ordered sets
+        self.__sources = {}
+        # {source_id: CueHandler}
+        self.__handlers = {}
+        # {(source_id, target_id)} of the triggers closing a loop
+        self.__broken = set()
+        # True when the cycles must be checked again
+        self.__dirty = False
+
+    def set_triggers(self, cue, triggers):
+        """Replace the triggers of the given cue, and compile them."""
+        parsed = self.__parse(cue, triggers)
+
+        with self.__lock:
+            self.__unlink(cue.id)
+
+            if parsed:
+                self.__triggers[cue.id] = parsed
+                for edges in parsed.values():
+                    for target_id, _ in edges:
+                        self.__sources.setdefault(target_id, {})[cue.id] = None
+
+                if cue.id not in self.__handlers:
+                    self.__handlers[cue.id] = CueHandler(self, cue)
+            else:
+                handler = self.__handlers.pop(cue.id, None)
+                if handler is not None:
+                    handler.disconnect()
+
+            self.__compile(cue.id)
+            self.__dirty = True
+
+    def cue_added(self, cue):
+        self.set_triggers(cue, cue.triggers)
+        self.__recompile_sources(cue)
+
+    def cue_removed(self, cue):
+        self.set_triggers(cue, {})
+        self.__recompile_sources(cue)
+
+    def clear(self):
+        with self.__lock:
+            for handler in self.__handlers.values():
+                handler.disconnect()
+
+            self.__triggers.clear()
+            self.__compiled.clear()
+            self.__sources.clear()
+            self.__handlers.clear()
+            self.__broken.clear()
+            self.__dirty = False
+
+    def fire(self, cue, trigger):
+        if self.__dirty:
+            self.check_cycles()
+
+        edges = self.__compiled.get(cue.id, {}).get(trigger)
+        if edges:
+            self._executor.submit(
+                self.__execute,
+                (edges, time.monotonic()),
+                priority=TaskPriority.Low,
+                key=(self, cue.id),
+            )
 
-    def __execute(self, trigger):
-        for target_id, action in self.triggers.get(trigger, []):
-            target = self.app.cue_model.get(target_id)
+    def check_cycles(self):
+        """Disable the triggers closing a loop, if the graph is changed.
 
+        The loops are found with a depth-first visit, for each one the
+        trigger closing it is disabled (not compiled), and a warning is
+        logged, the first time. Triggers are enabled again when the loop
+        is removed (e.g. by editing the triggers).
+        A cue triggering itself is a loop.
+        """
+        with self.__lock:
+            if not self.__dirty:
+                return
+
+            self.__dirty = False
+            cycles, broken = self.__find_cycles()
+            previous, self.__broken = self.__broken, broken
+
+            for source_id in {source_id for source_id, _ in previous ^ broken}:
+                self.__compile(source_id)
+
+        for cycle in cycles:
+            if (cycle[-1], cycle[0]) in previous:
+                continue
+
+            names = [self._model.get(cue_id).name for cue_id in cycle]
+            logger.warning(
+                translate(
+                    "Triggers",
+                    "Cues triggering each other in a loop: {}, the last "
+                    "trigger is disabled",
+                ).format(" -> ".join(names + names[:1]))
+            )
+
+    def latency_stats(self):
+        """Latency from the source signal to the targets execution.
+
+        :rtype: lisp.core.latency.LatencyStats
+        """
+        return self._latency.stats()
+
+    def __execute(self, edges, fired):
+        for target, action in edges:
+            target = target()
             if target is not None:
-                target.execute(CueAction(action))
+                self._latency.record(time.monotonic() - fired)
+                target.execute(action)
+
+    def __parse(self, cue, triggers):
+        """Parse the settings, invalid entries are logged and skipped."""
+        parsed = {}
+        for trigger, targets in triggers.items():
+            try:
+                trigger = CueTriggers(trigger)
+                edges = tuple(
+                    (target_id, CueAction(action))
+                    for target_id, action in targets
+                )
+            except (TypeError, ValueError):
+                logger.warning(
+                    translate(
+                        "Triggers", 'Invalid triggers for the cue "{}"'
+                    ).format(cue.name),
+                    exc_info=True,
+                )
+                continue
+
+            if edges:
+                parsed[trigger] = edges
+
+        return parsed
+
+    def __recompile_sources(self, cue):
+        """Compile again the triggers targeting the given cue."""
+        with self.__lock:
+            for source_id in tuple(self.__sources.get(cue.id, ())):
+                self.__compile(source_id)
+
+            self.__dirty = True
+
+    def __find_cycles(self):
+        """Return the cycles (lists of cue ids), and the edges closing them.
+
+        Only the cues in the model are considered. Every cue involved in a
+        cycle is reported, but not every possible cycle, without the closing
+        edges (source_id, target_id) the graph has no cycles.
+        """
+        graph = {
+            source_id: {
+                target_id: None
+                for edges in triggers.values()
+                for target_id, _ in edges
+                if target_id in self._model.keys()
+            }
+            for source_id, triggers in self.__triggers.items()
+        }
+
+        cycles = []
+        closing = set()
+        # 0: not visited, 1: in the current path, 2: done
+        state = {}
+        for root in graph:
+            if state.get(root):
+                continue
+
+            path = [root]
+            stack = [iter(graph[root])]
+            state[root] = 1
+            while stack:
+                target = next(stack[-1], None)
+                if target is None:
+                    state[path.pop()] = 2
+                    stack.pop()
+                elif state.get(target) == 1:
+                    cycles.append(path[path.index(target) :])
+                    closing.add((path[-1], target))
+                elif not state.get(target):
+                    state[target] = 1
+                    path.append(target)
+                    stack.append(iter(graph.get(target, ())))
+
+        return cycles, closing
+
+    def __unlink(self, source_id):
+        for edges in self.__triggers.pop(source_id, {}).values():
+            for target_id, _ in edges:
+                sources = self.__sources.get(target_id)
+                if sources is not None:
+                    sources.pop(source_id, None)
+                    if not sources:
+                        del self.__sources[target_id]
+
+    def __compile(self, source_id):
+        compiled = {}
+        for trigger, edges in self.__triggers.get(source_id, {}).items():
+            resolved = []
+            for target_id, action in edges:
+                target = self._model.get(target_id)
+                if (
+                    target is not None
+                    and (source_id, target_id) not in self.__broken
+                ):
+                    resolved.append((weakref.ref(target), action))
+
+            if resolved:
+                compiled[trigger] = tuple(resolved)
+
+        # Replaced, not modified, `fire` can be called from any thread
+        if compiled:
+            self.__compiled[source_id] = compiled
+        else:
+            self.__compiled.pop(source_id, None)
@@ -36,6 +36,7 @@ from PyQt5.QtWidgets import (
     QFrame,
     QHBoxLayout,
     QSizePolicy,
+    QProgressBar,
 )
 
 from lisp.command.layout import LayoutAutoInsertCuesCommand
@@ -180,7 +181,8 @@ class MainWindow(QMainWindow, metaclass=QSingleton):
         logging.getLogger().addHandler(self.logHandler)
 
         # Status bar
-        self.statusBar().addPermanentWidget(MainStatusBar(self), 1)
+        self.mainStatusBar = MainStatusBar(self)
+        self.statusBar().addPermanentWidget(self.mainStatusBar, 1)
 
         # Set component text
         self.retranslateUi()
@@ -270,6 +272,26 @@ class MainWindow(QMainWindow, metaclass=QSingleton):
             category or QT_TRANSLATE_NOOP("CueCategory", "Misc cues"),
         )
 
+    def updateLoadingProgress(self, loaded, total):
+        """Show the session loading progress, when total is 0 is unknown.
+
+        Saving is disabled until the progress is hidden, the session is
+        still incomplete.
+        """
+        progress = self.mainStatusBar.loadingProgress
+        progress.setRange(0, total)
+        progress.setValue(loaded)
+        progress.show()
+
+        self.saveSessionAction.setEnabled(False)
+        self.saveSessionWithName.setEnabled(False)
+
+    def hideLoadingProgress(self):
+        self.mainStatusBar.loadingProgress.hide()
+
+        self.saveSessionAction.setEnabled(True)
+        self.saveSessionWithName.setEnabled(True)
+
     def updateWindowTitle(self):
         tile = self._title + " - " + self._app.session.name()
         if not self._app.commands_stack.is_saved():
@@ -370,6 +392,9 @@ class MainWindow(QMainWindow, metaclass=QSingleton):
         self._app.session.layout.select_all(cue_type=MediaCue)
 
     def __saveSession(self):
+        if not self.saveSessionAction.isEnabled():
+            return False
+
         if self._app.session.session_file:
             self.save_session.emit(self._app.session.session_file)
             return True
@@ -377,6 +402,9 @@ class MainWindow(QMainWindow, metaclass=QSingleton):
             return self.__saveWithName()
 
     def __saveWithName(self):
+        if not self.saveSessionWithName.isEnabled():
+            return False
+
         path = self.getSaveSessionFile()
 
         if path is not None:
@@ -435,6 +463,14 @@ class MainStatusBar(QWidget):
         self.clock = DigitalLabelClock(parent=self)
         self.clock.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
         self.addWidget(self.clock)
+        # Session loading progress, visible only while loading
+        self.loadingProgress = QProgressBar(parent=self)
+        self.loadingProgress.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        self.loadingProgress.setFormat(
+            translate("MainWindow", "Loading cues %v/%m")
+        )
+        self.loadingProgress.hide()
+        self.addWidget(self.loadingProgress)
         # ---------
         self.addDivider()
         # Logging Messages
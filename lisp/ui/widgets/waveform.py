@@ -5,6 +5,7 @@ from PyQt5.QtGui import QPainter, QPen, QColor, QBrush
 from PyQt5.QtWidgets import QWidget
 
 from lisp.backend.waveform import Waveform
+from lisp.core.executor import TaskPriority
 from lisp.core.signal import Connection
 from lisp.core.util import strtime
 from lisp.ui.widgets.dynamicfontsize import DynamicFontSizeMixin
@@ -18,6 +19,8 @@ class WaveformWidget(QWidget):
         self._valueToPx = 0
         self._value = 0
         self._lastDrawnValue = 0
+        # (width, peak_samples, rms_samples) for the current size
+        self._samples = None
 
         self.backgroundColor = QColor(32, 32, 32)
         self.backgroundRadius = 6
@@ -32,14 +35,25 @@ class WaveformWidget(QWidget):
         self._waveform.load_waveform()
 
     def _ready(self):
+        self._samples = None
         self.setMaximum(self._waveform.duration)
         self.update()
 
+    def _resampled(self):
+        """Return the peak and rms values, one for each pixel."""
+        width = self.width()
+        if self._samples is None or self._samples[0] != width:
+            peak, rms = self._waveform.samples(width, 0, self._maximum)
+            self._samples = (width, peak.tolist(), rms.tolist())
+
+        return self._samples[1], self._samples[2]
+
     def maximum(self):
         return self._maximum
 
     def setMaximum(self, maximum):
         self._maximum = maximum
+        self._samples = None
         self._valueToPx = self._maximum / self.width()
         self.update()
 
@@ -67,6 +81,11 @@ class WaveformWidget(QWidget):
                 # Repaint only the changed area
                 self.update(x - 1, 0, width + 2, self.height())
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Visible waveforms are loaded first
+        self._waveform.load_waveform(priority=TaskPriority.High)
+
     def resizeEvent(self, event):
         self._valueToPx = self._maximum / self.width()
 
@@ -88,22 +107,17 @@ class WaveformWidget(QWidget):
         painter.setPen(pen)
 
         if self._valueToPx and self._waveform.is_ready():
-            peakSamples = self._waveform.peak_samples
-            rmsSamples = self._waveform.rms_samples
-            samplesToPx = len(peakSamples) / self.width()
+            peakSamples, rmsSamples = self._resampled()
             elapsedWidth = floor(self._value / self._valueToPx)
 
             peakElapsedLines = []
             peakRemainsLines = []
             rmsElapsedLines = []
             rmsRemainsLines = []
-            for x in range(event.rect().x(), event.rect().right() + 1):
-                # Calculate re-sample interval
-                s0 = floor(x * samplesToPx)
-                s1 = ceil(x * samplesToPx + samplesToPx)
-                # Re-sample the values
-                peak = max(peakSamples[s0:s1]) * halfHeight
-                rms = (sum(rmsSamples[s0:s1]) / samplesToPx) * halfHeight
+            right = min(event.rect().right() + 1, len(peakSamples))
+            for x in range(event.rect().x(), right):
+                peak = peakSamples[x] * halfHeight
+                rms = rmsSamples[x] * halfHeight
 
                 # Create lines to draw
                 peakLine = QLineF(x, halfHeight + peak, x, halfHeight - peak)
@@ -0,0 +1,48 @@
+"""Helpers shared by the benchmark scripts.
+
+The scripts are run directly (python scripts/benchmarks/<name>.py), so this
+module is imported from the scripts directory, as `benchutils`.
+"""
+
+import os
+import statistics
+import wave
+
+
+def silent_wav(path, seconds=5):
+    """Write a silent, 16bit stereo @ 44100Hz, WAV file."""
+    with wave.open(path, "wb") as file:
+        file.setnchannels(2)
+        file.setsampwidth(2)
+        file.setframerate(44100)
+        file.writeframes(b"\0" * 4 * 44100 * seconds)
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p / 100))]
+
+
+def report(label, values, percentiles=(50, 90, 99), precision=2, width=16):
+    """Print the percentiles, max and mean of the given durations (seconds).
+
+    The values are reported in milliseconds.
+    """
+    ms = [v * 1000 for v in values]
+    stats = [(f"p{p}", percentile(ms, p)) for p in percentiles]
+    stats += [("max", max(ms)), ("mean", statistics.mean(ms))]
+
+    print(
+        f"{label:<{width}} "
+        + "  ".join(
+            f"{name}: {value:>7.{precision}f}ms" for name, value in stats
+        )
+    )
+
+
+def resident_memory():
+    """Resident memory of the current process in MiB."""
+    with open("/proc/self/statm", "r") as file:
+        pages = int(file.read().split()[1])
+
+    return pages * os.sysconf("SC_PAGE_SIZE") / 1048576
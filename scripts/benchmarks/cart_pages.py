@@ -0,0 +1,157 @@
+"""Measure memory and page-switch latency of the cart-layout pages.
+
+Each mode runs in a separate process:
+  eager: the widgets of every page are created after the cues are added
+         (as when all the pages were populated up front)
+  lazy:  the widgets are created when a page is first shown (default)
+
+In both modes, after the load, every page is shown once ("first switch"),
+then a second time ("next switch"), the resident memory is sampled after
+the load and after all the pages have been shown.
+Before each switch the application is left idle, so that the pages next to
+the current one can be built in the background.
+
+Usage: python scripts/benchmarks/cart_pages.py [--pages 40] [--rows 6]
+           [--columns 8]
+
+Runs offscreen, unless QT_QPA_PLATFORM is set.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from benchutils import resident_memory
+
+
+def idle(app, layout):
+    """Process the events until the adjacent pages are built."""
+    app.processEvents()
+    while layout._prebuild_timer.isActive():
+        app.processEvents()
+
+
+def switch_pages(app, layout, pages):
+    """Show every page, return the latency (seconds) of each switch."""
+    latencies = []
+    for page in range(pages):
+        # Start from a different page, so the switch is always performed
+        layout.set_current_page((page + 1) % pages)
+        idle(app, layout)
+
+        start = time.perf_counter()
+        layout.set_current_page(page)
+        app.processEvents()
+        latencies.append(time.perf_counter() - start)
+
+    return latencies
+
+
+def run(args):
+    from PyQt5.QtWidgets import QApplication, QMenu
+
+    qt_app = QApplication([])
+
+    from lisp.core.configuration import DummyConfiguration
+    from lisp.cues.cue import Cue
+    from lisp.cues.cue_model import CueModel
+    from lisp.plugins.cart_layout.layout import CartLayout
+    from lisp.ui.icons import IconTheme
+
+    IconTheme.set_theme_name("Numix")
+
+    default = Path(__file__).resolve().parents[2] / Path(
+        "lisp/plugins/cart_layout/default.json"
+    )
+    with open(default, "r") as file:
+        config = json.load(file)
+    config["grid"] = {"rows": args.rows, "columns": args.columns}
+    CartLayout.Config = DummyConfiguration(config)
+
+    app = SimpleNamespace(
+        cue_model=CueModel(), window=SimpleNamespace(menuLayout=QMenu())
+    )
+    layout = CartLayout(app)
+    layout.view.resize(1280, 800)
+    layout.view.show()
+    qt_app.processEvents()
+
+    memory = resident_memory()
+    start = time.perf_counter()
+    for n in range(args.pages * args.rows * args.columns):
+        cue = Cue(None)
+        cue.name = f"Cue number {n}"
+        cue.duration = 60000
+        app.cue_model.add(cue)
+    if args.mode == "eager":
+        layout._populate_pages()
+    qt_app.processEvents()
+    load = time.perf_counter() - start
+    # Let the delayed population, and the background build, run
+    time.sleep(CartLayout.PopulateDelay / 1000)
+    idle(qt_app, layout)
+    loaded = resident_memory() - memory
+
+    first = switch_pages(qt_app, layout, args.pages)
+    after = switch_pages(qt_app, layout, args.pages)
+    shown = resident_memory() - memory
+
+    widgets = sum(1 for _ in layout._widgets())
+    print(
+        f"{args.mode:<6} load: {load:>6.2f}s  memory: {loaded:>7.1f}MiB "
+        f"(all shown: {shown:.1f}MiB, {widgets:,} widgets)\n"
+        f"{'':<6} first switch: {statistics.mean(first) * 1000:>7.2f}ms "
+        f"(max {max(first) * 1000:.2f}ms)  "
+        f"next switch: {statistics.mean(after) * 1000:>7.2f}ms "
+        f"(max {max(after) * 1000:.2f}ms)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=40)
+    parser.add_argument("--rows", type=int, default=6)
+    parser.add_argument("--columns", type=int, default=8)
+    parser.add_argument("--mode", choices=("eager", "lazy"))
+    args = parser.parse_args()
+
+    if args.mode is not None:
+        run(args)
+        return
+
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    print(
+        f"{args.pages} pages of {args.rows}x{args.columns} cues "
+        f"({args.pages * args.rows * args.columns:,} cues)"
+    )
+    for mode in ("eager", "lazy"):
+        subprocess.run(
+            [
+                sys.executable,
+                __file__,
+                "--mode",
+                mode,
+                "--pages",
+                str(args.pages),
+                "--rows",
+                str(args.rows),
+                "--columns",
+                str(args.columns),
+            ],
+            env=env,
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
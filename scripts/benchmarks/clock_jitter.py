@@ -0,0 +1,94 @@
+"""Measure the tick-interval jitter of the clocks.
+
+Ticks are collected at 10, 33 and 100 milliseconds for the given time,
+the difference between each interval and the nominal one is reported
+as percentiles (in milliseconds).
+
+Usage: python scripts/benchmarks/clock_jitter.py [--seconds N] [--qtimer]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from benchutils import percentile
+
+from lisp.core.clock import Clock
+
+INTERVALS = (10, 33, 100)
+PERCENTILES = (50, 90, 99, 100)
+
+
+def report(name, ticks):
+    print(name)
+    header = " ".join(f"{'p' + str(p):>8}" for p in PERCENTILES)
+    print(f"{'interval':>10} {'ticks':>6} {header}")
+    for interval, stamps in ticks.items():
+        errors = [
+            abs((b - a) * 1000 - interval) for a, b in zip(stamps, stamps[1:])
+        ]
+        values = " ".join(f"{percentile(errors, p):>8.3f}" for p in PERCENTILES)
+        print(f"{interval:>10} {len(stamps):>6} {values}")
+
+
+def collector(stamps):
+    def tick():
+        stamps.append(time.monotonic())
+
+    return tick
+
+
+def measure_clock(seconds):
+    ticks = {interval: [] for interval in INTERVALS}
+    clocks = []
+    for interval, stamps in ticks.items():
+        clock = Clock(interval)
+        callback = collector(stamps)
+        clock.add_callback(callback)
+        clocks.append((clock, callback))
+
+    time.sleep(seconds)
+
+    for clock, callback in clocks:
+        clock.remove_callback(callback)
+
+    return ticks
+
+
+def measure_qtimer(seconds):
+    from PyQt5.QtCore import QCoreApplication, QTimer
+
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)
+    ticks = {interval: [] for interval in INTERVALS}
+    timers = []
+    for interval, stamps in ticks.items():
+        timer = QTimer()
+        timer.setInterval(interval)
+        timer.timeout.connect(collector(stamps))
+        timer.start()
+        timers.append(timer)
+
+    QTimer.singleShot(int(seconds * 1000), app.quit)
+    app.exec()
+
+    return ticks
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument(
+        "--qtimer", action="store_true", help="also measure plain QTimer(s)"
+    )
+    args = parser.parse_args()
+
+    report("MasterClock (jitter, ms)", measure_clock(args.seconds))
+    if args.qtimer:
+        report("QTimer (jitter, ms)", measure_qtimer(args.seconds))
+
+
+if __name__ == "__main__":
+    main()
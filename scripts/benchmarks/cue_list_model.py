@@ -0,0 +1,122 @@
+"""Measure CueListModel insert, move and remove at different positions.
+
+Every operation is measured at the front, middle and end of the list, then
+all the cues indices are read once (as the view does), the number of "index"
+change notifications received by the cues is reported.
+
+The "eager" model is a reference, writing the index of every shifted cue.
+
+Usage: python scripts/benchmarks/cue_list_model.py [--cues N] [--ops N]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from lisp.cues.cue import Cue
+from lisp.cues.cue_model import CueModel
+from lisp.plugins.list_layout.models import CueListModel
+
+
+class EagerCueListModel(CueListModel):
+    """Write the cues index on every change, as a plain list would need."""
+
+    def move(self, old_index, new_index):
+        super().move(old_index, new_index)
+        self._write_indices(min(old_index, new_index))
+
+    def _item_added(self, item):
+        super()._item_added(item)
+        Cue.index.set_provider(item, None)
+        self._write_indices(item.index)
+
+    def _item_removed(self, item):
+        Cue.index.set_provider(item, self.index_of)
+        super()._item_removed(item)
+        self._write_indices(item.index)
+
+    def _write_indices(self, start):
+        for index in range(start, len(self)):
+            cue = self.item(index)
+            Cue.index.set_provider(cue, None)
+            cue.index = index
+
+
+class Notifications:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, *args):
+        self.count += 1
+
+
+def build(model_class, cues):
+    cue_model = CueModel()
+    list_model = model_class(cue_model)
+    notifications = Notifications()
+
+    for _ in range(cues):
+        cue = Cue(None)
+        cue.changed("index").connect(notifications)
+        cue_model.add(cue)
+
+    notifications.count = 0
+    return cue_model, list_model, notifications
+
+
+def position(where, length):
+    return {"front": 0, "middle": length // 2, "end": length - 1}[where]
+
+
+def run(cue_model, list_model, operation, where, ops):
+    cues = [Cue(None) for _ in range(ops)]
+
+    start = time.perf_counter()
+    for n in range(ops):
+        index = position(where, len(list_model))
+        if operation == "insert":
+            list_model.insert(cues[n], index)
+        elif operation == "move":
+            list_model.move(index, position("middle", len(list_model)))
+        else:
+            list_model.pop(index)
+    elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    indices = [cue.index for cue in list_model]
+    read = time.perf_counter() - start
+    assert indices == list(range(len(list_model)))
+
+    return elapsed / ops, read
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cues", type=int, default=10000)
+    parser.add_argument("--ops", type=int, default=100)
+    args = parser.parse_args()
+
+    print(f"{args.cues:,} cues, {args.ops} operations")
+    for model_class in (EagerCueListModel, CueListModel):
+        print(model_class.__name__)
+
+        for operation in ("insert", "move", "remove"):
+            for where in ("front", "middle", "end"):
+                cue_model, list_model, notifications = build(
+                    model_class, args.cues
+                )
+                per_op, read = run(
+                    cue_model, list_model, operation, where, args.ops
+                )
+                print(
+                    f"  {operation:<7}{where:<7}{per_op * 1e6:>10,.1f} us/op"
+                    f"  read: {read * 1e3:>7,.2f} ms"
+                    f"  notifications: {notifications.count:>10,}"
+                )
+
+
+if __name__ == "__main__":
+    main()
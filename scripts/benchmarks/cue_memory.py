@@ -0,0 +1,58 @@
+"""Measure memory per cue and property read throughput.
+
+Usage: python scripts/benchmarks/cue_memory.py [--cues N]
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from lisp.cues.cue import Cue
+
+READ_PROPERTIES = ("duration", "fadein_duration", "fadeout_duration", "name")
+
+
+def bench_memory(count):
+    gc.collect()
+    tracemalloc.start()
+    cues = [Cue(None) for _ in range(count)]
+    # Touch all the properties, as a loaded session would do
+    for cue in cues:
+        cue.properties()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return cues, size / count
+
+
+def bench_reads(cues):
+    start = time.perf_counter()
+    for cue in cues:
+        for _ in range(10):
+            cue.duration
+            cue.fadein_duration
+            cue.fadeout_duration
+            cue.name
+    elapsed = time.perf_counter() - start
+
+    return len(cues) * 10 * len(READ_PROPERTIES) / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cues", type=int, default=10_000)
+    args = parser.parse_args()
+
+    cues, per_cue = bench_memory(args.cues)
+    print(f"cues:          {args.cues:>12,}")
+    print(f"memory/cue:    {per_cue:>12,.0f} bytes")
+    print(f"reads:         {bench_reads(cues):>12,.0f} /s")
+
+
+if __name__ == "__main__":
+    main()
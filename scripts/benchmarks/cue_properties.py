@@ -0,0 +1,49 @@
+"""Measure cue property assignment and `update_properties` throughput.
+
+Usage: python scripts/benchmarks/cue_properties.py [--cues N]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from lisp.cues.cue import Cue
+
+
+def bench_assignment(cues):
+    start = time.perf_counter()
+    for n, cue in enumerate(cues):
+        cue.name = f"Cue {n}"
+        cue.index = n
+        cue.duration = n * 1000
+        cue.pre_wait = 0.5
+        cue.post_wait = 1.5
+    return len(cues) * 5 / (time.perf_counter() - start)
+
+
+def bench_update(cues, properties):
+    start = time.perf_counter()
+    for cue in cues:
+        cue.update_properties(properties)
+    return len(cues) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cues", type=int, default=3000)
+    args = parser.parse_args()
+
+    cues = [Cue(None) for _ in range(args.cues)]
+    properties = cues[0].properties()
+    properties.pop("id")
+
+    print(f"assignments:       {bench_assignment(cues):>12,.0f} /s")
+    print(f"update_properties: {bench_update(cues, properties):>12,.0f} /s")
+    print(f"  ({len(properties)} properties per update)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Measure CPU usage and end-time accuracy of concurrent fades.
+
+The shared FadeEngine is compared with the previous implementation,
+where each fade runs its own 10ms loop.
+
+Usage: python scripts/benchmarks/fade_engine.py [--duration SECONDS]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from threading import Event, Thread
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from lisp.core.fade_functions import FadeInType, ntime
+from lisp.core.fader import Fader
+
+
+class Target:
+    def __init__(self):
+        self.value = 0.0
+
+
+class LoopFader:
+    """The fader implementation preceding the FadeEngine."""
+
+    def __init__(self, target, attribute):
+        self._target = target
+        self._attribute = attribute
+        self._running = Event()
+
+    def prepare(self):
+        pass
+
+    def fade(self, duration, to_value, fade_type):
+        time_ = 0
+        functor = fade_type.value
+        duration = int(duration * 100)
+        base_value = getattr(self._target, self._attribute)
+        value_diff = to_value - base_value
+
+        while time_ <= duration and not self._running.is_set():
+            setattr(
+                self._target,
+                self._attribute,
+                round(
+                    functor(ntime(time_, 0, duration), value_diff, base_value),
+                    6,
+                ),
+            )
+            time_ += 1
+            self._running.wait(0.01)
+
+        return True
+
+
+def run(fader_class, fades, duration):
+    errors = []
+
+    def fade(fader):
+        fader.prepare()
+        start = time.monotonic()
+        fader.fade(duration, 1, FadeInType.Quadratic)
+        errors.append(time.monotonic() - start - duration)
+
+    threads = [
+        Thread(target=fade, args=(fader_class(Target(), "value"),))
+        for _ in range(fades)
+    ]
+
+    cpu = time.process_time()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    cpu = time.process_time() - cpu
+
+    return cpu / duration * 100, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--duration", type=float, default=2)
+    args = parser.parse_args()
+
+    print(
+        f"{'fader':>10} {'fades':>6} {'cpu %':>8} "
+        f"{'end err mean (ms)':>18} {'end err max (ms)':>17}"
+    )
+    for fades in (1, 10, 100):
+        for name, fader_class in (("loop", LoopFader), ("engine", Fader)):
+            cpu, errors = run(fader_class, fades, args.duration)
+            mean = statistics.mean(errors) * 1000
+            worst = max(errors, key=abs) * 1000
+            print(
+                f"{name:>10} {fades:>6} {cpu:>8.1f} {mean:>18.2f} {worst:>17.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
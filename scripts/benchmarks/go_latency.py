@@ -0,0 +1,99 @@
+"""Measure the GO latency of GstMedia, with and without arming (pre-roll).
+
+For every run the media is stopped, (optionally) armed, then played:
+  play:   time spent by the `play()` call
+  output: time from `play()` to the playback position advancing, i.e.
+          the first buffer being rendered by the sink
+
+Usage: python scripts/benchmarks/go_latency.py [--runs N]
+           [--pipe UriInput,Volume,DbMeter,AutoSink] [--uri URI]
+
+Requires GStreamer (PyGObject).
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from benchutils import report, silent_wav
+
+
+def wait_output(media, timeout=2):
+    """Wait for the position to advance, return the time it happened."""
+    start_position = media.current_time()
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        if media.current_time() > start_position:
+            break
+
+        time.sleep(0.0005)
+
+    return time.perf_counter()
+
+
+def measure(media, runs, armed):
+    play_times = []
+    output_times = []
+
+    for _ in range(runs):
+        media.stop()
+        if armed:
+            media.arm()
+
+        start = time.perf_counter()
+        media.play()
+        played = time.perf_counter()
+        output = wait_output(media)
+
+        play_times.append(played - start)
+        output_times.append(output - start)
+
+    media.stop()
+    return play_times, output_times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--pipe", default="UriInput,Volume,DbMeter,AutoSink")
+    parser.add_argument("--uri", default="")
+    args = parser.parse_args()
+
+    from lisp.plugins.gst_backend import elements
+    from lisp.plugins.gst_backend.gi_repository import Gst
+    from lisp.plugins.gst_backend.gst_media import GstMedia
+
+    Gst.init(None)
+    elements.load()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        uri = args.uri
+        if not uri:
+            path = os.path.join(tmp, "silence.wav")
+            silent_wav(path)
+            uri = Path(path).as_uri()
+
+        media = GstMedia()
+        media.update_properties(
+            {
+                "pipe": args.pipe.split(","),
+                "elements": {"UriInput": {"uri": uri}},
+            }
+        )
+
+        for armed in (False, True):
+            play_times, output_times = measure(media, args.runs, armed)
+
+            print(f"{'armed' if armed else 'not armed'} ({args.runs} runs)")
+            report("  play()", play_times)
+            report("  first buffer", output_times)
+            print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Measure resident memory and open file-descriptors of GstMedia pipelines.
+
+Each mode runs in a separate process:
+  eager: pipelines are built as soon as the media is created (default)
+  lazy:  pipelines are built on-demand, under a pipeline-count budget
+
+Usage: python scripts/benchmarks/gst_lazy_pipelines.py [--cues N]
+           [--pipe UriInput,Volume,DbMeter,AutoSink] [--prepare N]
+           [--max-pipelines N] [--uri URI]
+
+Requires GStreamer (PyGObject).
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from benchutils import resident_memory, silent_wav
+
+
+def open_fds():
+    return len(os.listdir("/proc/self/fd"))
+
+
+def sample(label):
+    print(
+        f"{label:<12} rss: {resident_memory():>9,.1f} MiB  fds: {open_fds():>6,}"
+    )
+
+
+def run(args):
+    from lisp.plugins.gst_backend import elements
+    from lisp.plugins.gst_backend.gi_repository import Gst
+    from lisp.plugins.gst_backend.gst_media import GstMedia
+    from lisp.plugins.gst_backend.gst_pipeline_budget import PipelineBudget
+
+    Gst.init(None)
+    elements.load()
+
+    PipelineBudget.configure(
+        lazy=args.mode == "lazy", max_pipelines=args.max_pipelines
+    )
+    pipe = args.pipe.split(",")
+
+    print(f"mode: {args.mode}")
+    sample("start")
+
+    start = time.perf_counter()
+    media = []
+    for _ in range(args.cues):
+        m = GstMedia()
+        m.update_properties(
+            {
+                "pipe": pipe,
+                "elements": {"UriInput": {"uri": args.uri, "duration": 1000}},
+            }
+        )
+        media.append(m)
+    elapsed = time.perf_counter() - start
+
+    sample("created")
+    print(f"{'':<12} {args.cues:,} media in {elapsed:.2f}s")
+
+    start = time.perf_counter()
+    for m in media[: args.prepare]:
+        m.prepare()
+    elapsed = time.perf_counter() - start
+
+    sample("prepared")
+    print(
+        f"{'':<12} {min(args.prepare, args.cues):,} prepared in "
+        f"{elapsed:.2f}s, built: {PipelineBudget.count() or 'n/a'}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cues", type=int, default=2000)
+    parser.add_argument("--pipe", default="UriInput,Volume,DbMeter,AutoSink")
+    parser.add_argument("--prepare", type=int, default=100)
+    parser.add_argument("--max-pipelines", type=int, default=64)
+    parser.add_argument("--uri", default="")
+    parser.add_argument("--mode", choices=("eager", "lazy"))
+    args = parser.parse_args()
+
+    if args.mode is not None:
+        run(args)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        uri = args.uri
+        if not uri:
+            path = os.path.join(tmp, "silence.wav")
+            silent_wav(path, seconds=1)
+            uri = Path(path).as_uri()
+
+        for mode in ("eager", "lazy"):
+            subprocess.run(
+                [
+                    sys.executable,
+                    __file__,
+                    "--mode",
+                    mode,
+                    "--uri",
+                    uri,
+                    "--cues",
+                    str(args.cues),
+                    "--pipe",
+                    args.pipe,
+                    "--prepare",
+                    str(args.prepare),
+                    "--max-pipelines",
+                    str(args.max_pipelines),
+                ],
+                check=True,
+            )
+            print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Measure load, scroll and memory of the list-layout cue view.
+
+For each size, in a separate process, cues are added to the model while the
+view is shown, then the view is scrolled page by page, from the top to the
+bottom, and the time updates of all the cues are delivered in a single
+batch (as the CueTime broadcaster does), the resident memory is sampled
+before and after the load.
+
+Usage: python scripts/benchmarks/list_view.py [--cues 1000,5000,10000]
+           [--width 1280] [--height 800]
+
+Runs offscreen, unless QT_QPA_PLATFORM is set.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from benchutils import resident_memory
+
+
+def run(args):
+    from PyQt5.QtWidgets import QApplication
+
+    app = QApplication([])
+
+    from lisp.cues.cue import Cue
+    from lisp.cues.cue_model import CueModel
+    from lisp.cues.cue_time import CueTime
+    from lisp.plugins.list_layout.list_view import CueListView
+    from lisp.plugins.list_layout.models import CueListModel
+
+    cue_model = CueModel()
+    list_model = CueListModel(cue_model)
+    view = CueListView(list_model)
+    view.resize(args.width, args.height)
+    view.show()
+    app.processEvents()
+
+    cues = []
+    for n in range(args.cues):
+        cue = Cue(None)
+        cue.name = f"Cue number {n}"
+        cue.duration = 60000
+        cues.append(cue)
+
+    memory = resident_memory()
+    start = time.perf_counter()
+    for cue in cues:
+        cue_model.add(cue)
+    app.processEvents()
+    load = time.perf_counter() - start
+    memory = resident_memory() - memory
+
+    scrollbar = view.verticalScrollBar()
+    page = max(scrollbar.pageStep(), 1)
+    pages = 0
+    start = time.perf_counter()
+    for value in range(0, scrollbar.maximum() + 1, page):
+        scrollbar.setValue(value)
+        view.viewport().repaint()
+        pages += 1
+    scroll = (time.perf_counter() - start) / pages
+
+    changes = []
+    view.model().dataChanged.connect(lambda *_: changes.append(None))
+    start = time.perf_counter()
+    CueTime._Broadcaster.updated.emit({cue.id: 1000 for cue in cues})
+    view.viewport().repaint()
+    batch = time.perf_counter() - start
+
+    print(
+        f"{args.cues:>8,} cues  load: {load:>7.2f}s  "
+        f"scroll: {scroll * 1000:>6.2f}ms/page ({pages:,} pages)  "
+        f"time batch: {batch * 1000:>6.2f}ms ({len(changes)} updates)  "
+        f"memory: {memory:>7.1f}MiB"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cues", default="1000,5000,10000")
+    parser.add_argument("--width", type=int, default=1280)
+    parser.add_argument("--height", type=int, default=800)
+    parser.add_argument("--run", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        args.cues = int(args.cues)
+        run(args)
+        return
+
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    for cues in args.cues.split(","):
+        subprocess.run(
+            [
+                sys.executable,
+                __file__,
+                "--run",
+                "--cues",
+                cues,
+                "--width",
+                str(args.width),
+                "--height",
+                str(args.height),
+            ],
+            env=env,
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Compare Signal.emit throughput against the previous (locked) engine.
+
+Usage: python scripts/benchmarks/signal_emit.py [--emits N]
+"""
+
+import argparse
+import sys
+import timeit
+import traceback
+from pathlib import Path
+from threading import RLock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from lisp.core.signal import Signal, Slot, slot_id
+
+
+class LockedSlot:
+    """The slot implementation preceding the lock-free emit path."""
+
+    def __init__(self, slot_callable):
+        self._slot = Slot(slot_callable)
+        self._reference = self._slot._reference
+        self._no_args = self._slot._no_args
+
+    def call(self, *args, **kwargs):
+        try:
+            if self.is_alive():
+                if self._no_args:
+                    self._reference()()
+                else:
+                    self._reference()(*args, **kwargs)
+        except Exception:
+            pass
+
+    def is_alive(self):
+        return self._reference() is not None
+
+
+class LockedSignal:
+    """The signal implementation preceding the lock-free emit path."""
+
+    def __init__(self):
+        self.__slots = {}
+        self.__lock = RLock()
+
+    def connect(self, slot_callable):
+        with self.__lock:
+            sid = slot_id(slot_callable)
+            if sid not in self.__slots:
+                self.__slots[sid] = LockedSlot(slot_callable)
+
+    def emit(self, *args, **kwargs):
+        with self.__lock:
+            for slot in self.__slots.values():
+                try:
+                    slot.call(*args, **kwargs)
+                except Exception:
+                    traceback.print_exc()
+
+
+class Receiver:
+    def receive(self, *args):
+        pass
+
+
+def bench(signal_class, slots, emits):
+    signal = signal_class()
+    receivers = [Receiver() for _ in range(slots)]
+    for receiver in receivers:
+        signal.connect(receiver.receive)
+
+    elapsed = min(
+        timeit.repeat(
+            lambda: signal.emit(receivers, "name", 1.0), number=emits, repeat=5
+        )
+    )
+    return emits / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--emits", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(
+        f"{'slots':>5} {'locked (emit/s)':>16} {'lock-free':>16} {'ratio':>6}"
+    )
+    for slots in (0, 1, 5, 50):
+        emits = max(args.emits // max(slots, 1), 1000)
+        old = bench(LockedSignal, slots, emits)
+        new = bench(Signal, slots, emits)
+        print(f"{slots:>5} {old:>16,.0f} {new:>16,.0f} {new / old:>6.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""Measure the start skew of media started together, with and without sync.
+
+N media, with a fakesink as output, are stopped and then played at once,
+each from its own thread (as the cues started by a group):
+  execute:      every media is played as usual
+  synchronized: the media are first synchronized (`synchronize_start`)
+
+For every run, the skew is the spread of the first buffer times, across the
+media, taken from the fakesink(s):
+  timestamp: base-time + running-time of the buffer, when it should render
+  rendered:  clock time when the buffer has been rendered (handoff)
+
+Usage: python scripts/benchmarks/sync_start.py [--cues 10] [--runs 20]
+           [--uri URI]
+
+Requires GStreamer (PyGObject).
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from benchutils import report, silent_wav
+
+
+def fake_sink_element():
+    from lisp.backend.media_element import ElementType, MediaType
+    from lisp.plugins.gst_backend.gi_repository import Gst
+    from lisp.plugins.gst_backend.gst_element import GstMediaElement
+
+    class FakeSink(GstMediaElement):
+        """Record the first buffer rendered after `reset`."""
+
+        ElementType = ElementType.Output
+        MediaType = MediaType.Audio
+        Name = "Fake Sink"
+
+        def __init__(self, pipeline):
+            super().__init__(pipeline)
+
+            self.fake_sink = Gst.ElementFactory.make("fakesink", "sink")
+            self.fake_sink.set_property("sync", True)
+            self.fake_sink.set_property("signal-handoffs", True)
+            self.fake_sink.connect("handoff", self.__handoff)
+            self.pipeline.add(self.fake_sink)
+
+            self.clock = Gst.SystemClock.obtain()
+            self.first = None
+            self.received = threading.Event()
+
+        def sink(self):
+            return self.fake_sink
+
+        def reset(self):
+            self.first = None
+            self.received.clear()
+
+        def __handoff(self, sink, buffer, pad):
+            if self.first is None:
+                # The media are started at 0, running-time == pts
+                self.first = (
+                    sink.get_base_time() + buffer.pts,
+                    self.clock.get_time(),
+                )
+                self.received.set()
+
+    return FakeSink
+
+
+def spread(values):
+    return (max(values) - min(values)) / 1e9
+
+
+def measure(medias, runs, synchronized):
+    from lisp.plugins.gst_backend.gst_sync import synchronize_start
+
+    timestamps = []
+    rendered = []
+
+    for _ in range(runs):
+        sinks = []
+        for media in medias:
+            media.stop()
+            sink = media.element("FakeSink")
+            sink.reset()
+            sinks.append(sink)
+
+        if synchronized:
+            synchronize_start(medias)
+
+        threads = [threading.Thread(target=media.play) for media in medias]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        if all(sink.received.wait(2) for sink in sinks):
+            timestamps.append(spread([sink.first[0] for sink in sinks]))
+            rendered.append(spread([sink.first[1] for sink in sinks]))
+
+    for media in medias:
+        media.stop()
+
+    return timestamps, rendered
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cues", type=int, default=10)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--uri", default="")
+    args = parser.parse_args()
+
+    from lisp.plugins.gst_backend import elements
+    from lisp.plugins.gst_backend.gi_repository import Gst
+    from lisp.plugins.gst_backend.gst_media import GstMedia
+
+    Gst.init(None)
+    elements.load()
+    elements.register_element(fake_sink_element())
+
+    with tempfile.TemporaryDirectory() as tmp:
+        uri = args.uri
+        if not uri:
+            path = os.path.join(tmp, "silence.wav")
+            silent_wav(path)
+            uri = Path(path).as_uri()
+
+        medias = []
+        for _ in range(args.cues):
+            media = GstMedia()
+            media.update_properties(
+                {
+                    "pipe": ["UriInput", "Volume", "FakeSink"],
+                    "elements": {"UriInput": {"uri": uri}},
+                }
+            )
+            medias.append(media)
+
+        for synchronized in (False, True):
+            timestamps, rendered = measure(medias, args.runs, synchronized)
+
+            print(
+                f"{'synchronized' if synchronized else 'execute'} "
+                f"({args.cues} media, {len(rendered)}/{args.runs} runs)"
+            )
+            if rendered:
+                report("  timestamp", timestamps, (50, 90), 3, 12)
+                report("  rendered", rendered, (50, 90), 3, 12)
+            print()
+
+
+if __name__ == "__main__":
+    main()
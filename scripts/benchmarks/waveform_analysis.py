@@ -0,0 +1,136 @@
+"""Measure the waveform analysis throughput, in seconds of audio per second.
+
+Modes:
+  reduction: only the reduction of the PCM data, on synthetic buffers
+             old:     a copy of each (10ms) buffer, reduced to one sample
+                      via `astype(int)`, `data**2` ... (previous code)
+             reducer: WaveformReducer, on 250ms buffers (current code)
+  gstreamer: GstWaveform end-to-end (decoding included) on a generated
+             WAV file, requires GStreamer (PyGObject)
+
+Usage: python scripts/benchmarks/waveform_analysis.py [--seconds 600]
+           [--channels 2] [--rate 44100] [--mode reduction|gstreamer]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import wave
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+# Milliseconds per sample (the Waveform default)
+SAMPLE_LENGTH = 10
+
+
+def old_reduction(pcm, frames_per_buffer, channels):
+    import numpy as np
+
+    peak = []
+    rms = []
+    step = frames_per_buffer * channels
+    for start in range(0, len(pcm), step):
+        buffer = pcm[start : start + step].tobytes()
+        data = np.absolute(np.frombuffer(buffer, dtype=np.int16)).astype(int)
+        peak.append(np.max(data))
+        rms.append(np.sqrt(np.mean(data**2)))
+
+    return np.divide(peak, 32768), np.divide(rms, 32768)
+
+
+def reducer_reduction(pcm, frames_per_buffer, channels, samples):
+    from lisp.backend.waveform_reducer import WaveformReducer
+
+    reducer = WaveformReducer(samples, len(pcm) // channels, channels)
+    step = frames_per_buffer * channels
+    for start in range(0, len(pcm), step):
+        reducer.add(pcm[start : start + step])
+
+    return reducer.result()
+
+
+def run_reduction(args):
+    import numpy as np
+
+    frames = args.rate * args.seconds
+    samples = args.seconds * 1000 // SAMPLE_LENGTH
+    pcm = np.random.default_rng(0).integers(
+        -32768, 32768, size=frames * args.channels, dtype=np.int16
+    )
+
+    start = time.perf_counter()
+    old_reduction(pcm, args.rate * SAMPLE_LENGTH // 1000, args.channels)
+    old = time.perf_counter() - start
+
+    start = time.perf_counter()
+    reducer_reduction(pcm, args.rate // 4, args.channels, samples)
+    new = time.perf_counter() - start
+
+    print(
+        f"reduction of {args.seconds}s, {args.channels}ch @ {args.rate}Hz\n"
+        f"  old:     {args.seconds / old:>10,.0f} s/s  ({old:.3f}s)\n"
+        f"  reducer: {args.seconds / new:>10,.0f} s/s  ({new:.3f}s)"
+    )
+
+
+def run_gstreamer(args):
+    from lisp.core.session_uri import SessionURI
+    from lisp.plugins.gst_backend.gi_repository import GLib, Gst
+    from lisp.plugins.gst_backend.gst_waveform import GstWaveform
+
+    Gst.init(None)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "noise.wav")
+        # Repeat the same second, generating random data is slow
+        second = os.urandom(2 * args.channels * args.rate)
+        with wave.open(path, "wb") as file:
+            file.setnchannels(args.channels)
+            file.setsampwidth(2)
+            file.setframerate(args.rate)
+            for _ in range(args.seconds):
+                file.writeframes(second)
+
+        waveform = GstWaveform(
+            SessionURI(Path(path).as_uri()),
+            args.seconds * 1000,
+            enable_cache=False,
+        )
+
+        loop = GLib.MainLoop()
+        waveform.ready.connect(loop.quit)
+        waveform.failed.connect(loop.quit)
+
+        start = time.perf_counter()
+        if not waveform._load_waveform():
+            loop.run()
+        elapsed = time.perf_counter() - start
+
+    print(
+        f"GstWaveform, {args.seconds}s, {args.channels}ch @ {args.rate}Hz: "
+        f"{args.seconds / elapsed:,.0f} s/s  ({elapsed:.3f}s, "
+        f"{len(waveform.peak_samples):,} samples)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=int, default=600)
+    parser.add_argument("--channels", type=int, default=2)
+    parser.add_argument("--rate", type=int, default=44100)
+    parser.add_argument(
+        "--mode", choices=("reduction", "gstreamer"), default="reduction"
+    )
+    args = parser.parse_args()
+
+    if args.mode == "reduction":
+        run_reduction(args)
+    else:
+        run_gstreamer(args)
+
+
+if __name__ == "__main__":
+    main()
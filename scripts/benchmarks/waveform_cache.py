@@ -0,0 +1,145 @@
+"""Measure load time and memory of cached waveforms, pickle vs memmap.
+
+The cache files of N waveforms are written once, in both formats, then
+each format is loaded in a separate process:
+  pickle: legacy files, (peak, rms) lists of floats rounded to 5 decimals,
+          the pyramid is built after loading
+  memmap: binary files (lisp.backend.waveform_cache), all the levels are
+          mapped from the file
+
+For both, "load" is the time to load all the files, "draw" the time to then
+get the values for a `--width` px wide widget, from each waveform, the
+resident memory is sampled after each step.
+
+Usage: python scripts/benchmarks/waveform_cache.py [--waveforms 500]
+           [--samples 24000] [--width 800]
+"""
+
+import argparse
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from benchutils import resident_memory
+
+# Milliseconds per sample (the Waveform default)
+SAMPLE_LENGTH = 10
+
+
+def write_files(directory, waveforms, samples):
+    import numpy as np
+
+    from lisp.backend import waveform_cache
+    from lisp.backend.waveform_pyramid import WaveformPyramid
+
+    rng = np.random.default_rng(0)
+    duration = samples * SAMPLE_LENGTH
+
+    for n in range(waveforms):
+        peak = rng.random(samples, dtype=np.float32)
+        rms = peak * rng.random(samples, dtype=np.float32)
+
+        with open(os.path.join(directory, f"{n}.pickle"), "wb") as file:
+            pickle.dump(
+                (np.round(peak, 5).tolist(), np.round(rms, 5).tolist()), file
+            )
+
+        waveform_cache.dump(
+            os.path.join(directory, f"{n}.waveform"),
+            WaveformPyramid(peak, rms, duration),
+        )
+
+
+def run(args):
+    from lisp.backend import waveform_cache
+    from lisp.backend.waveform_pyramid import WaveformPyramid
+
+    duration = args.samples * SAMPLE_LENGTH
+    memory = resident_memory()
+
+    start = time.perf_counter()
+    loaded = []
+    for n in range(args.waveforms):
+        if args.mode == "pickle":
+            with open(os.path.join(args.dir, f"{n}.pickle"), "rb") as file:
+                loaded.append(pickle.load(file))
+        else:
+            loaded.append(
+                waveform_cache.load(os.path.join(args.dir, f"{n}.waveform"))
+            )
+    load = time.perf_counter() - start
+    load_memory = resident_memory() - memory
+
+    start = time.perf_counter()
+    pyramids = []
+    for data in loaded:
+        if args.mode == "pickle":
+            data = WaveformPyramid(data[0], data[1], duration)
+
+        data.query(args.width)
+        pyramids.append(data)
+    draw = time.perf_counter() - start
+    draw_memory = resident_memory() - memory
+
+    print(
+        f"{args.mode:<7} load: {load * 1000:>8.1f}ms "
+        f"({load / args.waveforms * 1000:.3f}ms/file)  "
+        f"rss: {load_memory:>7.1f}MiB  |  "
+        f"draw: {draw * 1000:>8.1f}ms  rss: {draw_memory:>7.1f}MiB"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--waveforms", type=int, default=500)
+    parser.add_argument("--samples", type=int, default=24000)
+    parser.add_argument("--width", type=int, default=800)
+    parser.add_argument("--mode", choices=("pickle", "memmap"))
+    parser.add_argument("--dir", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode is not None:
+        run(args)
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        write_files(directory, args.waveforms, args.samples)
+
+        sizes = {"pickle": 0, "waveform": 0}
+        for entry in os.scandir(directory):
+            sizes[entry.name.rsplit(".", 1)[1]] += entry.stat().st_size
+
+        print(
+            f"{args.waveforms} waveforms of {args.samples:,} samples  "
+            f"(on disk, pickle: {sizes['pickle'] / 1048576:.1f}MiB, "
+            f"memmap: {sizes['waveform'] / 1048576:.1f}MiB)"
+        )
+        for mode in ("pickle", "memmap"):
+            # Both formats are read from the page-cache (just written)
+            subprocess.run(
+                [
+                    sys.executable,
+                    __file__,
+                    "--mode",
+                    mode,
+                    "--dir",
+                    directory,
+                    "--waveforms",
+                    str(args.waveforms),
+                    "--samples",
+                    str(args.samples),
+                    "--width",
+                    str(args.width),
+                ],
+                check=True,
+            )
+
+
+if __name__ == "__main__":
+    main()